@@ -0,0 +1,269 @@
+"""
+Parallel parameter optimization for the grid strategy on top of the vectorized backtester.
+
+The price history is copied once into shared memory and every worker process maps it,
+so tasks only carry parameter sets. Parameter sets are grouped by their indicator
+settings and each group is sent as one task with its own indicator cache, so
+combinations that only differ in thresholds, grid step or lot size compute the
+MACD/RSI/ADX/ATR arrays once, and a worker holds no more than one group's arrays
+however long the history is. A group larger than a worker's share of the sets is
+split, so a few big groups cannot leave the other workers idle.
+"""
+
+import itertools
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from indicators import batch
+from indicators.cache import IndicatorCache
+from indicators.inputs import column, has_columns
+
+from .vectorized import GridParams, backtest, indicator_specs
+
+_COLUMNS = ("open", "high", "low", "close")
+
+# per-worker view of the shared price history, set by _attach()
+_worker_bars = None
+_worker_memory = None
+
+
+def param_grid(base: GridParams = GridParams(), **values) -> list[GridParams]:
+    """
+    Build the Cartesian product of parameter values.
+
+    Args:
+        base (GridParams, optional): Values for the parameters not listed.
+        **values: A list of values per GridParams field, e.g. grid_step=[0.5, 1, 2].
+
+    Returns:
+        list[GridParams]: One parameter set per combination.
+
+    Raises:
+        ValueError: If a name is not a GridParams field.
+    """
+    _check_fields(values)
+    names = list(values)
+    return [
+        base._replace(**dict(zip(names, combo)))
+        for combo in itertools.product(*values.values())
+    ]
+
+
+def param_samples(
+    n: int, base: GridParams = GridParams(), seed: int | None = None, **space
+) -> list[GridParams]:
+    """
+    Draw random parameter sets for a random search.
+
+    Args:
+        n (int): Number of parameter sets.
+        base (GridParams, optional): Values for the parameters not listed.
+        seed (int | None, optional): Random seed for reproducible draws.
+        **space: Per GridParams field, a list of choices or a (low, high) range.
+            Ranges of two ints draw integers, inclusive; other ranges draw floats.
+
+    Returns:
+        list[GridParams]: The sampled parameter sets.
+
+    Raises:
+        ValueError: If a name is not a GridParams field.
+    """
+    _check_fields(space)
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for name, choices in space.items():
+        if isinstance(choices, tuple):
+            low, high = choices
+            if isinstance(low, int) and isinstance(high, int):
+                columns[name] = rng.integers(low, high + 1, n).tolist()
+            else:
+                columns[name] = rng.uniform(low, high, n).tolist()
+        else:
+            columns[name] = [choices[i] for i in rng.integers(0, len(choices), n)]
+    return [
+        base._replace(**{name: drawn[i] for name, drawn in columns.items()})
+        for i in range(n)
+    ]
+
+
+def _check_fields(values: dict) -> None:
+    unknown = sorted(set(values) - set(GridParams._fields))
+    if unknown:
+        raise ValueError(f"⚠️ Unknown strategy parameters: {unknown}")
+
+
+def summarize(result, cash: float, bars_per_year: float | None = None) -> dict:
+    """
+    Reduce a BacktestResult to the metrics used for ranking.
+
+    Args:
+        result (BacktestResult): The backtest outcome.
+        cash (float): Starting cash of the run.
+        bars_per_year (float | None, optional): Annualizes the Sharpe ratio, e.g.
+            252 for D1 bars. Default None reports the per-bar ratio.
+
+    Returns:
+        dict: pnl, return_pct, max_drawdown (fraction of the running peak), sharpe,
+        trades (closed) and win_rate.
+    """
+    equity = result.equity
+    peak = np.maximum.accumulate(equity)
+    drawdown = float(np.max((peak - equity) / peak)) if len(equity) else 0.0
+
+    returns = np.diff(equity) / equity[:-1]
+    std = returns.std() if len(returns) else 0.0
+    sharpe = float(returns.mean() / std) if std > 0 else 0.0
+    if bars_per_year:
+        sharpe *= math.sqrt(bars_per_year)
+
+    closed = result.trades[result.trades["exit_bar"] >= 0]
+    wins = int(np.count_nonzero(closed["pnl"] > 0))
+    return {
+        "pnl": result.final_value - cash,
+        "return_pct": (result.final_value / cash - 1) * 100,
+        "max_drawdown": drawdown,
+        "sharpe": sharpe,
+        "trades": len(closed),
+        "win_rate": wins / len(closed) if len(closed) else 0.0,
+    }
+
+
+def rank(results: pd.DataFrame) -> pd.DataFrame:
+    """
+    Order results by their average rank on PnL, drawdown and Sharpe ratio.
+
+    Args:
+        results (pd.DataFrame): One row per run with pnl, max_drawdown and sharpe.
+
+    Returns:
+        pd.DataFrame: The rows, best first, with a 'score' column (lower is better).
+    """
+    ranks = pd.concat(
+        [
+            results["pnl"].rank(ascending=False, method="min"),
+            results["max_drawdown"].rank(ascending=True, method="min"),
+            results["sharpe"].rank(ascending=False, method="min"),
+        ],
+        axis=1,
+    )
+    ranked = results.assign(score=ranks.mean(axis=1))
+    return ranked.sort_values(["score", "pnl"], ascending=[True, False]).reset_index(
+        drop=True
+    )
+
+
+def _indicator_key(params: GridParams) -> tuple:
+    return tuple(spec[:2] for spec in indicator_specs(params))
+
+
+def _tasks(ordered: list[GridParams], workers: int) -> list[list[GridParams]]:
+    # one task per indicator group, cut down to a worker's share if it is larger
+    share = max(1, math.ceil(len(ordered) / workers))
+    tasks = []
+    for _, group in itertools.groupby(ordered, _indicator_key):
+        group = list(group)
+        tasks.extend(group[i : i + share] for i in range(0, len(group), share))
+    return tasks
+
+
+def _evaluate(
+    bars: dict, task: list[GridParams], cash, commission, bars_per_year
+) -> list[dict]:
+    specs = indicator_specs(task[0])
+    # not the process-wide default cache, which would keep up to 128 full-length
+    # arrays alive in every worker; this one is dropped with the task
+    cache = IndicatorCache(len(specs))
+    rows = []
+    for params in task:
+        # every set of a task has the same specs, so only the first one computes
+        indicators = batch.compute(bars, specs, cache)
+        result = backtest(bars, params, cash, commission, indicators)
+        rows.append({**params._asdict(), **summarize(result, cash, bars_per_year)})
+    return rows
+
+
+def _attach(name: str, length: int) -> None:
+    global _worker_bars, _worker_memory
+    _worker_memory = shared_memory.SharedMemory(name=name)
+    prices = np.ndarray((len(_COLUMNS), length), np.float64, _worker_memory.buf)
+    prices.flags.writeable = False
+    _worker_bars = dict(zip(_COLUMNS, prices))
+
+
+def _evaluate_shared(task, cash, commission, bars_per_year) -> list[dict]:
+    return _evaluate(_worker_bars, task, cash, commission, bars_per_year)
+
+
+def optimize(
+    bars,
+    param_sets: list[GridParams],
+    cash: float = 1000.0,
+    commission: float = 0.001,
+    workers: int | None = None,
+    bars_per_year: float | None = None,
+) -> pd.DataFrame:
+    """
+    Backtest every parameter set in a process pool and rank the results.
+
+    Args:
+        bars: A DataFrame, a structured array or a dict of arrays with
+            open/high/low/close columns, oldest first.
+        param_sets (list[GridParams]): Candidates, e.g. from param_grid() or
+            param_samples().
+        cash (float, optional): Starting cash per run. Default is 1000.0.
+        commission (float, optional): Commission as a fraction of traded value.
+            Default is 0.001.
+        workers (int | None, optional): Worker processes. Defaults to the CPU count;
+            1 runs everything in this process.
+        bars_per_year (float | None, optional): Annualizes the Sharpe ratio.
+
+    Returns:
+        pd.DataFrame: One row per parameter set (parameters and metrics), ranked
+        best first by rank().
+
+    Raises:
+        ValueError: If a price column is missing.
+    """
+    if not has_columns(bars, _COLUMNS):
+        raise ValueError("⚠️ Missing OHLC columns. Cannot run the optimizer.")
+
+    workers = workers or os.cpu_count()
+    # sorting brings each indicator group together for groupby
+    tasks = _tasks(sorted(param_sets, key=_indicator_key), workers)
+
+    if workers == 1:
+        prices = {name: column(bars, name) for name in _COLUMNS}
+        rows = [
+            row
+            for task in tasks
+            for row in _evaluate(prices, task, cash, commission, bars_per_year)
+        ]
+        return rank(pd.DataFrame(rows))
+
+    length = len(column(bars, "close"))
+    memory = shared_memory.SharedMemory(
+        create=True, size=max(1, len(_COLUMNS) * length * 8)
+    )
+    try:
+        prices = np.ndarray((len(_COLUMNS), length), np.float64, memory.buf)
+        for row, name in zip(prices, _COLUMNS):
+            row[:] = column(bars, name)
+        del prices
+
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_attach, initargs=(memory.name, length)
+        ) as pool:
+            futures = [
+                pool.submit(_evaluate_shared, task, cash, commission, bars_per_year)
+                for task in tasks
+            ]
+            rows = [row for future in futures for row in future.result()]
+    finally:
+        memory.close()
+        memory.unlink()
+    return rank(pd.DataFrame(rows))
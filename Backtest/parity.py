@@ -0,0 +1,182 @@
+"""
+Check that the vectorized backtester reproduces cerebro.run() for GridMACDStrategy.
+
+Both run on the same bars with the same cash and commission, and the check compares
+the final account value and every filled grid order: direction, entry bar and price,
+exit bar and price. The bars are a synthetic random walk, or the XAUUSD history of
+quick_start.py with --csv. Exits with status 1 on a mismatch.
+
+Usage:
+    python -m Backtest.parity --bars 20000 --seed 1
+    python -m Backtest.parity --csv ./XAUUSD_historical_data_30mins.csv
+"""
+
+import argparse
+import math
+import sys
+
+import backtrader as bt
+import numpy as np
+import pandas as pd
+
+from benchmark.indicator_backends import make_bars
+from metatrader.bar_store import BarStore
+
+from .quick_start import GridMACDStrategy
+from .vectorized import GridParams, backtest
+
+# trade fields compared between the two runs, in sort order
+_FIELDS = ("entry_bar", "direction", "entry_price", "exit_bar", "exit_price")
+
+
+class _RecordingStrategy(GridMACDStrategy):
+    """GridMACDStrategy without the log output, noting the bar of every fill."""
+
+    def __init__(self):
+        super().__init__()
+        self.filled = {}  # order ref -> bar index
+
+    def log(self, txt):
+        pass
+
+    def notify_order(self, order):
+        if order.status == order.Completed:
+            self.filled[order.ref] = len(self) - 1
+
+
+def synthetic_bars(n: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Generate M1 bars with opens at the previous close, as cerebro's feed expects them.
+
+    Args:
+        n (int): Number of bars.
+        seed (int, optional): Random seed. Default is 0.
+
+    Returns:
+        pd.DataFrame: open/high/low/close columns on a datetime index.
+    """
+    bars = make_bars(n, seed)
+    close = bars["close"]
+    open_ = np.r_[close[0], close[:-1]]
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(bars["high"], np.maximum(open_, close)),
+            "low": np.minimum(bars["low"], np.minimum(open_, close)),
+            "close": close,
+        },
+        index=pd.date_range("2024-01-01", periods=n, freq="min"),
+    )
+
+
+def run_cerebro(
+    bars: pd.DataFrame, params: GridParams, cash: float, commission: float
+) -> tuple[float, list[tuple]]:
+    """
+    Run GridMACDStrategy through cerebro.
+
+    Args:
+        bars (pd.DataFrame): open/high/low/close columns on a datetime index.
+        params (GridParams): Strategy parameters.
+        cash (float): Starting cash.
+        commission (float): Commission as a fraction of traded value.
+
+    Returns:
+        tuple[float, list[tuple]]: The final broker value and one row per filled
+        grid order, laid out as _FIELDS and sorted.
+    """
+    cerebro = bt.Cerebro()
+    cerebro.addstrategy(_RecordingStrategy, **params._asdict())
+    cerebro.adddata(bt.feeds.PandasData(dataname=bars.assign(volume=0)))
+    cerebro.broker.setcash(cash)
+    cerebro.broker.setcommission(commission=commission)
+    strategy = cerebro.run()[0]
+
+    trades = []
+    for main, stop, limit in strategy.grid_orders:
+        if main.ref not in strategy.filled:
+            continue
+        exit_ = next((o for o in (stop, limit) if o.ref in strategy.filled), None)
+        trades.append(
+            (
+                strategy.filled[main.ref],
+                1 if main.isbuy() else -1,
+                main.executed.price,
+                strategy.filled[exit_.ref] if exit_ else -1,
+                exit_.executed.price if exit_ else math.nan,
+            )
+        )
+    return cerebro.broker.getvalue(), sorted(trades)
+
+
+def check(
+    bars: pd.DataFrame,
+    params: GridParams = GridParams(),
+    cash: float = 1000.0,
+    commission: float = 0.001,
+) -> list[str]:
+    """
+    Run both backtesters on the same bars and list where they disagree.
+
+    Args:
+        bars (pd.DataFrame): open/high/low/close columns on a datetime index.
+        params (GridParams, optional): Strategy parameters.
+        cash (float, optional): Starting cash. Default is 1000.0.
+        commission (float, optional): Commission as a fraction of traded value.
+            Default is 0.001.
+
+    Returns:
+        list[str]: One line per mismatch; empty if the runs agree.
+    """
+    expected_value, expected = run_cerebro(bars, params, cash, commission)
+    result = backtest(bars, params, cash, commission)
+    actual = sorted(tuple(row) for row in result.trades[list(_FIELDS)].tolist())
+
+    mismatches = []
+    if not math.isclose(result.final_value, expected_value, rel_tol=1e-9):
+        mismatches.append(
+            f"final value: cerebro {expected_value:.6f}, "
+            f"vectorized {result.final_value:.6f}"
+        )
+    if len(actual) != len(expected):
+        mismatches.append(
+            f"filled orders: cerebro {len(expected)}, vectorized {len(actual)}"
+        )
+    for want, got in zip(expected, actual):
+        if not np.allclose(want, got, rtol=1e-9, equal_nan=True):
+            mismatches.append(
+                f"first differing trade: cerebro {want}, vectorized {got}"
+            )
+            break
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bars", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--csv", help="check on this history instead of random bars")
+    parser.add_argument("--cash", type=float, default=1000.0)
+    parser.add_argument("--commission", type=float, default=0.001)
+    args = parser.parse_args()
+
+    if args.csv:
+        store = BarStore("./history")
+        if not store.months("XAUUSD", "M30"):
+            store.import_csv(args.csv, "XAUUSD", "M30", time_format="%m/%d/%Y %H:%M")
+        frame = store.load_frame("XAUUSD", "M30").set_index("time")
+        bars = frame[["open", "high", "low", "close"]]
+    else:
+        bars = synthetic_bars(args.bars, args.seed)
+
+    print(f"Bars: {len(bars):,} | cash: {args.cash} | commission: {args.commission}")
+    mismatches = check(bars, cash=args.cash, commission=args.commission)
+    for line in mismatches:
+        print(f"⚠️ {line}")
+    if not mismatches:
+        print("✅ cerebro and the vectorized backtester agree")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
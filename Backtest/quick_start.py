@@ -1,5 +1,6 @@
 import backtrader as bt
-import pandas as pd
+
+from metatrader.bar_store import BarStore
 
 
 class GridMACDStrategy(bt.Strategy):
@@ -124,12 +125,13 @@ class GridMACDStrategy(bt.Strategy):
 
 if __name__ == "__main__":
     datapath = "./XAUUSD_historical_data_30mins.csv"
-    df = pd.read_csv(datapath, usecols=range(5))
-    df.columns = ["datetime", "open", "high", "low", "close"]
+    # the CSV is parsed once into the bar store; later runs read the binary files
+    store = BarStore("./history")
+    if not store.months("XAUUSD", "M30"):
+        store.import_csv(datapath, "XAUUSD", "M30", time_format="%m/%d/%Y %H:%M")
 
-    df["datetime"] = pd.to_datetime(df["datetime"], format="%m/%d/%Y %H:%M")
-    df = df.sort_values(by="datetime").reset_index(drop=True)
-    df.set_index("datetime", inplace=True)
+    df = store.load_frame("XAUUSD", "M30")[["time", "open", "high", "low", "close"]]
+    df = df.rename(columns={"time": "datetime"}).set_index("datetime")
     df["volume"] = 0  
 
     cerebro = bt.Cerebro()
@@ -0,0 +1,535 @@
+"""
+Vectorized backtester for the GridMACDStrategy of Backtest/quick_start.py.
+
+Signals (MACD crossover, RSI extremes, ADX range filter) and ATR are computed as whole
+arrays through the Indicators package. The order simulation then only visits bars where
+something happens: a signal fires, or a pending order is touched. When an order becomes
+active, the bar it will trigger on is found with a blocked search over the highs/lows,
+so the Python loop runs once per event instead of once per bar.
+
+Order handling follows backtrader's BackBroker with its default settings (no slippage,
+cash checked on submission and on execution, bracket children active from the bar after
+their parent fills, stop before take-profit when both are touched in one bar).
+Backtest/parity.py runs both on the same bars and compares the final value and every
+filled order; it agrees on random-walk histories of up to 60,000 M1 bars. TA-Lib seeds
+MACD and ADX slightly differently from backtrader; the values converge within the
+first few hundred bars, so only a signal right at the start of the data can differ.
+"""
+
+import heapq
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+from indicators import batch
+from indicators.inputs import column, has_columns
+
+# exit reasons in the trades array
+OPEN = 0  # still open at the end of the data
+TAKE_PROFIT = 1
+STOP_LOSS = 2
+CANCELLED = 3  # the exit was rejected for lack of cash, the position is left open
+
+TRADE_DTYPE = np.dtype(
+    [
+        ("direction", "i1"),  # 1 buy, -1 sell
+        ("signal_bar", "<i8"),
+        ("entry_bar", "<i8"),
+        ("entry_price", "<f8"),
+        ("exit_bar", "<i8"),  # -1 while open
+        ("exit_price", "<f8"),
+        ("reason", "i1"),
+        ("pnl", "<f8"),  # net of commission on both legs, 0 while open
+    ]
+)
+
+# order roles within a bracket, in backtrader's submission order
+_MAIN, _STOP, _LIMIT = 0, 1, 2
+
+
+class GridParams(NamedTuple):
+    """
+    Parameters of the grid strategy, with the defaults of GridMACDStrategy.params.
+
+    """
+
+    macd_fast: int = 12
+    macd_slow: int = 26
+    macd_signal: int = 9
+    rsi_period: int = 14
+    rsi_overbought: float = 65
+    rsi_oversold: float = 35
+    adx_period: int = 30
+    adx_range: float = 40
+    atr_period: int = 14
+    grid_step: float = 1.0
+    max_grid_orders: int = 5
+    lot_size: float = 0.01
+
+
+class BacktestResult(NamedTuple):
+    """
+    The outcome of one backtest run.
+
+    """
+
+    final_value: float  # cash + open position marked at the last close
+    cash: float
+    position: float  # net position size at the end
+    equity: np.ndarray  # account value after every bar, shape (N,)
+    trades: np.ndarray  # one TRADE_DTYPE row per filled grid order
+
+
+def indicator_specs(params: GridParams) -> list[batch.IndicatorSpec]:
+    """
+    Return the batch specs the strategy needs, labelled as compute_signals expects.
+
+    Args:
+        params (GridParams): Strategy parameters.
+
+    Returns:
+        list[batch.IndicatorSpec]: MACD, RSI, ADX and ATR specs.
+    """
+    return [
+        batch.macd(
+            params.macd_fast, params.macd_slow, params.macd_signal, label="macd"
+        ),
+        batch.rsi(params.rsi_period, label="rsi"),
+        batch.adx(params.adx_period, label="adx"),
+        batch.atr(params.atr_period, label="atr"),
+    ]
+
+
+def compute_signals(
+    bars, params: GridParams = GridParams(), indicators: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluate the entry rules of GridMACDStrategy.next() on every bar at once.
+
+    Args:
+        bars: A DataFrame, a structured array or a dict of arrays with high/low/close.
+        params (GridParams, optional): Strategy parameters.
+        indicators (np.ndarray | None, optional): A batch.compute() result for
+            indicator_specs(params), to reuse indicators across runs.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The signal per bar (1 buy grid, -1 sell grid,
+        0 none) and the ATR per bar.
+    """
+    if indicators is None:
+        indicators = batch.compute(bars, indicator_specs(params))
+    macd, signal = indicators["macd"], indicators["macd_signal"]
+    rsi, adx = indicators["rsi"], indicators["adx"]
+
+    above = macd > signal
+    below = macd < signal
+    bullish = np.zeros(len(macd), dtype=bool)
+    bearish = np.zeros(len(macd), dtype=bool)
+    bullish[1:] = above[1:] & below[:-1]
+    bearish[1:] = below[1:] & above[:-1]
+
+    # NaN comparisons are False, so the warm-up bars never signal
+    in_range = adx < params.adx_range
+    buy = in_range & (rsi < params.rsi_oversold) & bullish
+    sell = in_range & (rsi > params.rsi_overbought) & bearish & ~buy
+    signals = buy.astype(np.int8) - sell.astype(np.int8)
+    return signals, indicators["atr"]
+
+
+class _Touch:
+    """
+    Finds the first bar at or after a start bar whose low/high reaches a price.
+
+    The per-block minima of the lows and maxima of the highs are kept, so a search
+    scans at most one partial block, the block summary and one full block.
+
+    """
+
+    def __init__(self, high: np.ndarray, low: np.ndarray, block: int = 512) -> None:
+        self.high = high
+        self.low = low
+        self.block = block
+        pad = -len(low) % block
+        self.block_high = np.pad(high, (0, pad), constant_values=-math.inf)
+        self.block_high = self.block_high.reshape(-1, block).max(axis=1)
+        self.block_low = np.pad(low, (0, pad), constant_values=math.inf)
+        self.block_low = self.block_low.reshape(-1, block).min(axis=1)
+
+    def low_at_or_below(self, start: int, price: float) -> int:
+        return self._first(self.low, self.block_low, start, price, np.less_equal)
+
+    def high_at_or_above(self, start: int, price: float) -> int:
+        return self._first(self.high, self.block_high, start, price, np.greater_equal)
+
+    def _first(self, values, blocks, start, price, reaches) -> int:
+        """Return the first bar >= start where reaches(value, price), or len(values)."""
+        n, size = len(values), self.block
+        end = min(n, (start // size + 1) * size)
+        if start < end:
+            hit = reaches(values[start:end], price)
+            i = hit.argmax()
+            if hit[i]:
+                return start + int(i)
+        if end == n:
+            return n
+        hit = reaches(blocks[end // size :], price)
+        j = hit.argmax()
+        if not hit[j]:
+            return n
+        lo = end + int(j) * size
+        return lo + int(reaches(values[lo : lo + size], price).argmax())
+
+
+class _Position:
+    """
+    A net position as kept by backtrader's Position: size, average price, and the
+    opened/closed split of every update.
+
+    """
+
+    def __init__(self, size: float = 0.0, price: float = 0.0) -> None:
+        self.size = size
+        self.price = price
+
+    def update(self, size: float, price: float) -> tuple[float, float]:
+        """Apply a fill and return the (opened, closed) parts of its size."""
+        oldsize = self.size
+        self.size += size
+        if not self.size:
+            opened, closed = 0.0, size
+            self.price = 0.0
+        elif not oldsize:
+            opened, closed = size, 0.0
+            self.price = price
+        elif oldsize > 0:
+            if size > 0:
+                opened, closed = size, 0.0
+                self.price = (self.price * oldsize + size * price) / self.size
+            elif self.size > 0:
+                opened, closed = 0.0, size
+            else:
+                opened, closed = self.size, -oldsize
+                self.price = price
+        else:
+            if size < 0:
+                opened, closed = size, 0.0
+                self.price = (self.price * oldsize + size * price) / self.size
+            elif self.size < 0:
+                opened, closed = 0.0, size
+            else:
+                opened, closed = self.size, -oldsize
+                self.price = price
+        return opened, closed
+
+
+class _Broker:
+    """
+    Cash and position bookkeeping of a stock-like backtrader broker (percentage
+    commission, short sales credited to cash).
+
+    """
+
+    def __init__(self, cash: float, commission: float) -> None:
+        self.cash = cash
+        self.commission = commission
+        self.position = _Position()
+
+    def check_submitted(self, brackets: list[list[tuple[float, float]]]) -> list[bool]:
+        """
+        Pseudo-execute newly submitted brackets at their order prices, as
+        check_submitted() does, and return which ones are accepted.
+
+        A running cash figure goes through every order; an order that takes it below
+        zero is rejected together with the rest of its bracket.
+
+        Args:
+            brackets (list[list[tuple[float, float]]]): Per bracket, the (signed size,
+                price) of its main, stop and limit order, in submission order.
+
+        Returns:
+            list[bool]: False for brackets rejected for lack of cash.
+        """
+        cash = self.cash
+        clone = _Position(self.position.size, self.position.price)
+        accepted = []
+        for orders in brackets:
+            ok = True
+            for size, price in orders:
+                opened, closed = clone.update(size, price)
+                if closed:
+                    cash += -closed * price
+                    cash -= abs(closed) * self.commission * price
+                if opened:
+                    cash -= opened * price
+                    cash -= abs(opened) * self.commission * price
+                if cash < 0.0:
+                    ok = False
+                    break
+            accepted.append(ok)
+        return accepted
+
+    def execute(self, size: float, price: float) -> bool:
+        """
+        Fill an order, refusing the part that opens a position beyond the cash.
+
+        Args:
+            size (float): Signed order size.
+            price (float): Fill price.
+
+        Returns:
+            bool: False if the opening part was refused (the order gets Margin status).
+        """
+        position = self.position
+        pprice_orig = position.price
+        opened, closed = _Position(position.size, position.price).update(size, price)
+        popened = opened
+
+        cash = self.cash
+        if closed:
+            cash += -closed * pprice_orig + -closed * (price - pprice_orig)
+            cash -= abs(closed) * self.commission * price
+            self.cash = cash
+        if opened:
+            cash -= opened * price
+            cash -= abs(opened) * self.commission * price
+            if cash < 0.0:
+                opened = 0.0
+            else:
+                self.cash = cash
+
+        if closed + opened:
+            position.update(closed + opened, price)
+        return not (popened and not opened)
+
+
+class _GridSimulation:
+    """
+    The event loop of one backtest: pending orders sit in a heap keyed by the bar
+    they trigger on and their submission order, which is the order backtrader's
+    broker walks its pending queue in.
+
+    """
+
+    def __init__(self, open_, high, low, close, atr, params, cash, commission) -> None:
+        self.open = open_
+        self.close = close
+        self.atr = atr
+        self.params = params
+        self.n = len(close)
+        self.touch = _Touch(high, low)
+        self.broker = _Broker(cash, commission)
+
+        # brackets[k] = [direction, price, stop, limit, signal_bar, entry_bar, entry_price]
+        self.brackets = []
+        self.pending = []  # heap of (bar, seq, bracket, role); seq = 3 * bracket + role
+        self.trades = []
+        # bars where cash or position changed, with the state from that bar on
+        self.marks = [0]
+        self.cash_marks = [cash]
+        self.size_marks = [0.0]
+
+    def _touched(self, start: int, direction: int, price: float, role: int) -> int:
+        # buy limits and sell stops trigger on the low, the others on the high
+        buying = (direction > 0) == (role == _MAIN)
+        if buying == (role != _STOP):
+            return self.touch.low_at_or_below(start, price)
+        return self.touch.high_at_or_above(start, price)
+
+    def _fill_price(self, bar: int, direction: int, price: float, role: int) -> float:
+        # no slippage: a gap through the order price fills at the open
+        o = self.open[bar]
+        buying = (direction > 0) == (role == _MAIN)
+        if role == _STOP:
+            gapped = o >= price if buying else o <= price
+        else:
+            gapped = o <= price if buying else o >= price
+        return o if gapped else price
+
+    def _push_exit(self, k: int, start: int) -> None:
+        direction, _, stop, limit = self.brackets[k][:4]
+        stop_bar = self._touched(start, direction, stop, _STOP)
+        limit_bar = self._touched(start, direction, limit, _LIMIT)
+        # the stop was submitted first, so it wins a tie
+        if stop_bar <= limit_bar:
+            heapq.heappush(self.pending, (stop_bar, 3 * k + _STOP, k, _STOP))
+        else:
+            heapq.heappush(self.pending, (limit_bar, 3 * k + _LIMIT, k, _LIMIT))
+
+    def _mark(self, bar: int) -> None:
+        if bar != self.marks[-1]:
+            self.marks.append(bar)
+            self.cash_marks.append(self.broker.cash)
+            self.size_marks.append(self.broker.position.size)
+        else:
+            self.cash_marks[-1] = self.broker.cash
+            self.size_marks[-1] = self.broker.position.size
+
+    def execute_pending(self, bar: int) -> None:
+        """Fill every pending order touched on this bar, in submission order."""
+        lot = self.params.lot_size
+        commission = self.broker.commission
+        while self.pending and self.pending[0][0] == bar:
+            _, _, k, role = heapq.heappop(self.pending)
+            direction, price, stop, limit, signal_bar = self.brackets[k][:5]
+            level = (price, stop, limit)[role]
+            size = lot if (direction > 0) == (role == _MAIN) else -lot
+            filled = self._fill_price(bar, direction, level, role)
+            ok = self.broker.execute(size, filled)
+            self._mark(bar)
+
+            if role == _MAIN:
+                if ok:
+                    self.brackets[k][5:] = [bar, filled]
+                    self._push_exit(k, bar + 1)
+                continue
+
+            entry_bar, entry_price = self.brackets[k][5:]
+            if ok:
+                reason = STOP_LOSS if role == _STOP else TAKE_PROFIT
+                pnl = direction * lot * (filled - entry_price)
+                pnl -= lot * commission * (entry_price + filled)
+                exit_ = (bar, filled, reason, pnl)
+            else:
+                exit_ = (-1, math.nan, CANCELLED, 0.0)
+            self.trades.append((direction, signal_bar, entry_bar, entry_price) + exit_)
+            self.brackets[k] = None
+
+    def place_grid(self, bar: int, direction: int) -> None:
+        """Submit a grid of brackets like GridMACDStrategy.place_grid_orders()."""
+        p = self.params
+        base_price = self.close[bar]
+        atr = self.atr[bar]
+        est_cost_per_order = base_price * p.lot_size * 1.01
+        max_orders = min(int(self.broker.cash // est_cost_per_order), p.max_grid_orders)
+
+        levels = []
+        for i in range(max_orders):
+            if direction > 0:
+                grid_price = base_price - i * p.grid_step
+                levels.append(
+                    (grid_price, grid_price - 1.5 * atr, grid_price + 2 * atr)
+                )
+            else:
+                grid_price = base_price + i * p.grid_step
+                levels.append(
+                    (grid_price, grid_price + 1.5 * atr, grid_price - 2 * atr)
+                )
+
+        size = direction * p.lot_size
+        accepted = self.broker.check_submitted(
+            [
+                [(size, price), (-size, stop), (-size, limit)]
+                for price, stop, limit in levels
+            ]
+        )
+        for (price, stop, limit), ok in zip(levels, accepted):
+            if not ok:
+                continue
+            k = len(self.brackets)
+            self.brackets.append([direction, price, stop, limit, bar, None, None])
+            # submitted orders are checked and become active on the next bar
+            start = self._touched(bar + 1, direction, price, _MAIN)
+            heapq.heappush(self.pending, (start, 3 * k + _MAIN, k, _MAIN))
+
+    def run(self, signals: np.ndarray) -> None:
+        signal_bars = np.flatnonzero(signals).tolist()
+        next_signal = 0
+        while True:
+            bar = self.pending[0][0] if self.pending else self.n
+            if next_signal < len(signal_bars):
+                bar = min(bar, signal_bars[next_signal])
+            if bar >= self.n:
+                break
+
+            # the broker runs before the strategy on every bar
+            self.execute_pending(bar)
+            if next_signal < len(signal_bars) and signal_bars[next_signal] == bar:
+                next_signal += 1
+                if not self.broker.position.size:
+                    self.place_grid(bar, int(signals[bar]))
+
+    def result(self) -> BacktestResult:
+        trades = self.trades + [
+            (b[0], b[4], b[5], b[6], -1, math.nan, OPEN, 0.0)
+            for b in self.brackets
+            if b is not None and b[5] is not None
+        ]
+        trades = np.array(trades, dtype=TRADE_DTYPE)
+        trades.sort(order=["entry_bar"], kind="stable")
+
+        marks = np.asarray(self.marks)
+        state = np.searchsorted(marks, np.arange(self.n), side="right") - 1
+        equity = np.asarray(self.cash_marks)[state] + (
+            np.asarray(self.size_marks)[state] * self.close
+        )
+        return BacktestResult(
+            float(equity[-1]) if self.n else self.broker.cash,
+            self.broker.cash,
+            self.broker.position.size,
+            equity,
+            trades,
+        )
+
+
+def backtest(
+    bars,
+    params: GridParams = GridParams(),
+    cash: float = 1000.0,
+    commission: float = 0.001,
+    indicators: np.ndarray | None = None,
+) -> BacktestResult:
+    """
+    Run GridMACDStrategy over a bar history.
+
+    On a signal bar with no open position, up to max_grid_orders limit orders are
+    placed at close -/+ i * grid_step (as many as the cash covers), each with an ATR
+    stop loss and take profit. Orders stay pending until filled; the strategy never
+    cancels them.
+
+    Args:
+        bars: A DataFrame, a structured array (e.g. from mt5.copy_rates_from_pos) or a
+            dict of arrays with open/high/low/close columns, oldest first.
+        params (GridParams, optional): Strategy parameters.
+        cash (float, optional): Starting cash. Default is 1000.0.
+        commission (float, optional): Commission as a fraction of traded value.
+            Default is 0.001.
+        indicators (np.ndarray | None, optional): A precomputed batch.compute() result
+            for indicator_specs(params).
+
+    Returns:
+        BacktestResult: Final value, equity curve and trades.
+
+    Raises:
+        ValueError: If a price column is missing.
+    """
+    if not has_columns(bars, ["open", "high", "low", "close"]):
+        raise ValueError("⚠️ Missing OHLC columns. Cannot run the backtest.")
+
+    signals, atr = compute_signals(bars, params, indicators)
+    simulation = _GridSimulation(
+        column(bars, "open"),
+        column(bars, "high"),
+        column(bars, "low"),
+        column(bars, "close"),
+        atr,
+        params,
+        cash,
+        commission,
+    )
+    simulation.run(signals)
+    return simulation.result()
+
+
+if __name__ == "__main__":
+    from metatrader.bar_store import BarStore
+
+    datapath = "./XAUUSD_historical_data_30mins.csv"
+    store = BarStore("./history")
+    if not store.months("XAUUSD", "M30"):
+        store.import_csv(datapath, "XAUUSD", "M30", time_format="%m/%d/%Y %H:%M")
+
+    result = backtest(store.load("XAUUSD", "M30"), cash=1000.0, commission=0.001)
+    print(f"💰 初始资金: {1000.0:.2f}")
+    print(f"💰 最终资金: {result.final_value:.2f}")
+    print(f"Trades: {len(result.trades)}")
@@ -0,0 +1,108 @@
+"""
+Compare the TA-Lib and NumPy indicator backends on a long synthetic series.
+
+Usage:
+    python -m Benchmark.indicator_backends --bars 1000000 --repeat 3
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from indicators import backend
+
+
+def make_bars(n: int, seed: int = 0) -> dict[str, np.ndarray]:
+    """
+    Generate a random-walk OHLC series around a gold-like price level.
+
+    Args:
+        n (int): Number of bars.
+        seed (int, optional): Random seed. Default is 0.
+
+    Returns:
+        dict[str, np.ndarray]: 'high', 'low' and 'close' arrays.
+    """
+    rng = np.random.default_rng(seed)
+    close = 2000.0 + np.cumsum(rng.normal(0.0, 0.5, n))
+    high = close + rng.random(n)
+    low = close - rng.random(n)
+    return {"high": high, "low": low, "close": close}
+
+
+def cases(bars: dict[str, np.ndarray]) -> dict:
+    """Benchmark cases as name -> function(backend_module)."""
+    high, low, close = bars["high"], bars["low"], bars["close"]
+    return {
+        "RSI(14)": lambda ta: ta.RSI(close, 14),
+        "MACD(12,26,9)": lambda ta: ta.MACD(close, 12, 26, 9),
+        "ATR(14)": lambda ta: ta.ATR(high, low, close, 14),
+        "ADX(14)": lambda ta: ta.ADX(high, low, close, 14),
+        "BBANDS(20,2,2)": lambda ta: ta.BBANDS(close, 20, 2, 2, 0),
+        # period 1 smoothing has a zero decay, the edge of the NumPy recurrences
+        "MACD(12,26,1)": lambda ta: ta.MACD(close, 12, 26, 1),
+        "ATR(1)": lambda ta: ta.ATR(high, low, close, 1),
+    }
+
+
+def best_time(func, repeat: int) -> float:
+    """Return the best wall time of `repeat` runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def max_abs_diff(a, b) -> float:
+    """
+    Largest absolute difference between two outputs, ignoring the NaN lookback.
+
+    A NaN in one output where the other has a value counts as an infinite difference.
+    """
+    a = a if isinstance(a, tuple) else (a,)
+    b = b if isinstance(b, tuple) else (b,)
+    diffs = []
+    for x, y in zip(a, b):
+        if not np.array_equal(np.isnan(x), np.isnan(y)):
+            return float("inf")
+        diffs.append(float(np.nanmax(np.abs(x - y))))
+    return max(diffs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bars", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    names = backend.available()
+    modules = {}
+    for name in names:
+        backend.set_backend(name)
+        modules[name] = backend.get_backend()
+
+    bars = make_bars(args.bars)
+    print(f"Bars: {args.bars:,} | repeat: {args.repeat} | backends: {names}")
+    print(
+        f"{'indicator':<16}"
+        + "".join(f"{n + ' (ms)':>14}" for n in names)
+        + f"{'max |diff|':>14}"
+    )
+
+    for label, func in cases(bars).items():
+        row = f"{label:<16}"
+        outputs = {}
+        for name, module in modules.items():
+            outputs[name] = func(module)
+            row += f"{best_time(lambda: func(module), args.repeat) * 1000:>14.1f}"
+        if len(outputs) > 1:
+            first, *others = outputs.values()
+            row += f"{max(max_abs_diff(first, o) for o in others):>14.2e}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
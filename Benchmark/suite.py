@@ -0,0 +1,502 @@
+"""
+Benchmark suite for the indicators, the data fetch and the order paths.
+
+Cases run against a SimulatedTerminal, so the suite needs no MetaTrader terminal and
+gives the same work on every run. Results can be saved as a named baseline in
+Benchmark/baselines/ and later runs compared against it. Timings only compare on the
+same machine, Python, NumPy and indicator backend, so baselines are kept per machine
+and not committed; a comparison across environments is refused unless forced.
+
+Usage:
+    python -m Benchmark.suite list
+    python -m Benchmark.suite run --save baseline
+    python -m Benchmark.suite run --filter indicators --sizes 1000,100000 --compare baseline
+    python -m Benchmark.suite compare baseline current
+"""
+
+import argparse
+import asyncio
+import contextlib
+import functools
+import io
+import json
+import logging
+import platform
+import re
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+import numpy as np
+
+from indicators import adx, atr, backend, bb, macd, rsi
+from metatrader.mt5_trader import MT5Trader
+from metatrader.rate_buffer import RATE_DTYPE
+from metatrader.simulator import SimulatedTerminal
+from main.strategies import RSIMACDStrategy, RSIReversalStrategy
+
+from .indicator_backends import make_bars
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+SIZES = (1_000, 100_000, 10_000_000)
+# environment() keys that must match for two sets of results to be comparable
+COMPARABLE_KEYS = ("node", "machine", "processor", "python", "numpy", "backend")
+
+
+class Case(NamedTuple):
+    """
+    One benchmark: setup() prepares fresh state and returns the function to time.
+
+    """
+
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    max_number: int = 10_000  # most calls per sample, for cases that use up state
+
+
+class Result(NamedTuple):
+    """
+    Seconds per call of one case, over `repeat` samples of `number` calls.
+
+    """
+
+    median: float
+    best: float
+    worst: float
+    number: int
+    repeat: int
+
+
+def size_label(n: int) -> str:
+    """Format a bar count as 1K, 100K, 10M, ..."""
+    for unit, scale in (("M", 1_000_000), ("K", 1_000)):
+        if n >= scale and n % scale == 0:
+            return f"{n // scale}{unit}"
+    return str(n)
+
+
+@functools.cache
+def _bars(n: int) -> dict[str, np.ndarray]:
+    return make_bars(n)
+
+
+def make_rates(n: int, timeframe_seconds: int = 60) -> np.ndarray:
+    """
+    Generate bars in the mt5.copy_rates_* layout, ending at the current minute.
+
+    Args:
+        n (int): Number of bars.
+        timeframe_seconds (int, optional): Bar length. Default is 60.
+
+    Returns:
+        np.ndarray: RATE_DTYPE array, oldest first.
+    """
+    bars = make_bars(n)
+    close = bars["close"]
+    rates = np.zeros(n, dtype=RATE_DTYPE)
+    end = int(time.time()) // timeframe_seconds * timeframe_seconds
+    rates["time"] = end - timeframe_seconds * np.arange(n)[::-1]
+    rates["open"] = np.r_[close[0], close[:-1]]
+    rates["close"] = close
+    rates["high"] = np.maximum(bars["high"], np.maximum(rates["open"], close))
+    rates["low"] = np.minimum(bars["low"], np.minimum(rates["open"], close))
+    rates["tick_volume"] = 100
+    rates["spread"] = 20
+    return rates
+
+
+def _quiet_logger() -> logging.Logger:
+    logger = logging.getLogger("benchmark")
+    logger.propagate = False
+    if not logger.handlers:
+        logger.addHandler(logging.NullHandler())
+    return logger
+
+
+def _trader(history: int, replay: int = 0, bars: int = 1000) -> tuple:
+    """A connected MT5Trader on a SimulatedTerminal with `history` M1 bars."""
+    terminal = SimulatedTerminal()
+    terminal.add_bars("XAUUSD", make_rates(history + replay), "M1", warmup=history)
+    trader = MT5Trader(
+        _quiet_logger(), bars=bars, terminal=terminal, clock=terminal.clock
+    )
+    with contextlib.redirect_stdout(io.StringIO()):
+        trader.connect(1, "password", "server")
+    return terminal, trader
+
+
+def indicator_cases(sizes) -> list[Case]:
+    """Each indicator's full-series computation, with the cache disabled."""
+    indicators = {
+        "RSI(14)": lambda data: rsi.RSI(data, 14, cache=None).get_rsi(),
+        "MACD(12,26,9)": lambda data: macd.MACD(data, 12, 26, 9, cache=None).get_macd(),
+        "ATR(14)": lambda data: atr.ATR(data, 14, cache=None).get_atr(),
+        "ADX(14)": lambda data: adx.ADX(data, 14, cache=None).get_adx(),
+        "BBANDS(20,2,2)": lambda data: bb.BollingerBands(
+            data, 20, 2, 2, cache=None
+        ).get_bbands(),
+    }
+    return [
+        Case(
+            f"indicators.{label}[{size_label(n)}]",
+            lambda func=func, n=n: functools.partial(func, _bars(n)),
+        )
+        for n in sizes
+        for label, func in indicators.items()
+    ]
+
+
+def fetch_cases(sizes) -> list[Case]:
+    """fetch_ohlcv with a warm buffer: one terminal call plus the DataFrame build."""
+
+    def setup(n: int):
+        _, trader = _trader(n, bars=n)
+        trader.fetch_rates("XAUUSD", "M1")
+        return lambda: trader.fetch_ohlcv("XAUUSD", "M1")
+
+    # the simulator holds four ticks per bar, so its history is capped at 100K bars
+    return [
+        Case(f"fetch.fetch_ohlcv[{size_label(n)}]", functools.partial(setup, n))
+        for n in sizes
+        if n <= 100_000
+    ]
+
+
+def order_cases() -> list[Case]:
+    """Placing a 5-level grid of pending orders, blocking and from asyncio."""
+
+    def setup(use_async: bool):
+        _, trader = _trader(1000)
+        out = io.StringIO()
+        # one loop for all calls, as in an application that is already async
+        loop = asyncio.new_event_loop() if use_async else None
+
+        def place():
+            if loop is None:
+                trader.place_grid_orders("buy", "XAUUSD", 0.01, 5, 10.0, 2.0)
+            else:
+                loop.run_until_complete(
+                    trader.place_grid_orders_async("buy", "XAUUSD", 0.01, 5, 10.0, 2.0)
+                )
+
+        def run():
+            with contextlib.redirect_stdout(out):
+                place()
+            out.seek(0)
+            out.truncate()
+
+        return run
+
+    return [
+        Case("orders.place_grid_orders[5]", functools.partial(setup, False), 2_000),
+        Case("orders.place_grid_orders_async[5]", functools.partial(setup, True), 500),
+    ]
+
+
+def strategy_cases() -> list[Case]:
+    """One full tick per bar: advance a minute, fetch, evaluate the strategy."""
+    ticks = 2_000
+
+    def setup(strategy_type):
+        terminal, trader = _trader(1000, replay=ticks + 10)
+        strategy = strategy_type("XAUUSD", "M1", trader.logger)
+        trader.fetch_rates("XAUUSD", "M1")
+        out = io.StringIO()
+
+        def tick():
+            terminal.advance(60)
+            rates = trader.fetch_rates("XAUUSD", "M1")[:-1].copy()
+            with contextlib.redirect_stdout(out):
+                strategy.on_bar(rates, trader)
+            out.seek(0)
+            out.truncate()
+
+        return tick
+
+    return [
+        Case(
+            f"strategy.{strategy_type.__name__}.tick",
+            functools.partial(setup, strategy_type),
+            ticks,
+        )
+        for strategy_type in (RSIReversalStrategy, RSIMACDStrategy)
+    ]
+
+
+def all_cases(sizes=SIZES) -> list[Case]:
+    return (
+        indicator_cases(sizes) + fetch_cases(sizes) + order_cases() + strategy_cases()
+    )
+
+
+def measure(case: Case, repeat: int = 5, min_time: float = 0.2) -> Result:
+    """
+    Time a case.
+
+    The number of calls per sample is calibrated from a call after a warm-up call,
+    so that a sample takes about `min_time`; every sample starts from a fresh
+    setup().
+
+    Args:
+        case (Case): The case.
+        repeat (int, optional): Samples taken. Default is 5.
+        min_time (float, optional): Target seconds per sample. Default is 0.2.
+
+    Returns:
+        Result: Seconds per call.
+    """
+    func = case.setup()
+    func()
+    start = time.perf_counter()
+    func()
+    once = time.perf_counter() - start
+    number = int(min(case.max_number, max(1, min_time // max(once, 1e-9))))
+
+    samples = []
+    for _ in range(repeat):
+        func = case.setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    return Result(
+        statistics.median(samples), min(samples), max(samples), number, repeat
+    )
+
+
+def environment() -> dict:
+    """Describe the machine and library versions results were taken on."""
+    return {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "node": platform.node(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "system": platform.platform(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "backend": backend.backend_name(),
+    }
+
+
+def save(name: str, results: dict[str, Result]) -> Path:
+    """
+    Save results as a named baseline.
+
+    Args:
+        name (str): Baseline name, or a path to a .json file.
+        results (dict[str, Result]): Results by case name.
+
+    Returns:
+        Path: The file written.
+    """
+    path = baseline_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "environment": environment(),
+        "results": {case: r._asdict() for case, r in results.items()},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    return path
+
+
+def check_environment(base: dict, current: dict, force: bool = False) -> list[str]:
+    """
+    Check that two environments give comparable timings.
+
+    Args:
+        base (dict): environment() of the baseline.
+        current (dict): environment() of the new results.
+        force (bool, optional): Only report differences instead of raising.
+            Default is False.
+
+    Returns:
+        list[str]: The differences, one per COMPARABLE_KEYS entry that differs.
+
+    Raises:
+        ValueError: If the environments differ and `force` is False.
+    """
+    differences = [
+        f"{key}: {base.get(key)!r} vs {current.get(key)!r}"
+        for key in COMPARABLE_KEYS
+        if base.get(key) != current.get(key)
+    ]
+    if differences and not force:
+        raise ValueError(
+            "⚠️ Benchmark environments differ, timings are not comparable "
+            f"({'; '.join(differences)}). Save a baseline on this machine, or "
+            "pass --force."
+        )
+    return differences
+
+
+def baseline_path(name: str) -> Path:
+    return Path(name) if name.endswith(".json") else BASELINE_DIR / f"{name}.json"
+
+
+def load(name: str) -> tuple[dict, dict[str, Result]]:
+    """
+    Load a saved baseline.
+
+    Args:
+        name (str): Baseline name, or a path to a .json file.
+
+    Returns:
+        tuple[dict, dict[str, Result]]: Its environment and results by case name.
+
+    Raises:
+        ValueError: If there is no such baseline.
+    """
+    path = baseline_path(name)
+    if not path.exists():
+        raise ValueError(f"⚠️ No benchmark baseline at {path}")
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    results = {case: Result(**r) for case, r in data["results"].items()}
+    return data["environment"], results
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def compare(
+    base: dict[str, Result], current: dict[str, Result], threshold: float = 1.2
+) -> tuple[str, int]:
+    """
+    Compare two sets of results by their medians.
+
+    Args:
+        base (dict[str, Result]): Baseline results by case name.
+        current (dict[str, Result]): New results by case name.
+        threshold (float, optional): Ratio beyond which a case counts as slower (or,
+            inverted, faster). Default is 1.2.
+
+    Returns:
+        tuple[str, int]: The report and the number of regressed cases.
+    """
+    lines = [f"{'case':<44}{'baseline':>14}{'current':>14}{'ratio':>8}  change"]
+    regressions = 0
+    for case in sorted(base.keys() | current.keys()):
+        old, new = base.get(case), current.get(case)
+        if old is None or new is None:
+            mark = "new" if old is None else "missing"
+            value = _format_time((new or old).median)
+            lines.append(
+                f"{case:<44}{value if old else '-':>14}{value if new else '-':>14}"
+                f"{'':>8}  {mark}"
+            )
+            continue
+        ratio = new.median / old.median
+        if ratio > threshold:
+            mark = "SLOWER"
+            regressions += 1
+        elif ratio < 1 / threshold:
+            mark = "faster"
+        else:
+            mark = ""
+        lines.append(
+            f"{case:<44}{_format_time(old.median):>14}{_format_time(new.median):>14}"
+            f"{ratio:>8.2f}  {mark}"
+        )
+    lines.append(f"{regressions} of {len(base.keys() & current.keys())} cases slower")
+    return "\n".join(lines), regressions
+
+
+def run(cases: list[Case], repeat: int, min_time: float) -> dict[str, Result]:
+    """Measure the cases, printing each result as it comes."""
+    results = {}
+    print(f"{'case':<44}{'median':>14}{'best':>14}{'number':>8}")
+    for case in cases:
+        result = measure(case, repeat, min_time)
+        results[case.name] = result
+        print(
+            f"{case.name:<44}{_format_time(result.median):>14}"
+            f"{_format_time(result.best):>14}{result.number:>8}",
+            flush=True,
+        )
+    return results
+
+
+def _check_or_exit(base_env: dict, current_env: dict, force: bool) -> None:
+    try:
+        differences = check_environment(base_env, current_env, force)
+    except ValueError as e:
+        print(e)
+        sys.exit(2)
+    for difference in differences:
+        print(f"⚠️ Environments differ, {difference}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    listing = commands.add_parser("list", help="list the cases")
+    running = commands.add_parser("run", help="run the cases")
+    for sub in (listing, running):
+        sub.add_argument("--filter", default="", help="regex on the case names")
+        sub.add_argument(
+            "--sizes",
+            default=",".join(map(str, SIZES)),
+            help="comma-separated bar counts of the indicator and fetch cases",
+        )
+    running.add_argument("--repeat", type=int, default=5)
+    running.add_argument("--min-time", type=float, default=0.2)
+    running.add_argument("--save", help="save the results as this baseline")
+    running.add_argument("--compare", help="compare the results with this baseline")
+    running.add_argument("--threshold", type=float, default=1.2)
+
+    comparing = commands.add_parser("compare", help="compare two saved baselines")
+    comparing.add_argument("base")
+    comparing.add_argument("current")
+    comparing.add_argument("--threshold", type=float, default=1.2)
+    for sub in (running, comparing):
+        sub.add_argument(
+            "--force",
+            action="store_true",
+            help="compare even if the environments differ",
+        )
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        base_env, base = load(args.base)
+        current_env, current = load(args.current)
+        print(f"baseline: {base_env}\ncurrent:  {current_env}")
+        _check_or_exit(base_env, current_env, args.force)
+        report, regressions = compare(base, current, args.threshold)
+        print(report)
+        sys.exit(1 if regressions else 0)
+
+    sizes = [int(n) for n in args.sizes.split(",") if n]
+    cases = [c for c in all_cases(sizes) if re.search(args.filter, c.name)]
+    if args.command == "list":
+        print("\n".join(case.name for case in cases))
+        return
+
+    current_env = environment()
+    print(current_env)
+    if args.compare:
+        # refuse before spending minutes on a run that cannot be compared
+        base_env, base = load(args.compare)
+        _check_or_exit(base_env, current_env, args.force)
+    results = run(cases, args.repeat, args.min_time)
+    if args.save:
+        print(f"Saved {save(args.save, results)}")
+    if args.compare:
+        # a filtered run is only compared on the cases it ran
+        base = {case: r for case, r in base.items() if case in results}
+        print(f"\nbaseline: {base_env}")
+        report, regressions = compare(base, results, args.threshold)
+        print(report)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,87 @@
+import math
+
+import numpy as np
 import pandas as pd
-import talib
+
+from . import backend
+from .cache import IndicatorCache, cached, default_cache, fingerprint
+from .inputs import column, has_columns, row_count
+from .streaming import ADXState, StreamHistory
 
 
 class ADX:
     """
-    A wrapper class for calculating the Average Directional Index (ADX) using TA-Lib.
+    A wrapper class for calculating the Average Directional Index (ADX) using TA-Lib
+    (or the NumPy fallback backend, see Indicators/backend.py).
 
     """
 
-    def __init__(self, df: pd.DataFrame, timeperiod: int = 14) -> None:
+    def __init__(
+        self,
+        df: pd.DataFrame | np.ndarray,
+        timeperiod: int = 14,
+        cache: IndicatorCache | None = default_cache,
+    ) -> None:
         """
         Initialize the ADX calculator.
 
         Args:
-            df (pd.DataFrame): A DataFrame with 'high', 'low', and 'close' price columns.
+            df (pd.DataFrame | np.ndarray): A DataFrame, a structured array straight from
+                mt5.copy_rates_from_pos, or a dict of arrays with 'high', 'low', and
+                'close' price columns.
+                The data is referenced, never copied or modified.
             timeperiod (int, optional): Period length for ADX calculation. Default is 14.
+            cache (IndicatorCache | None, optional): Cache for the full output arrays.
+                Defaults to the shared cache; None disables caching.
 
         Raises:
             ValueError: If the required columns are not found in the input DataFrame.
         """
         self.required_cols = ["high", "low", "close"]
-        self.df = df.copy()
+        self.df = df
         self.timeperiod = timeperiod
+        self.cache = cache
+        self._state = None
+        self._history = None
 
-        if not all(col in self.df.columns for col in self.required_cols):
+        if not has_columns(self.df, self.required_cols):
             raise ValueError(
                 "⚠️ Missing columns 'high', 'low', or 'close'. Cannot compute ADX."
             )
 
+    def update(self, bar, closed: bool = True) -> float:
+        """
+        Feed one bar into the streaming ADX and return its value in O(1).
+
+        The first call seeds the directional movement state from the data given at
+        construction, which is treated as closed history. A bar passed with closed=False
+        is evaluated without being stored, so the forming bar can be re-evaluated on every
+        tick. Once streaming, get_adx() reads from the stream.
+
+        Args:
+            bar: A mapping (dict, pd.Series row or NumPy record) with 'high', 'low' and 'close'.
+            closed (bool, optional): Commit the bar to the state. Default is True.
+
+        Returns:
+            float: The ADX value for the bar (rounded to 3 decimal places), NaN during warm-up.
+        """
+        if self._state is None:
+            self._state = ADXState(self.timeperiod)
+            self._history = StreamHistory()
+            for high, low, close in zip(
+                column(self.df, "high"),
+                column(self.df, "low"),
+                column(self.df, "close"),
+            ):
+                value = self._state.update(float(high), float(low), float(close))
+                self._history.push(value, closed=True)
+
+        value = self._state.update(
+            float(bar["high"]), float(bar["low"]), float(bar["close"]), commit=closed
+        )
+        self._history.push(value, closed)
+        return round(value, 3)
+
     def get_adx(self) -> float:
         """
         Calculate and return the most recent ADX value.
@@ -38,17 +92,35 @@ class ADX:
         Raises:
             ValueError: If the DataFrame does not contain enough data to compute ADX.
         """
-        if len(self.df) < self.timeperiod + 1:
+        if self._history is not None:
+            adx_array = self._history.tail(1)
+            if not adx_array or math.isnan(adx_array[-1]):
+                raise ValueError(
+                    f"⚠️ Insufficient data to calulate ADX. At least {2 * self.timeperiod} rows are needed."
+                )
+            return round(adx_array[-1], 3)
+
+        if row_count(self.df) < self.timeperiod + 1:
             raise ValueError(
                 f"⚠️ Insufficient data to calulate ADX. At least {self.timeperiod + 1} rows are needed."
             )
 
-        adx_array = talib.ADX(
-            self.df["high"].to_numpy(),
-            self.df["low"].to_numpy(),
-            self.df["close"].to_numpy(),
-            timeperiod=self.timeperiod,
+        high = column(self.df, "high")
+        low = column(self.df, "low")
+        close = column(self.df, "close")
+
+        def compute():
+            return backend.get_backend().ADX(
+                high, low, close, timeperiod=self.timeperiod
+            )
+
+        key = (
+            fingerprint(high, low, close),
+            "ADX",
+            (self.timeperiod,),
+            backend.backend_name(),
         )
+        adx_array = cached(self.cache, key, compute)
 
         return round(adx_array[-1], 3)
 
@@ -0,0 +1,67 @@
+import os
+
+from . import numpy_backend
+
+try:
+    import talib
+except ImportError:  # e.g. Linux workers without the TA-Lib wheel
+    talib = None
+
+
+_BACKENDS = {"numpy": numpy_backend}
+if talib is not None:
+    _BACKENDS["talib"] = talib
+
+_active = os.environ.get("INDICATORS_BACKEND", "talib" if talib else "numpy")
+if _active not in _BACKENDS:
+    _active = "numpy"
+
+
+def available() -> list[str]:
+    """
+    List the backends that can be used in this process.
+
+    Returns:
+        list[str]: Backend names, e.g. ["numpy", "talib"].
+    """
+    return sorted(_BACKENDS)
+
+
+def set_backend(name: str) -> None:
+    """
+    Select the backend used by all indicator classes.
+
+    Args:
+        name (str): "talib" or "numpy".
+
+    Raises:
+        ValueError: If the backend is unknown or not installed.
+    """
+    global _active
+    if name not in _BACKENDS:
+        raise ValueError(
+            f"⚠️ Indicator backend '{name}' is not available. Choose from {available()}."
+        )
+    _active = name
+
+
+def backend_name() -> str:
+    """
+    Return the name of the active backend.
+
+    Returns:
+        str: "talib" or "numpy".
+    """
+    return _active
+
+
+def get_backend():
+    """
+    Return the active backend module.
+
+    Both backends expose RSI, MACD, ATR, ADX and BBANDS with TA-Lib's signatures.
+
+    Returns:
+        module: talib or Indicators.numpy_backend.
+    """
+    return _BACKENDS[_active]
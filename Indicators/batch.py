@@ -0,0 +1,155 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from . import backend
+from .cache import IndicatorCache, cached, default_cache, fingerprint
+from .inputs import column, has_columns, row_count
+
+
+class IndicatorSpec(NamedTuple):
+    """
+    A declarative request for one indicator in a batch evaluation.
+
+    """
+
+    kind: str
+    params: tuple
+    label: str
+
+    def fields(self) -> tuple[str, ...]:
+        """
+        Return the output field names this spec produces.
+
+        Returns:
+            tuple[str, ...]: One name per output series.
+        """
+        suffixes = _OUTPUTS[self.kind]
+        return tuple(f"{self.label}{suffix}" for suffix in suffixes)
+
+
+# output suffixes per indicator kind, in the backend's return order
+_OUTPUTS = {
+    "RSI": ("",),
+    "ATR": ("",),
+    "ADX": ("",),
+    "MACD": ("", "_signal", "_hist"),
+    "BBANDS": ("_upper", "_middle", "_lower"),
+}
+
+# kinds computed from high/low/close rather than close only
+_RANGE_KINDS = ("ATR", "ADX")
+
+
+def _spec(kind: str, params: tuple, label: str | None) -> IndicatorSpec:
+    if label is None:
+        label = "_".join([kind.lower()] + [f"{p:g}" for p in params])
+    return IndicatorSpec(kind, params, label)
+
+
+def rsi(timeperiod: int = 14, label: str | None = None) -> IndicatorSpec:
+    """Spec for RSI; fields: '<label>'."""
+    return _spec("RSI", (timeperiod,), label)
+
+
+def atr(timeperiod: int = 14, label: str | None = None) -> IndicatorSpec:
+    """Spec for ATR; fields: '<label>'."""
+    return _spec("ATR", (timeperiod,), label)
+
+
+def adx(timeperiod: int = 14, label: str | None = None) -> IndicatorSpec:
+    """Spec for ADX; fields: '<label>'."""
+    return _spec("ADX", (timeperiod,), label)
+
+
+def macd(
+    fastperiod: int = 12,
+    slowperiod: int = 26,
+    signalperiod: int = 9,
+    label: str | None = None,
+) -> IndicatorSpec:
+    """Spec for MACD; fields: '<label>', '<label>_signal', '<label>_hist'."""
+    return _spec("MACD", (fastperiod, slowperiod, signalperiod), label)
+
+
+def bbands(
+    timeperiod: int = 20,
+    nbdevup: float = 2,
+    nbdevdn: float = 2,
+    matype: int = 0,
+    label: str | None = None,
+) -> IndicatorSpec:
+    """Spec for Bollinger Bands; fields: '<label>_upper', '<label>_middle', '<label>_lower'."""
+    return _spec("BBANDS", (timeperiod, nbdevup, nbdevdn, matype), label)
+
+
+def _evaluate(spec: IndicatorSpec, high, low, close, cache) -> tuple:
+    """Run one spec on the active backend (via the cache) and return its output arrays."""
+    func = getattr(backend.get_backend(), spec.kind)
+    inputs = (high, low, close) if spec.kind in _RANGE_KINDS else (close,)
+    result = cached(
+        cache,
+        (fingerprint(*inputs), spec.kind, spec.params, backend.backend_name()),
+        lambda: func(*inputs, *spec.params),
+    )
+    return result if isinstance(result, tuple) else (result,)
+
+
+def compute(
+    data, specs: list[IndicatorSpec], cache: IndicatorCache | None = default_cache
+) -> np.ndarray:
+    """
+    Evaluate several indicators over the same bars in one pass.
+
+    The input columns are converted once and shared by every spec, and each result
+    goes through the same cache as the indicator classes, so a strategy that calls
+    e.g. RSI.get_rsi() on the same bars afterwards gets a cache hit.
+
+    Args:
+        data: A DataFrame, a structured array straight from mt5.copy_rates_from_pos,
+            or a dict of arrays. 'close' is required; 'high' and 'low' are required
+            for ATR and ADX. A 'time' column is carried over when present.
+        specs (list[IndicatorSpec]): Indicators to compute, e.g.
+            [rsi(14), macd(6, 13, 5), adx(14), atr(14)].
+        cache (IndicatorCache | None, optional): Cache for the output arrays.
+            Defaults to the shared cache; None disables caching.
+
+    Returns:
+        np.ndarray: A structured (record) array with one row per bar and one float64
+        field per output series (see IndicatorSpec.fields), NaN during warm-up.
+
+    Raises:
+        ValueError: If a required column is missing, a spec kind is unknown or two
+            specs produce the same field name.
+    """
+    needs_range = any(spec.kind in _RANGE_KINDS for spec in specs)
+    required = ["high", "low", "close"] if needs_range else ["close"]
+    if not has_columns(data, required):
+        raise ValueError(f"⚠️ Missing columns {required}. Cannot compute indicators.")
+
+    close = column(data, "close")
+    high = column(data, "high") if needs_range else None
+    low = column(data, "low") if needs_range else None
+
+    fields = []
+    if has_columns(data, ["time"]):
+        time = np.asarray(data["time"])
+        fields.append(("time", time.dtype))
+    for spec in specs:
+        if spec.kind not in _OUTPUTS:
+            raise ValueError(f"⚠️ Unknown indicator kind: {spec.kind}")
+        fields.extend((name, np.float64) for name in spec.fields())
+
+    names = [name for name, _ in fields]
+    if len(set(names)) != len(names):
+        raise ValueError(f"⚠️ Duplicate indicator fields: {names}")
+
+    out = np.empty(row_count(data), dtype=fields)
+    if "time" in names:
+        out["time"] = time
+    for spec in specs:
+        for name, values in zip(
+            spec.fields(), _evaluate(spec, high, low, close, cache)
+        ):
+            out[name] = values
+    return out
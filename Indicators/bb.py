@@ -1,45 +1,95 @@
+import math
+
+import numpy as np
 import pandas as pd
-import talib
+
+from . import backend
+from .cache import IndicatorCache, cached, default_cache, fingerprint
+from .inputs import column, has_columns, row_count
+from .streaming import BBandsState, StreamHistory
 
 
 class BollingerBands:
     """
-    A wrapper class for calculating Bollinger Bands (BB) using TA-Lib.
+    A wrapper class for calculating Bollinger Bands (BB) using TA-Lib
+    (or the NumPy fallback backend, see Indicators/backend.py).
     """
 
     def __init__(
         self,
-        df: pd.DataFrame,
+        df: pd.DataFrame | np.ndarray,
         timeperiod: int = 20,
         nbdevup: float = 2,
         nbdevdn: float = 2,
         matype: int = 0,
+        cache: IndicatorCache | None = default_cache,
     ) -> None:
         """
         Initialize the Bollinger Bands calculator.
 
         Args:
-            df (pd.DataFrame): A DataFrame with a 'close' price column.
+            df (pd.DataFrame | np.ndarray): A DataFrame, a structured array straight from
+                mt5.copy_rates_from_pos, or a dict of arrays with a 'close' price column.
+                The data is referenced, never copied or modified.
             timeperiod (int, optional): The number of periods for moving average. Default is 20.
             nbdevup (float, optional): Number of standard deviations above the MA. Default is 2.
             nbdevdn (float, optional): Number of standard deviations below the MA. Default is 2.
             matype (int, optional): Type of moving average (0=SMA). Default is 0.
+            cache (IndicatorCache | None, optional): Cache for the full output arrays.
+                Defaults to the shared cache; None disables caching.
 
         Raises:
             ValueError: If the required 'close' column is not found in the input DataFrame.
         """
         self.required_col = "close"
-        self.df = df.copy()
+        self.df = df
         self.timeperiod = timeperiod
         self.nbdevup = nbdevup
         self.nbdevdn = nbdevdn
         self.matype = matype
+        self.cache = cache
+        self._state = None
+        self._history = None
 
-        if self.required_col not in self.df.columns:
+        if not has_columns(self.df, [self.required_col]):
             raise ValueError(
                 "⚠️ Missing column 'close'. Cannot compute Bollinger Bands."
             )
 
+    def update(self, bar, closed: bool = True) -> tuple:
+        """
+        Feed one bar into the streaming Bollinger Bands and return its value.
+
+        The first call seeds the window from the data given at construction, which
+        is treated as closed history. A bar passed with closed=False is evaluated without
+        being stored, so the forming bar can be re-evaluated on every tick. Once streaming,
+        get_bbands() reads from the stream. Only the SMA moving average (matype=0) is supported.
+
+        Args:
+            bar: A mapping (dict, pd.Series row or NumPy record) with a 'close' price.
+            closed (bool, optional): Commit the bar to the state. Default is True.
+
+        Returns:
+            tuple: (upper_band, middle_band, lower_band) rounded to 3 decimal places,
+            NaN during warm-up.
+
+        Raises:
+            ValueError: If matype is not 0 (SMA).
+        """
+        if self._state is None:
+            if self.matype != 0:
+                raise ValueError(
+                    "⚠️ Streaming Bollinger Bands only support matype=0 (SMA)."
+                )
+            self._state = BBandsState(self.timeperiod, self.nbdevup, self.nbdevdn)
+            self._history = StreamHistory()
+            for close in column(self.df, "close"):
+                self._history.push(self._state.update(float(close)), closed=True)
+
+        value = self._state.update(float(bar["close"]), commit=closed)
+        self._history.push(value, closed)
+        return tuple(round(v, 3) for v in value)
+
     def get_bbands(self) -> tuple:
         """
         Calculate and return the most recent Bollinger Bands (upper, middle, lower).
@@ -50,18 +100,34 @@ class BollingerBands:
         Raises:
             ValueError: If the DataFrame does not contain enough data to compute BB.
         """
-        if len(self.df) < self.timeperiod + 1:
+        if self._history is not None:
+            bands = self._history.tail(1)
+            if not bands or math.isnan(bands[-1][1]):
+                raise ValueError(
+                    f"⚠️ Insufficient data to calculate Bollinger Bands: At least {self.timeperiod} rows are needed."
+                )
+            upper, middle, lower = bands[-1]
+            return (round(upper, 3), round(middle, 3), round(lower, 3))
+
+        if row_count(self.df) < self.timeperiod + 1:
             raise ValueError(
                 f"⚠️ Insufficient data to calculate Bollinger Bands: At least {self.timeperiod + 1} rows are needed."
             )
 
-        upper, middle, lower = talib.BBANDS(
-            self.df["close"].to_numpy(),
-            timeperiod=self.timeperiod,
-            nbdevup=self.nbdevup,
-            nbdevdn=self.nbdevdn,
-            matype=self.matype,
-        )
+        close = column(self.df, "close")
+        params = (self.timeperiod, self.nbdevup, self.nbdevdn, self.matype)
+
+        def compute():
+            return backend.get_backend().BBANDS(
+                close,
+                timeperiod=self.timeperiod,
+                nbdevup=self.nbdevup,
+                nbdevdn=self.nbdevdn,
+                matype=self.matype,
+            )
+
+        key = (fingerprint(close), "BBANDS", params, backend.backend_name())
+        upper, middle, lower = cached(self.cache, key, compute)
 
         return (round(upper[-1], 3), round(middle[-1], 3), round(lower[-1], 3))
 
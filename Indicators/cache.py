@@ -0,0 +1,136 @@
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+import numpy as np
+
+
+# series up to this length also get a checksum of every value in their key
+_CHECKSUM_LENGTH = 16384
+
+
+def fingerprint(*arrays: np.ndarray) -> tuple:
+    """
+    Build a cheap identity key for a set of input series.
+
+    The key combines the length, the last two values and about 64 values sampled at
+    an even stride over each array, so it changes whenever a bar is appended or the
+    forming bar is updated, and series that only agree at their ends (a sliding
+    window over flat stretches) get different keys. Series of up to 16384 bars, such
+    as the live windows, also add the sum of all their values, so a bar corrected
+    anywhere in them changes the key; longer ones are only sampled, which keeps the
+    key at a few microseconds instead of a full pass over a strided column.
+
+    Args:
+        *arrays (np.ndarray): The input series (e.g. high, low, close).
+
+    Returns:
+        tuple: A hashable fingerprint of the series.
+    """
+    return tuple(
+        (
+            len(a),
+            a[-2:].tobytes(),
+            a[:: max(1, len(a) // 64)].tobytes(),
+            float(np.sum(a)) if len(a) <= _CHECKSUM_LENGTH else None,
+        )
+        for a in arrays
+    )
+
+
+class IndicatorCache:
+    """
+    A bounded LRU cache of full indicator output arrays.
+
+    Keys are (series fingerprint, indicator name, parameters, backend); values are the
+    arrays returned by the backend, marked read-only so callers cannot corrupt a cached entry.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize (int, optional): Maximum number of entries kept. Default is 128.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: tuple, compute: Callable):
+        """
+        Return the cached result for key, computing and storing it on a miss.
+
+        Args:
+            key (tuple): Cache key, usually (fingerprint, name, params, backend).
+            compute (Callable): Zero-argument function producing the result.
+
+        Returns:
+            The cached or freshly computed array (or tuple of arrays).
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        result = compute()
+        for arr in result if isinstance(result, tuple) else (result,):
+            arr.flags.writeable = False
+
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def stats(self) -> dict:
+        """
+        Return the cache counters for monitoring.
+
+        Returns:
+            dict: hits, misses, hit_rate, size and maxsize.
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self) -> None:
+        """
+        Drop all entries and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def cached(cache: IndicatorCache | None, key: tuple, compute: Callable):
+    """
+    Look key up in cache, or just compute when caching is disabled.
+
+    Args:
+        cache (IndicatorCache | None): The cache to use, or None.
+        key (tuple): Cache key, usually (fingerprint, name, params, backend).
+        compute (Callable): Zero-argument function producing the result.
+
+    Returns:
+        The cached or freshly computed result.
+    """
+    if cache is None:
+        return compute()
+    return cache.get_or_compute(key, compute)
+
+
+# shared by all indicator classes unless another cache is passed in
+default_cache = IndicatorCache()
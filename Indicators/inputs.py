@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+
+
+def column_names(data) -> tuple:
+    """
+    Return the column names of a supported OHLCV container.
+
+    Args:
+        data: A pd.DataFrame, a structured NumPy array (e.g. straight from
+            mt5.copy_rates_from_pos) or a dict of arrays.
+
+    Returns:
+        tuple: The available column names.
+    """
+    if isinstance(data, pd.DataFrame):
+        return tuple(data.columns)
+    if isinstance(data, np.ndarray):
+        return data.dtype.names or ()
+    return tuple(data.keys())
+
+
+def has_columns(data, names) -> bool:
+    """
+    Check whether all of the given columns are present.
+
+    Args:
+        data: A supported OHLCV container (see column_names).
+        names: Iterable of required column names.
+
+    Returns:
+        bool: True if every column is present.
+    """
+    available = column_names(data)
+    return all(name in available for name in names)
+
+
+def row_count(data) -> int:
+    """
+    Return the number of bars in a supported OHLCV container.
+
+    Args:
+        data: A supported OHLCV container (see column_names).
+
+    Returns:
+        int: The number of rows.
+    """
+    if isinstance(data, (pd.DataFrame, np.ndarray)):
+        return len(data)
+    return len(next(iter(data.values()), ()))
+
+
+def column(data, name: str) -> np.ndarray:
+    """
+    Return one column as a read-only float64 array, without copying when possible.
+
+    DataFrame columns and structured array fields that are already float64 are
+    returned as views. The returned array is flagged read-only so indicator code
+    can never write through it into the caller's data; the caller's own array keeps
+    its flags.
+
+    Args:
+        data: A supported OHLCV container (see column_names).
+        name (str): The column to extract.
+
+    Returns:
+        np.ndarray: A read-only float64 array.
+    """
+    if isinstance(data, pd.DataFrame):
+        values = data[name].to_numpy(dtype=np.float64, copy=False)
+    else:
+        values = np.asarray(data[name], dtype=np.float64)
+
+    values = values.view()
+    values.flags.writeable = False
+    return values
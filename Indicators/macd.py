@@ -1,40 +1,83 @@
+import math
+
+import numpy as np
 import pandas as pd
-import talib
+
+from . import backend
+from .cache import IndicatorCache, cached, default_cache, fingerprint
+from .inputs import column, has_columns, row_count
+from .streaming import MACDState, StreamHistory
 
 
 class MACD:
     """
-    A wrapper for calculating the MACD (Moving Average Convergence Divergence) using TA-Lib.
+    A wrapper for calculating the MACD (Moving Average Convergence Divergence) using TA-Lib
+    (or the NumPy fallback backend, see Indicators/backend.py).
 
     """
 
     def __init__(
         self,
-        df: pd.DataFrame,
+        df: pd.DataFrame | np.ndarray,
         fastperiod: int = 12,
         slowperiod: int = 26,
         signalperiod: int = 9,
+        cache: IndicatorCache | None = default_cache,
     ):
         """
         Initialize the MACD calculator.
 
         Args:
-            df (pd.DataFrame): A DataFrame with a 'close' price column.
+            df (pd.DataFrame | np.ndarray): A DataFrame, a structured array straight from
+                mt5.copy_rates_from_pos, or a dict of arrays with a 'close' price column.
+                The data is referenced, never copied or modified.
             fastperiod (int): Fast EMA period. Default is 12.
             slowperiod (int): Slow EMA period. Default is 26.
             signalperiod (int): Signal line EMA period. Default is 9.
+            cache (IndicatorCache | None, optional): Cache for the full output arrays.
+                Defaults to the shared cache; None disables caching.
 
         Raises:
             ValueError: If the 'close' column is not found in the DataFrame.
         """
-        self.df = df.copy()
+        self.df = df
         self.fastperiod = fastperiod
         self.slowperiod = slowperiod
         self.signalperiod = signalperiod
+        self.cache = cache
+        self._state = None
+        self._history = None
 
-        if "close" not in self.df.columns:
+        if not has_columns(self.df, ["close"]):
             raise ValueError("⚠️ Missing columns 'close'. Cannot compute MACD.")
 
+    def update(self, bar, closed: bool = True) -> tuple[float, float, float]:
+        """
+        Feed one bar into the streaming MACD and return its value in O(1).
+
+        The first call seeds the EMA states from the data given at construction,
+        which is treated as closed history. A bar passed with closed=False is evaluated
+        without being stored, so the forming bar can be re-evaluated on every tick.
+        Once streaming, get_macd() and the crossover checks read from the stream.
+
+        Args:
+            bar: A mapping (dict, pd.Series row or NumPy record) with a 'close' price.
+            closed (bool, optional): Commit the bar to the state. Default is True.
+
+        Returns:
+            tuple[float, float, float]: (macd, signal, histogram) rounded to 3 decimal places,
+            NaN during warm-up.
+        """
+        if self._state is None:
+            self._state = MACDState(self.fastperiod, self.slowperiod, self.signalperiod)
+            self._history = StreamHistory()
+            for close in column(self.df, "close"):
+                self._history.push(self._state.update(float(close)), closed=True)
+
+        value = self._state.update(float(bar["close"]), commit=closed)
+        self._history.push(value, closed)
+        return tuple(round(v, 3) for v in value)
+
     def get_macd(self, recent_n: int = 3) -> list[tuple[float, float, float]]:
         """
         Compute the MACD line, signal line, and histogram.
@@ -48,17 +91,35 @@ class MACD:
         Raises:
             ValueError: If insufficient data is available to compute MACD.
         """
-        if len(self.df) < self.slowperiod + recent_n:
+        if self._history is not None:
+            macd_list = self._history.tail(recent_n)
+            if len(macd_list) < recent_n or any(math.isnan(v[-1]) for v in macd_list):
+                raise ValueError(
+                    f"⚠️ Insufficient data to calulate MACD. At least {self.slowperiod + recent_n} rows are needed."
+                )
+            return [
+                (round(float(m), 3), round(float(s), 3), round(float(h), 3))
+                for m, s, h in macd_list
+            ]
+
+        if row_count(self.df) < self.slowperiod + recent_n:
             raise ValueError(
                 f"⚠️ Insufficient data to calulate MACD. At least {self.slowperiod + recent_n} rows are needed."
             )
 
-        macd, signal, hist = talib.MACD(
-            self.df["close"].to_numpy(),
-            fastperiod=self.fastperiod,
-            slowperiod=self.slowperiod,
-            signalperiod=self.signalperiod,
-        )
+        close = column(self.df, "close")
+        params = (self.fastperiod, self.slowperiod, self.signalperiod)
+
+        def compute():
+            return backend.get_backend().MACD(
+                close,
+                fastperiod=self.fastperiod,
+                slowperiod=self.slowperiod,
+                signalperiod=self.signalperiod,
+            )
+
+        key = (fingerprint(close), "MACD", params, backend.backend_name())
+        macd, signal, hist = cached(self.cache, key, compute)
 
         return [
             (round(float(m), 3), round(float(s), 3), round(float(h), 3))
@@ -0,0 +1,244 @@
+"""
+Pure-NumPy implementations of the TA-Lib functions used by the Indicators package.
+
+The functions mirror TA-Lib's signatures, seeding and NaN lookback layout so they can
+stand in for `talib` when it is not installed. Wilder and EMA smoothing are first-order
+linear recurrences, evaluated block-wise by `linear_filter` so the work stays in NumPy.
+All functions operate on the last axis, so 2-D (symbols x bars) input is supported.
+"""
+
+import numpy as np
+
+# rows per chunk when materializing sliding windows
+_WINDOW_CHUNK = 65536
+
+
+def _block_size(decay: np.ndarray) -> int:
+    """Largest block for which decay**-block stays far from float64 overflow."""
+    # zero decays restart the recurrence instead of entering the products
+    positive = decay[decay > 0.0]
+    smallest = float(np.min(positive)) if positive.size else 1.0
+    if smallest >= 1.0:
+        return 256
+    return int(max(1, min(256, 150 / -np.log10(smallest))))
+
+
+def linear_filter(x: np.ndarray, decay, initial=0.0) -> np.ndarray:
+    """
+    Evaluate y[t] = decay[t] * y[t-1] + x[t] along the last axis.
+
+    Within a block of B values the recurrence is solved in closed form with a
+    cumulative product/sum; only the carry between blocks is propagated in Python,
+    so a 1M-bar series needs a few thousand scalar steps instead of a million. A zero
+    decay (a period-1 average) restarts the recurrence: y[t] = x[t].
+
+    Args:
+        x (np.ndarray): Input values, shape (..., n).
+        decay (float | np.ndarray): Decay factor(s) in [0, 1], broadcastable to x.
+        initial (float | np.ndarray, optional): y[-1], broadcastable to x.shape[:-1].
+
+    Returns:
+        np.ndarray: The filtered values, same shape as x.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    lead, n = x.shape[:-1], x.shape[-1]
+    decay = np.broadcast_to(np.asarray(decay, dtype=np.float64), x.shape)
+    carry = np.array(np.broadcast_to(np.asarray(initial, dtype=np.float64), lead))
+    if n == 0:
+        return x.copy()
+
+    block = _block_size(decay)
+    blocks = -(-n // block)
+    pad = blocks * block - n
+    if pad:
+        widths = [(0, 0)] * len(lead) + [(0, pad)]
+        x = np.pad(x, widths)
+        decay = np.pad(decay, widths, constant_values=1.0)
+
+    xb = x.reshape(lead + (blocks, block))
+    decay = decay.reshape(lead + (blocks, block))
+    zero = decay == 0.0
+    growth = np.cumprod(np.where(zero, 1.0, decay), axis=-1)
+    sums = np.cumsum(xb / growth, axis=-1)
+    if zero.any():
+        # after a restart only the inputs from it onwards count, and no carry
+        last = np.maximum.accumulate(np.where(zero, np.arange(block), -1), axis=-1)
+        dropped = np.take_along_axis(sums, np.maximum(last - 1, 0), axis=-1)
+        sums = sums - np.where(last > 0, dropped, 0.0)
+        local = sums * growth
+        growth = np.where(last >= 0, 0.0, growth)
+    else:
+        local = sums * growth
+
+    out = np.empty_like(local)
+    for j in range(blocks):
+        out[..., j, :] = local[..., j, :] + growth[..., j, :] * carry[..., None]
+        carry = out[..., j, -1]
+    return out.reshape(lead + (blocks * block,))[..., :n]
+
+
+def _nan_like(x: np.ndarray) -> np.ndarray:
+    return np.full(x.shape, np.nan)
+
+
+def _ema(x: np.ndarray, period: int, seed_end: int) -> np.ndarray:
+    """EMA seeded with the SMA of the `period` values ending at index seed_end."""
+    out = _nan_like(x)
+    if seed_end >= x.shape[-1]:
+        return out
+    k = 2.0 / (period + 1)
+    seed = x[..., seed_end - period + 1 : seed_end + 1].mean(axis=-1)
+    out[..., seed_end] = seed
+    out[..., seed_end + 1 :] = linear_filter(k * x[..., seed_end + 1 :], 1.0 - k, seed)
+    return out
+
+
+def _wilder(x: np.ndarray, period: int, seed_end: int, seed: np.ndarray) -> np.ndarray:
+    """Wilder average (x/period smoothing) continuing from seed at index seed_end."""
+    out = _nan_like(x)
+    if seed_end >= x.shape[-1]:
+        return out
+    out[..., seed_end] = seed
+    out[..., seed_end + 1 :] = linear_filter(
+        x[..., seed_end + 1 :] / period, (period - 1) / period, seed
+    )
+    return out
+
+
+def _true_range(high, low, close) -> np.ndarray:
+    """True range with NaN on the first bar, as TA-Lib's TRANGE."""
+    prev_close = close[..., :-1]
+    tr = _nan_like(close)
+    tr[..., 1:] = np.maximum.reduce(
+        [
+            high[..., 1:] - low[..., 1:],
+            np.abs(prev_close - high[..., 1:]),
+            np.abs(prev_close - low[..., 1:]),
+        ]
+    )
+    return tr
+
+
+def RSI(close, timeperiod: int = 14) -> np.ndarray:
+    """Relative Strength Index, matching talib.RSI."""
+    close = np.asarray(close, dtype=np.float64)
+    n = timeperiod
+    if close.shape[-1] <= n:
+        return _nan_like(close)
+
+    diff = np.zeros_like(close)
+    diff[..., 1:] = np.diff(close, axis=-1)
+    gain = np.maximum(diff, 0.0)
+    loss = np.maximum(-diff, 0.0)
+
+    avg_gain = _wilder(gain, n, n, gain[..., 1 : n + 1].sum(axis=-1) / n)
+    avg_loss = _wilder(loss, n, n, loss[..., 1 : n + 1].sum(axis=-1) / n)
+    total = avg_gain + avg_loss
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = np.where(total == 0.0, 0.0, 100.0 * (avg_gain / total))
+    rsi[..., :n] = np.nan
+    return rsi
+
+
+def MACD(
+    close, fastperiod: int = 12, slowperiod: int = 26, signalperiod: int = 9
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD line, signal and histogram, matching talib.MACD."""
+    close = np.asarray(close, dtype=np.float64)
+    if slowperiod < fastperiod:
+        fastperiod, slowperiod = slowperiod, fastperiod
+    start = slowperiod - 1
+    lookback = start + signalperiod - 1
+    if close.shape[-1] <= lookback:
+        return _nan_like(close), _nan_like(close), _nan_like(close)
+
+    macd = _ema(close, fastperiod, start) - _ema(close, slowperiod, start)
+    signal = _nan_like(close)
+    signal[..., start:] = _ema(macd[..., start:], signalperiod, signalperiod - 1)
+    macd[..., :lookback] = np.nan
+    return macd, signal, macd - signal
+
+
+def ATR(high, low, close, timeperiod: int = 14) -> np.ndarray:
+    """Average True Range, matching talib.ATR."""
+    high, low, close = (np.asarray(a, dtype=np.float64) for a in (high, low, close))
+    n = timeperiod
+    if close.shape[-1] <= n:
+        return _nan_like(close)
+
+    tr = _true_range(high, low, close)
+    return _wilder(tr, n, n, tr[..., 1 : n + 1].sum(axis=-1) / n)
+
+
+def ADX(high, low, close, timeperiod: int = 14) -> np.ndarray:
+    """Average Directional Index, matching talib.ADX."""
+    high, low, close = (np.asarray(a, dtype=np.float64) for a in (high, low, close))
+    n = timeperiod
+    lookback = 2 * n - 1
+    if close.shape[-1] <= lookback:
+        return _nan_like(close)
+
+    diff_p = np.zeros_like(high)
+    diff_m = np.zeros_like(low)
+    diff_p[..., 1:] = high[..., 1:] - high[..., :-1]
+    diff_m[..., 1:] = low[..., :-1] - low[..., 1:]
+    minus_dm = np.where((diff_m > 0) & (diff_p < diff_m), diff_m, 0.0)
+    plus_dm = np.where((diff_p > 0) & (diff_p > diff_m), diff_p, 0.0)
+    tr = _true_range(high, low, close)
+    tr[..., 0] = 0.0
+
+    # Wilder running sums, seeded with the plain sum of the first n-1 moves
+    decay = 1.0 - 1.0 / n
+    sums = []
+    for values in (plus_dm, minus_dm, tr):
+        seed = values[..., 1:n].sum(axis=-1)
+        sums.append(linear_filter(values[..., n:], decay, seed))
+    plus_sum, minus_sum, tr_sum = sums
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        plus_di = 100.0 * (plus_sum / tr_sum)
+        minus_di = 100.0 * (minus_sum / tr_sum)
+        di_total = minus_di + plus_di
+        dx = 100.0 * (np.abs(minus_di - plus_di) / di_total)
+    valid = (tr_sum != 0.0) & (di_total != 0.0)
+    dx = np.where(valid, dx, 0.0)
+
+    adx = _nan_like(close)
+    seed = dx[..., :n].sum(axis=-1) / n
+    adx[..., lookback] = seed
+    # bars without a valid DX carry the previous ADX forward unchanged
+    tail_valid = valid[..., n:]
+    adx[..., lookback + 1 :] = linear_filter(
+        np.where(tail_valid, dx[..., n:] / n, 0.0),
+        np.where(tail_valid, decay, 1.0),
+        seed,
+    )
+    return adx
+
+
+def BBANDS(
+    close,
+    timeperiod: int = 20,
+    nbdevup: float = 2,
+    nbdevdn: float = 2,
+    matype: int = 0,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bollinger Bands over an SMA, matching talib.BBANDS with matype=0."""
+    if matype != 0:
+        raise ValueError("⚠️ The NumPy backend only supports matype=0 (SMA).")
+    close = np.asarray(close, dtype=np.float64)
+    n = timeperiod
+    middle = _nan_like(close)
+    stddev = _nan_like(close)
+    if close.shape[-1] < n:
+        return middle.copy(), middle, middle.copy()
+
+    windows = np.lib.stride_tricks.sliding_window_view(close, n, axis=-1)
+    for start in range(0, windows.shape[-2], _WINDOW_CHUNK):
+        chunk = windows[..., start : start + _WINDOW_CHUNK, :]
+        mean = chunk.mean(axis=-1)
+        middle[..., n - 1 + start : n - 1 + start + mean.shape[-1]] = mean
+        stddev[..., n - 1 + start : n - 1 + start + mean.shape[-1]] = np.sqrt(
+            ((chunk - mean[..., None]) ** 2).mean(axis=-1)
+        )
+    return middle + stddev * nbdevup, middle, middle - stddev * nbdevdn
@@ -1,5 +1,12 @@
+import math
+
+import numpy as np
 import pandas as pd
-import talib
+
+from . import backend
+from .cache import IndicatorCache, cached, default_cache, fingerprint
+from .inputs import column, has_columns, row_count
+from .streaming import RSIState, StreamHistory
 
 
 class RSI:
@@ -8,25 +15,63 @@ class RSI:
 
     """
 
-    def __init__(self, df: pd.DataFrame, timeperiod: int = 14) -> None:
+    def __init__(
+        self,
+        df: pd.DataFrame | np.ndarray,
+        timeperiod: int = 14,
+        cache: IndicatorCache | None = default_cache,
+    ) -> None:
         """
         Initialize the RSI calculator.
 
         Args:
-            df (pd.DataFrame): A DataFrame with 'close' price column.
+            df (pd.DataFrame | np.ndarray): A DataFrame, a structured array straight from
+                mt5.copy_rates_from_pos, or a dict of arrays with a 'close' price column.
+                The data is referenced, never copied or modified.
             timeperiod (int, optional): Period length for RSI calculation. Default is 14.
+            cache (IndicatorCache | None, optional): Cache for the full output arrays.
+                Defaults to the shared cache; None disables caching.
 
         Raises:
             ValueError: If the required column is not found in the DataFrame.
         """
         self.df = df
         self.timeperiod = timeperiod
+        self.cache = cache
+        self._state = None
+        self._history = None
 
-        if "close" not in df.columns:
+        if not has_columns(self.df, ["close"]):
             raise ValueError(
                 "⚠️ Missing 'close' column in the DataFrame. Cannot compute RSI."
             )
 
+    def update(self, bar, closed: bool = True) -> float:
+        """
+        Feed one bar into the streaming RSI and return its value in O(1).
+
+        The first call seeds the Wilder state from the data given at construction,
+        which is treated as closed history. A bar passed with closed=False is evaluated
+        against the committed state without being stored, so the forming bar can be
+        re-evaluated on every tick. Once streaming, get_rsi() reads from the stream.
+
+        Args:
+            bar: A mapping (dict, pd.Series row or NumPy record) with a 'close' price.
+            closed (bool, optional): Commit the bar to the state. Default is True.
+
+        Returns:
+            float: The RSI value for the bar (rounded to 3 decimal places), NaN during warm-up.
+        """
+        if self._state is None:
+            self._state = RSIState(self.timeperiod)
+            self._history = StreamHistory()
+            for close in column(self.df, "close"):
+                self._history.push(self._state.update(float(close)), closed=True)
+
+        value = self._state.update(float(bar["close"]), commit=closed)
+        self._history.push(value, closed)
+        return round(value, 3)
+
     def get_rsi(self, recent_n: int = 3) -> list[float]:
         """
         Calculates the RSI value.
@@ -39,12 +84,26 @@ class RSI:
          Raises:
             ValueError: If insufficient data is available to compute RSI.
         """
-        if len(self.df) < self.timeperiod + recent_n:
+        if self._history is not None:
+            rsi_array = self._history.tail(recent_n)
+            if len(rsi_array) < recent_n or any(map(math.isnan, rsi_array)):
+                raise ValueError(
+                    f"⚠️ Insufficient data to calculate RSI: At least {self.timeperiod + recent_n} rows are needed."
+                )
+            return list(round(float(val), 3) for val in rsi_array)
+
+        if row_count(self.df) < self.timeperiod + recent_n:
             raise ValueError(
                 f"⚠️ Insufficient data to calculate RSI: At least {self.timeperiod + recent_n} rows are needed."
             )
 
-        rsi_array = talib.RSI(self.df["close"].to_numpy(), timeperiod=self.timeperiod)
+        close = column(self.df, "close")
+
+        def compute():
+            return backend.get_backend().RSI(close, timeperiod=self.timeperiod)
+
+        key = (fingerprint(close), "RSI", (self.timeperiod,), backend.backend_name())
+        rsi_array = cached(self.cache, key, compute)
         return list(round(float(val), 3) for val in rsi_array[-1 * recent_n :])
 
     def is_overbought(self, threshold: float = 70):
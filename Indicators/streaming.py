@@ -0,0 +1,434 @@
+import math
+from collections import deque
+
+
+def _is_zero(value: float) -> bool:
+    """Mirror TA-Lib's TA_IS_ZERO test (an exact zero check in TA-Lib 0.6)."""
+    return value == 0.0
+
+
+def _true_range(high: float, low: float, prev_close: float) -> float:
+    """True range computed in the same operation order as TA-Lib."""
+    greatest = high - low
+    value = abs(prev_close - high)
+    if value > greatest:
+        greatest = value
+    value = abs(prev_close - low)
+    if value > greatest:
+        greatest = value
+    return greatest
+
+
+class EMAState:
+    """
+    Incremental exponential moving average seeded with an SMA, as TA-Lib does.
+
+    """
+
+    def __init__(self, timeperiod: int) -> None:
+        """
+        Initialize the EMA state.
+
+        Args:
+            timeperiod (int): Period length of the EMA.
+        """
+        self.timeperiod = timeperiod
+        self.k = 2.0 / (timeperiod + 1)
+        self.count = 0
+        self.total = 0.0
+        self.value = math.nan
+
+    def update(self, value: float, commit: bool = True) -> float:
+        """
+        Feed one value and return the EMA, or NaN while warming up.
+
+        Args:
+            value (float): The new input value.
+            commit (bool, optional): Store the new state. Default is True.
+
+        Returns:
+            float: The EMA after this value.
+        """
+        total = self.total
+        if self.count < self.timeperiod:
+            total += value
+            ema = (
+                total / self.timeperiod
+                if self.count + 1 == self.timeperiod
+                else math.nan
+            )
+        else:
+            ema = ((value - self.value) * self.k) + self.value
+
+        if commit:
+            self.count += 1
+            self.total = total
+            self.value = ema
+        return ema
+
+
+class RSIState:
+    """
+    Incremental RSI using Wilder smoothing.
+
+    """
+
+    def __init__(self, timeperiod: int = 14) -> None:
+        """
+        Initialize the RSI state.
+
+        Args:
+            timeperiod (int, optional): Period length for RSI calculation. Default is 14.
+        """
+        self.timeperiod = timeperiod
+        self.count = 0
+        self.prev_close = math.nan
+        self.gain = 0.0
+        self.loss = 0.0
+
+    def update(self, close: float, commit: bool = True) -> float:
+        """
+        Feed one close price and return the RSI, or NaN while warming up.
+
+        Args:
+            close (float): Close price of the bar.
+            commit (bool, optional): Store the new state. Default is True.
+
+        Returns:
+            float: The RSI for this bar.
+        """
+        n = self.timeperiod
+        gain, loss = self.gain, self.loss
+        rsi = math.nan
+
+        if self.count > 0:
+            diff = close - self.prev_close
+            if self.count > n:
+                loss *= n - 1
+                gain *= n - 1
+            if diff < 0:
+                loss -= diff
+            else:
+                gain += diff
+            if self.count >= n:
+                loss /= n
+                gain /= n
+                total = gain + loss
+                rsi = 100.0 * (gain / total) if not _is_zero(total) else 0.0
+
+        if commit:
+            self.count += 1
+            self.prev_close = close
+            self.gain, self.loss = gain, loss
+        return rsi
+
+
+class MACDState:
+    """
+    Incremental MACD (EMA based), aligned with TA-Lib's seeding of both EMAs.
+
+    """
+
+    def __init__(
+        self, fastperiod: int = 12, slowperiod: int = 26, signalperiod: int = 9
+    ) -> None:
+        """
+        Initialize the MACD state.
+
+        Args:
+            fastperiod (int): Fast EMA period. Default is 12.
+            slowperiod (int): Slow EMA period. Default is 26.
+            signalperiod (int): Signal line EMA period. Default is 9.
+        """
+        if slowperiod < fastperiod:
+            fastperiod, slowperiod = slowperiod, fastperiod
+        self.count = 0
+        self.fast_offset = slowperiod - fastperiod
+        self.fast = EMAState(fastperiod)
+        self.slow = EMAState(slowperiod)
+        self.signal = EMAState(signalperiod)
+
+    def update(self, close: float, commit: bool = True) -> tuple[float, float, float]:
+        """
+        Feed one close price and return (macd, signal, histogram).
+
+        Args:
+            close (float): Close price of the bar.
+            commit (bool, optional): Store the new state. Default is True.
+
+        Returns:
+            tuple[float, float, float]: NaN values while warming up.
+        """
+        slow = self.slow.update(close, commit)
+        fast = (
+            self.fast.update(close, commit)
+            if self.count >= self.fast_offset
+            else math.nan
+        )
+        if commit:
+            self.count += 1
+
+        if math.isnan(slow):
+            return (math.nan, math.nan, math.nan)
+
+        macd = fast - slow
+        signal = self.signal.update(macd, commit)
+        if math.isnan(signal):
+            return (math.nan, math.nan, math.nan)
+        return (macd, signal, macd - signal)
+
+
+class ATRState:
+    """
+    Incremental ATR using Wilder smoothing of the true range.
+
+    """
+
+    def __init__(self, timeperiod: int = 14) -> None:
+        """
+        Initialize the ATR state.
+
+        Args:
+            timeperiod (int, optional): Period length for ATR calculation. Default is 14.
+        """
+        self.timeperiod = timeperiod
+        self.count = 0
+        self.prev_close = math.nan
+        self.value = 0.0
+
+    def update(
+        self, high: float, low: float, close: float, commit: bool = True
+    ) -> float:
+        """
+        Feed one bar and return the ATR, or NaN while warming up.
+
+        Args:
+            high (float): High price of the bar.
+            low (float): Low price of the bar.
+            close (float): Close price of the bar.
+            commit (bool, optional): Store the new state. Default is True.
+
+        Returns:
+            float: The ATR for this bar.
+        """
+        n = self.timeperiod
+        value = self.value
+        atr = math.nan
+
+        if self.count > 0:
+            tr = _true_range(high, low, self.prev_close)
+            if self.count > n:
+                value *= n - 1
+                value += tr
+                value /= n
+                atr = value
+            else:
+                value += tr
+                if self.count == n:
+                    value /= n
+                    atr = value
+
+        if commit:
+            self.count += 1
+            self.prev_close = close
+            self.value = value
+        return atr
+
+
+class ADXState:
+    """
+    Incremental ADX following TA-Lib's directional movement recurrences.
+
+    """
+
+    def __init__(self, timeperiod: int = 14) -> None:
+        """
+        Initialize the ADX state.
+
+        Args:
+            timeperiod (int, optional): Period length for ADX calculation. Default is 14.
+        """
+        self.timeperiod = timeperiod
+        self.count = 0
+        self.prev_high = math.nan
+        self.prev_low = math.nan
+        self.prev_close = math.nan
+        self.plus_dm = 0.0
+        self.minus_dm = 0.0
+        self.tr = 0.0
+        self.sum_dx = 0.0
+        self.adx = math.nan
+
+    def update(
+        self, high: float, low: float, close: float, commit: bool = True
+    ) -> float:
+        """
+        Feed one bar and return the ADX, or NaN while warming up.
+
+        Args:
+            high (float): High price of the bar.
+            low (float): Low price of the bar.
+            close (float): Close price of the bar.
+            commit (bool, optional): Store the new state. Default is True.
+
+        Returns:
+            float: The ADX for this bar.
+        """
+        n = self.timeperiod
+        plus_dm, minus_dm, tr = self.plus_dm, self.minus_dm, self.tr
+        sum_dx, adx = self.sum_dx, self.adx
+        result = math.nan
+
+        if self.count > 0:
+            diff_p = high - self.prev_high
+            diff_m = self.prev_low - low
+            if self.count >= n:
+                minus_dm -= minus_dm / n
+                plus_dm -= plus_dm / n
+            if diff_m > 0 and diff_p < diff_m:
+                minus_dm += diff_m
+            elif diff_p > 0 and diff_p > diff_m:
+                plus_dm += diff_p
+            true_range = _true_range(high, low, self.prev_close)
+            if self.count >= n:
+                tr = tr - (tr / n) + true_range
+            else:
+                tr += true_range
+
+            if self.count >= n:
+                dx = math.nan
+                if not _is_zero(tr):
+                    minus_di = 100.0 * (minus_dm / tr)
+                    plus_di = 100.0 * (plus_dm / tr)
+                    di_sum = minus_di + plus_di
+                    if not _is_zero(di_sum):
+                        dx = 100.0 * (abs(minus_di - plus_di) / di_sum)
+
+                if self.count < 2 * n - 1:
+                    if not math.isnan(dx):
+                        sum_dx += dx
+                elif self.count == 2 * n - 1:
+                    if not math.isnan(dx):
+                        sum_dx += dx
+                    adx = sum_dx / n
+                    result = adx
+                else:
+                    if not math.isnan(dx):
+                        adx = ((adx * (n - 1)) + dx) / n
+                    result = adx
+
+        if commit:
+            self.count += 1
+            self.prev_high, self.prev_low, self.prev_close = high, low, close
+            self.plus_dm, self.minus_dm, self.tr = plus_dm, minus_dm, tr
+            self.sum_dx, self.adx = sum_dx, adx
+        return result
+
+
+class BBandsState:
+    """
+    Incremental Bollinger Bands over an SMA of the last `timeperiod` closes.
+
+    """
+
+    def __init__(
+        self, timeperiod: int = 20, nbdevup: float = 2, nbdevdn: float = 2
+    ) -> None:
+        """
+        Initialize the Bollinger Bands state.
+
+        Args:
+            timeperiod (int, optional): The number of periods for moving average. Default is 20.
+            nbdevup (float, optional): Number of standard deviations above the MA. Default is 2.
+            nbdevdn (float, optional): Number of standard deviations below the MA. Default is 2.
+        """
+        self.timeperiod = timeperiod
+        self.nbdevup = nbdevup
+        self.nbdevdn = nbdevdn
+        self.window = deque(maxlen=timeperiod - 1)
+        self.total = 0.0
+
+    def update(self, close: float, commit: bool = True) -> tuple[float, float, float]:
+        """
+        Feed one close price and return (upper, middle, lower).
+
+        The deviation is taken over the window in two passes, which keeps it accurate on
+        large price levels where a running sum of squares loses precision.
+
+        Args:
+            close (float): Close price of the bar.
+            commit (bool, optional): Store the new state. Default is True.
+
+        Returns:
+            tuple[float, float, float]: NaN values while warming up.
+        """
+        n = self.timeperiod
+        total = self.total + close
+
+        if len(self.window) < n - 1:
+            if commit:
+                self.window.append(close)
+                self.total = total
+            return (math.nan, math.nan, math.nan)
+
+        middle = total / n
+        variance = (close - middle) ** 2
+        for value in self.window:
+            variance += (value - middle) ** 2
+        stddev = math.sqrt(variance / n)
+
+        if commit:
+            oldest = self.window[0] if self.window else close
+            self.window.append(close)
+            self.total = total - oldest
+        return (
+            middle + stddev * self.nbdevup,
+            middle,
+            middle - stddev * self.nbdevdn,
+        )
+
+
+class StreamHistory:
+    """
+    Bounded history of streamed indicator values plus the still-forming bar.
+
+    """
+
+    def __init__(self, maxlen: int = 256) -> None:
+        """
+        Initialize the history.
+
+        Args:
+            maxlen (int, optional): Number of committed values to keep. Default is 256.
+        """
+        self.values = deque(maxlen=maxlen)
+        self.forming = None
+
+    def push(self, value, closed: bool) -> None:
+        """
+        Record a value for a closed bar, or replace the forming bar's value.
+
+        Args:
+            value: The indicator value for the bar.
+            closed (bool): Whether the bar was committed to the state.
+        """
+        if closed:
+            self.values.append(value)
+            self.forming = None
+        else:
+            self.forming = value
+
+    def tail(self, recent_n: int) -> list:
+        """
+        Return the most recent values, ending with the forming bar if any.
+
+        Args:
+            recent_n (int): Number of values to return.
+
+        Returns:
+            list: Up to recent_n values, oldest first.
+        """
+        values = list(self.values)
+        if self.forming is not None:
+            values.append(self.forming)
+        return values[-recent_n:]
@@ -0,0 +1,273 @@
+"""
+Vectorized indicator sweeps over many symbols and parameter sets at once.
+
+Inputs are (symbols x bars) matrices; every parameter set becomes a leading axis, so
+a whole universe scan is one (params x symbols x bars) NumPy computation instead of
+one indicator object per symbol and parameter set. Seeding follows TA-Lib, so each
+slice matches the single-series backends to floating-point tolerance.
+"""
+
+import itertools
+
+import numpy as np
+
+from . import batch
+from .inputs import column, has_columns
+from .numpy_backend import BBANDS, linear_filter
+
+
+def _staged_filter(
+    x: np.ndarray,
+    starts: np.ndarray,
+    seed_lengths: np.ndarray,
+    seed_scales: np.ndarray,
+    decays: np.ndarray,
+    input_scales: np.ndarray,
+    hold: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Run a seeded first-order smoothing for every parameter set in one filter pass.
+
+    For parameter set p and bar t:
+        t <  starts[p]                          -> y = 0 (not yet started)
+        starts[p] <= t < starts[p] + seed_len   -> y += x * seed_scales[p] (seed sum/mean)
+        afterwards                              -> y = decays[p] * y + x * input_scales[p]
+    Where `hold` is set the value is carried forward unchanged.
+
+    Args:
+        x (np.ndarray): Input, shape (S, N) shared by all sets or (P, S, N).
+        starts, seed_lengths, seed_scales, decays, input_scales (np.ndarray): Shape (P,).
+        hold (np.ndarray | None, optional): Boolean mask broadcastable to (P, S, N).
+
+    Returns:
+        np.ndarray: Shape (P, S, N), NaN before each set's seed completes.
+    """
+    n = x.shape[-1]
+    t = np.arange(n)
+    shape = (-1, 1, 1)
+    starts, seed_lengths = starts.reshape(shape), seed_lengths.reshape(shape)
+    before = t < starts
+    seeding = ~before & (t < starts + seed_lengths)
+
+    inputs = np.where(
+        seeding, x * seed_scales.reshape(shape), x * input_scales.reshape(shape)
+    )
+    decay = np.where(before | seeding, 1.0, decays.reshape(shape))
+    inputs = np.where(before, 0.0, inputs)
+    if hold is not None:
+        inputs = np.where(hold, 0.0, inputs)
+        decay = np.where(hold & ~seeding, 1.0, decay)
+
+    decay, inputs = np.broadcast_arrays(decay, inputs)
+    out = linear_filter(inputs, decay)
+    out[np.broadcast_to(t < starts + seed_lengths - 1, out.shape)] = np.nan
+    return out
+
+
+def _as_array(values) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64)
+
+
+def rsi_sweep(close: np.ndarray, timeperiods: list[int]) -> np.ndarray:
+    """
+    RSI for every symbol and period.
+
+    Args:
+        close (np.ndarray): Close prices, shape (S, N).
+        timeperiods (list[int]): RSI periods.
+
+    Returns:
+        np.ndarray: Shape (len(timeperiods), S, N).
+    """
+    close = np.atleast_2d(_as_array(close))
+    n = _as_array(timeperiods)
+    diff = np.zeros_like(close)
+    diff[..., 1:] = np.diff(close, axis=-1)
+    args = (np.ones_like(n), n, 1.0 / n, (n - 1.0) / n, 1.0 / n)
+    gain = _staged_filter(np.maximum(diff, 0.0), *args)
+    loss = _staged_filter(np.maximum(-diff, 0.0), *args)
+    total = gain + loss
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = np.where(total == 0.0, 0.0, 100.0 * (gain / total))
+    return np.where(np.isnan(total), np.nan, rsi)
+
+
+def atr_sweep(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiods: list[int]
+) -> np.ndarray:
+    """
+    ATR for every symbol and period.
+
+    Args:
+        high, low, close (np.ndarray): Prices, shape (S, N).
+        timeperiods (list[int]): ATR periods.
+
+    Returns:
+        np.ndarray: Shape (len(timeperiods), S, N).
+    """
+    tr = _true_range(*(np.atleast_2d(_as_array(a)) for a in (high, low, close)))
+    n = _as_array(timeperiods)
+    return _staged_filter(tr, np.ones_like(n), n, 1.0 / n, (n - 1.0) / n, 1.0 / n)
+
+
+def adx_sweep(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiods: list[int]
+) -> np.ndarray:
+    """
+    ADX for every symbol and period.
+
+    Args:
+        high, low, close (np.ndarray): Prices, shape (S, N).
+        timeperiods (list[int]): ADX periods.
+
+    Returns:
+        np.ndarray: Shape (len(timeperiods), S, N).
+    """
+    high, low, close = (np.atleast_2d(_as_array(a)) for a in (high, low, close))
+    n = _as_array(timeperiods)
+    diff_p = np.zeros_like(high)
+    diff_m = np.zeros_like(low)
+    diff_p[..., 1:] = high[..., 1:] - high[..., :-1]
+    diff_m[..., 1:] = low[..., :-1] - low[..., 1:]
+    minus_dm = np.where((diff_m > 0) & (diff_p < diff_m), diff_m, 0.0)
+    plus_dm = np.where((diff_p > 0) & (diff_p > diff_m), diff_p, 0.0)
+    tr = _true_range(high, low, close)
+
+    # Wilder running sums: plain sum of the first n-1 moves, then decay by 1-1/n
+    ones = np.ones_like(n)
+    args = (ones, n - 1.0, ones, 1.0 - 1.0 / n, ones)
+    plus_sum, minus_sum, tr_sum = (
+        _staged_filter(v, *args) for v in (plus_dm, minus_dm, tr)
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        plus_di = 100.0 * (plus_sum / tr_sum)
+        minus_di = 100.0 * (minus_sum / tr_sum)
+        di_total = minus_di + plus_di
+        dx = 100.0 * (np.abs(minus_di - plus_di) / di_total)
+    invalid = (tr_sum == 0.0) | (di_total == 0.0) | np.isnan(dx)
+    dx = np.where(invalid, 0.0, dx)
+
+    # DX starts at bar n; ADX is its mean over n bars, then Wilder smoothing
+    return _staged_filter(dx, n, n, 1.0 / n, (n - 1.0) / n, 1.0 / n, hold=invalid)
+
+
+def macd_sweep(
+    close: np.ndarray, params: list[tuple[int, int, int]]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    MACD for every symbol and (fast, slow, signal) combination.
+
+    Args:
+        close (np.ndarray): Close prices, shape (S, N).
+        params (list[tuple[int, int, int]]): (fastperiod, slowperiod, signalperiod) sets.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: (macd, signal, hist), each of shape
+        (len(params), S, N).
+    """
+    close = np.atleast_2d(_as_array(close))
+    fast, slow, signal = (_as_array(p) for p in zip(*params))
+    fast, slow = np.minimum(fast, slow), np.maximum(fast, slow)
+
+    def ema_args(period, start):
+        k = 2.0 / (period + 1.0)
+        return (start, period, 1.0 / period, 1.0 - k, k)
+
+    fast_ema = _staged_filter(close, *ema_args(fast, slow - fast))
+    slow_ema = _staged_filter(close, *ema_args(slow, np.zeros_like(slow)))
+    macd = fast_ema - slow_ema
+    signal_line = _staged_filter(np.nan_to_num(macd), *ema_args(signal, slow - 1.0))
+    macd = np.where(np.isnan(signal_line), np.nan, macd)
+    return macd, signal_line, macd - signal_line
+
+
+def _true_range(high, low, close) -> np.ndarray:
+    """True range with 0 on the first bar (it is never part of a seed window)."""
+    tr = np.zeros_like(close)
+    prev_close = close[..., :-1]
+    tr[..., 1:] = np.maximum.reduce(
+        [
+            high[..., 1:] - low[..., 1:],
+            np.abs(prev_close - high[..., 1:]),
+            np.abs(prev_close - low[..., 1:]),
+        ]
+    )
+    return tr
+
+
+def grid(spec_factory, **param_lists) -> list[batch.IndicatorSpec]:
+    """
+    Expand a parameter grid into indicator specs.
+
+    Example:
+        grid(batch.macd, fastperiod=[6, 12], slowperiod=[13, 26], signalperiod=[5, 9])
+
+    Args:
+        spec_factory: One of the spec constructors in Indicators/batch.py.
+        **param_lists: Candidate values for each keyword argument.
+
+    Returns:
+        list[batch.IndicatorSpec]: One spec per combination.
+    """
+    keys = list(param_lists)
+    return [
+        spec_factory(**dict(zip(keys, values)))
+        for values in itertools.product(*(param_lists[k] for k in keys))
+    ]
+
+
+def sweep(bars, specs: list[batch.IndicatorSpec]) -> dict[str, np.ndarray]:
+    """
+    Compute every spec for every symbol, batching all specs of the same kind.
+
+    Args:
+        bars: A dict of (S, N) arrays or a structured array of shape (S, N), with
+            'close' and, for ATR/ADX, 'high' and 'low'.
+        specs (list[batch.IndicatorSpec]): Specs from Indicators/batch.py, e.g. the
+            output of grid().
+
+    Returns:
+        dict[str, np.ndarray]: Output field name (see IndicatorSpec.fields) -> (S, N) array.
+
+    Raises:
+        ValueError: If a required column is missing or a spec kind is unsupported.
+    """
+    needs_range = any(spec.kind in ("ATR", "ADX") for spec in specs)
+    required = ["high", "low", "close"] if needs_range else ["close"]
+    if not has_columns(bars, required):
+        raise ValueError(f"⚠️ Missing columns {required}. Cannot run the sweep.")
+
+    close = np.atleast_2d(column(bars, "close"))
+    if needs_range:
+        high = np.atleast_2d(column(bars, "high"))
+        low = np.atleast_2d(column(bars, "low"))
+
+    by_kind = {}
+    for spec in specs:
+        by_kind.setdefault(spec.kind, []).append(spec)
+
+    results = {}
+    for kind, group in by_kind.items():
+        periods = [spec.params[0] for spec in group]
+        if kind == "RSI":
+            outputs = (rsi_sweep(close, periods),)
+        elif kind == "ATR":
+            outputs = (atr_sweep(high, low, close, periods),)
+        elif kind == "ADX":
+            outputs = (adx_sweep(high, low, close, periods),)
+        elif kind == "MACD":
+            outputs = macd_sweep(close, [spec.params for spec in group])
+        elif kind == "BBANDS":
+            # window lengths differ per set, so bands are computed per spec
+            outputs = tuple(
+                np.stack(bands)
+                for bands in zip(*(BBANDS(close, *spec.params) for spec in group))
+            )
+        else:
+            raise ValueError(f"⚠️ Unsupported indicator kind for sweeps: {kind}")
+
+        for i, spec in enumerate(group):
+            for name, values in zip(spec.fields(), outputs):
+                results[name] = values[i]
+    return results
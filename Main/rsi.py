@@ -1,7 +1,6 @@
 from indicators import atr, macd, rsi, adx
-from metatrader import mt5_trader
+from metatrader import bar_scheduler, mt5_trader
 from others import log_manager
-import time
 from datetime import datetime
 
 
@@ -25,6 +24,9 @@ def main():
     logger = log_manager.LogManager().get_logger()
     trader = mt5_trader.MT5Trader(logger)
     trader.connect(ACCOUNT, PASSWORD, SERVER)
+    scheduler = bar_scheduler.BarScheduler(
+        lambda: trader.fetch_rates(SYMBOL, TIMEFRAME), TIMEFRAME
+    )
 
     # position state：'long'、'short'、None
     position_state = None
@@ -34,7 +36,8 @@ def main():
 
     try:
         while True:
-            df = trader.fetch_ohlcv(SYMBOL, TIMEFRAME)
+            # wakes once per closed bar; df holds closed bars only
+            df = scheduler.wait()
 
             # compute indicators
             atr_val = atr.ATR(df, ATR_PERIOD).get_atr()
@@ -96,7 +99,6 @@ def main():
                 position_state = None
 
             prev_rsi_state = curr_rsi_state
-            time.sleep(10)
 
     except Exception as e:
         print(f"[Main Error] {e}")
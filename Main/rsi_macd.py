@@ -1,7 +1,7 @@
-from indicators import atr, macd, rsi, adx
-from metatrader import mt5_trader
+from indicators import atr, batch, macd, rsi, adx
+from metatrader import bar_scheduler, mt5_trader
 from others import log_manager
-import time
+from others.profiler import install_signal_handler, profiler
 from datetime import datetime
 
 
@@ -24,38 +24,60 @@ def main():
     MACD_FASTPERIOD = 6
     MACD_SLOWPERIOD = 13
     MACD_SIGNALPERIOD = 5
-    MACD_N = 3
+    PROFILE = False  # time every stage; the table is logged with each signal dump
 
     try:
         logger = log_manager.LogManager().get_logger()
         trader = mt5_trader.MT5Trader(logger)
         trader.connect(ACCOUNT, PASSWORD, SERVER)
+        scheduler = bar_scheduler.BarScheduler(
+            profiler.timed("fetch")(lambda: trader.fetch_rates(SYMBOL, TIMEFRAME)),
+            TIMEFRAME,
+        )
+        if PROFILE:
+            profiler.enable()
+        # SIGUSR1 (Ctrl+Break on Windows) dumps 30 seconds of stacks for a flamegraph
+        install_signal_handler(logger)
 
         while True:
-            df = trader.fetch_ohlcv(SYMBOL, TIMEFRAME)
+            # wakes once per closed bar; df holds closed bars only
+            df = scheduler.wait()
             # print(df.tail())
 
-            adx_analyzer = adx.ADX(df, ADX_PERIOD)
-            adx_val = adx_analyzer.get_adx()
-
-            atr_analyzer = atr.ATR(df, ATR_PERIOD)
-            atr_val = atr_analyzer.get_atr()
-
-            rsi_analyzer = rsi.RSI(df, RSI_PERIOD)
-            rsi_list = rsi_analyzer.get_rsi(RSI_N)
-
-            macd_analyzer = macd.MACD(
-                df, MACD_FASTPERIOD, MACD_SLOWPERIOD, MACD_SIGNALPERIOD
-            )
-            macd_list = macd_analyzer.get_macd(MACD_N)
-
-            print(f"DATETIME: {datetime.now().strftime("%Y-%m-%d_%H:%M:%S")}")
-            print(
-                f"ADX: {adx_val} | MACD_HIST: {macd_list[-1][-1]} | RSI: {rsi_list[-1]} | ATR: {atr_val}"
-            )
-            logger.info(
-                f"ADX: {adx_val} | MACD_HIST: {macd_list[-1][-1]} | RSI: {rsi_list[-1]} | ATR: {atr_val}"
-            )
+            with profiler.stage("indicators"):
+                # one vectorized pass for every indicator; the analyzers below hit the cache
+                indicators = batch.compute(
+                    df,
+                    [
+                        batch.adx(ADX_PERIOD, label="adx"),
+                        batch.atr(ATR_PERIOD, label="atr"),
+                        batch.rsi(RSI_PERIOD, label="rsi"),
+                        batch.macd(
+                            MACD_FASTPERIOD,
+                            MACD_SLOWPERIOD,
+                            MACD_SIGNALPERIOD,
+                            label="macd",
+                        ),
+                    ],
+                )
+                adx_val = round(float(indicators["adx"][-1]), 3)
+                atr_val = round(float(indicators["atr"][-1]), 3)
+                rsi_list = [round(float(v), 3) for v in indicators["rsi"][-RSI_N:]]
+                macd_hist = round(float(indicators["macd_hist"][-1]), 3)
+
+                rsi_analyzer = rsi.RSI(df, RSI_PERIOD)
+                macd_analyzer = macd.MACD(
+                    df, MACD_FASTPERIOD, MACD_SLOWPERIOD, MACD_SIGNALPERIOD
+                )
+
+            with profiler.stage("log"):
+                print(f"DATETIME: {datetime.now().strftime("%Y-%m-%d_%H:%M:%S")}")
+                print(
+                    f"ADX: {adx_val} | MACD_HIST: {macd_hist} | RSI: {rsi_list[-1]} | ATR: {atr_val}"
+                )
+                logger.info(
+                    f"ADX: {adx_val} | MACD_HIST: {macd_hist} | RSI: {rsi_list[-1]} | ATR: {atr_val}"
+                )
 
             if adx_val <= ADX_THRESHOLD:
                 print("IT IS RANGE MARKET!")
@@ -66,8 +88,9 @@ def main():
                 ):
                     print(" ✅ SELL SIGNAL")
                     logger.info(" ✅ SELL SIGNAL")
-                    trader.place_market_order("XAUUSD", "sell", 0.05, atr_val)
-                    trader.place_market_order("XAUUSD", "sell", 0.05, atr_val)
+                    with profiler.stage("order"):
+                        trader.place_market_order("XAUUSD", "sell", 0.05, atr_val)
+                        trader.place_market_order("XAUUSD", "sell", 0.05, atr_val)
 
                 elif (
                     rsi_analyzer.is_oversold(RSI_OVERSOLD_THRESHOLD)
@@ -75,10 +98,9 @@ def main():
                 ):
                     print(" ✅ BUY SIGNAL")
                     logger.info(" ✅ BUY SIGNAL")
-                    trader.place_market_order("XAUUSD", "buy", 0.05, atr_val)
-                    trader.place_market_order("XAUUSD", "buy", 0.05, atr_val)
-
-            time.sleep(30)
+                    with profiler.stage("order"):
+                        trader.place_market_order("XAUUSD", "buy", 0.05, atr_val)
+                        trader.place_market_order("XAUUSD", "buy", 0.05, atr_val)
 
     except Exception as e:
         print(f"[Main Error] {e}")
@@ -0,0 +1,164 @@
+import itertools
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from metatrader import bar_scheduler, mt5_trader, session
+from others import journal, log_manager
+from others.profiler import install_signal_handler, profiler
+
+from main.strategies import RSIMACDStrategy, RSIReversalStrategy, Strategy
+
+
+class Runner:
+    """
+    Hosts many strategy instances (symbol x timeframe x params) in one process.
+
+    All strategies share one MT5Trader: terminal calls go through a TerminalSession,
+    which runs them one at a time on its own thread. Each (symbol, timeframe) has a
+    BarScheduler; when new bars close, the strategies of those series are evaluated
+    concurrently in a thread pool (TA-Lib and NumPy release the GIL), and the next
+    round starts once they have all finished.
+
+    Fetches and evaluations are timed as the 'fetch' and 'on_bar' stages of
+    others.profiler.profiler once it is enabled.
+
+    """
+
+    def __init__(
+        self,
+        trader,
+        strategies: list[Strategy],
+        logger,
+        workers: int | None = None,
+        sleep=time.sleep,
+        journal=None,
+    ) -> None:
+        """
+        Initialize the runner.
+
+        Args:
+            trader: A connected MT5Trader instance.
+            strategies (list[Strategy]): The strategy instances to host. Those
+                without a magic number are given a unique one.
+            logger: A logger instance for logging messages.
+            workers (int | None, optional): Evaluation threads. Defaults to the CPU count.
+            sleep (Callable[[float], None], optional): Sleep function. Defaults to time.sleep.
+            journal (Journal | None, optional): Where the strategies journal their
+                signals and indicator values (see others.journal). Default is None.
+        """
+        self.logger = logger
+        self.session = session.TerminalSession(trader)
+        self.trader = self.session.proxy()
+        self.sleep = sleep
+        self.pool = ThreadPoolExecutor(
+            max_workers=workers or os.cpu_count(), thread_name_prefix="strategy"
+        )
+
+        # strategies sharing a symbol tell their positions apart by magic number
+        taken = {strategy.magic for strategy in strategies}
+        free = (magic for magic in itertools.count(1) if magic not in taken)
+
+        self.strategies = {}
+        for strategy in strategies:
+            if not strategy.magic:
+                strategy.magic = next(free)
+            if journal is not None:
+                strategy.journal = journal
+            key = (strategy.symbol, strategy.timeframe)
+            self.strategies.setdefault(key, []).append(strategy)
+
+        self.schedulers = {
+            key: bar_scheduler.BarScheduler(
+                profiler.timed("fetch")(lambda key=key: self.trader.fetch_rates(*key)),
+                key[1],
+            )
+            for key in self.strategies
+        }
+        self._next_check = dict.fromkeys(self.schedulers, 0.0)
+
+    def run_once(self) -> int:
+        """
+        Check every series that is due and evaluate the strategies of those with a new bar.
+
+        Returns:
+            int: Number of strategy evaluations run.
+        """
+        now = time.monotonic()
+        futures = {}
+        for key, scheduler in self.schedulers.items():
+            if self._next_check[key] > now:
+                continue
+            try:
+                rates = scheduler.check()
+            except ValueError as e:
+                self.logger.error(f" ⚠️ Failed to fetch {key}: {e}")
+                rates = None
+            self._next_check[key] = now + scheduler.next_delay()
+            if rates is None:
+                continue
+
+            # the buffer view is refilled by the next fetch, so strategies get a copy
+            rates = rates.copy()
+            for strategy in self.strategies[key]:
+                future = self.pool.submit(self._evaluate, strategy, rates)
+                futures[future] = strategy
+
+        wait(futures)
+        for future, strategy in futures.items():
+            if future.exception() is not None:
+                self.logger.error(f"[{strategy.name} Error] {future.exception()}")
+        return len(futures)
+
+    def _evaluate(self, strategy: Strategy, rates) -> None:
+        with profiler.stage("on_bar"):
+            strategy.on_bar(rates, self.trader)
+
+    def run(self) -> None:
+        """
+        Run until interrupted, sleeping until the next series is due.
+        """
+        try:
+            while True:
+                self.run_once()
+                self.sleep(max(0.0, min(self._next_check.values()) - time.monotonic()))
+        finally:
+            self.pool.shutdown(wait=True)
+            self.session.close()
+
+
+def main():
+    ACCOUNT = 5035257814
+    PASSWORD = "!7XvJjRs"
+    SERVER = "MetaQuotes-Demo"
+
+    SYMBOLS = ["XAUUSD", "XAGUSD", "EURUSD", "GBPUSD", "USDJPY"]
+    TIMEFRAME = "M1"
+    PROFILE = False  # time every stage; the table is logged with each signal dump
+
+    # strategies log every bar from many threads; keep file writes off those threads
+    logger = log_manager.LogManager(async_logging=True).get_logger()
+    events = journal.Journal("Journal")
+    trader = mt5_trader.MT5Trader(logger, journal=events)
+    trader.connect(ACCOUNT, PASSWORD, SERVER)
+    if PROFILE:
+        profiler.enable()
+    # SIGUSR1 (Ctrl+Break on Windows) dumps 30 seconds of stacks for a flamegraph
+    install_signal_handler(logger)
+
+    strategies = []
+    for symbol in SYMBOLS:
+        strategies.append(RSIReversalStrategy(symbol, TIMEFRAME, logger))
+        strategies.append(RSIMACDStrategy(symbol, TIMEFRAME, logger))
+
+    try:
+        Runner(trader, strategies, logger, journal=events).run()
+    except Exception as e:
+        print(f"[Main Error] {e}")
+        logger.error(f"[Main Error] {e}")
+    finally:
+        trader.disconnect()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+import numpy as np
+
+from indicators import atr, batch, macd, rsi
+from others.profiler import profiler
+
+
+class Strategy(ABC):
+    """
+    Base class for a strategy instance hosted by the Runner.
+
+    One instance trades one (symbol, timeframe) with its own parameters and state.
+    Its orders carry its magic number, so strategies sharing a symbol count and close
+    only their own positions. Subclasses must implement on_bar(), which is called
+    once per closed bar, and may journal their signals and indicator values with
+    record_signal() and record_indicators(); both do nothing unless the host sets
+    `journal`.
+
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        timeframe: str,
+        logger,
+        volume: float = 0.05,
+        magic: int = 0,
+    ) -> None:
+        """
+        Initialize the strategy.
+
+        Args:
+            symbol (str): Trading symbol (e.g., 'XAUUSD').
+            timeframe (str): Timeframe string (e.g., 'M1').
+            logger: A logger instance for logging messages.
+            volume (float, optional): Lot size per order. Default is 0.05.
+            magic (int, optional): Magic number of its orders. Default 0 lets the
+                Runner assign a unique one.
+        """
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.logger = logger
+        self.volume = volume
+        self.magic = magic
+        self.journal = None  # an others.journal.Journal, set by the host
+
+    @property
+    def name(self) -> str:
+        return f"{type(self).__name__}[{self.symbol} {self.timeframe}]"
+
+    def record_signal(self, direction: str, price: float = 0.0) -> None:
+        """
+        Journal a trade signal.
+
+        Args:
+            direction (str): 'buy' or 'sell'.
+            price (float, optional): Price the signal was taken at. Default is 0.0.
+        """
+        if self.journal is None:
+            return
+        self.journal.record(
+            "signal",
+            symbol=self.symbol,
+            strategy=type(self).__name__,
+            timeframe=self.timeframe,
+            direction=1 if direction == "buy" else -1,
+            price=price,
+        )
+
+    def record_indicators(self, **values: float) -> None:
+        """
+        Journal a snapshot of indicator values, one record per value.
+
+        Args:
+            **values (float): Indicator values by name, e.g. rsi=61.2.
+        """
+        if self.journal is None:
+            return
+        strategy = type(self).__name__
+        for name, value in values.items():
+            self.journal.record(
+                "indicator",
+                symbol=self.symbol,
+                strategy=strategy,
+                name=name,
+                value=value,
+            )
+
+    @abstractmethod
+    def on_bar(self, rates: np.ndarray, trader) -> None:
+        """
+        Evaluate the strategy on a newly closed bar.
+
+        Args:
+            rates (np.ndarray): Closed bars, oldest first; the last row just closed.
+            trader: An MT5Trader (or a session proxy of one) for placing orders.
+        """
+
+
+class RSIReversalStrategy(Strategy):
+    """
+    The Main/rsi.py strategy: trade RSI moving back out of overbought/oversold.
+
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        timeframe: str,
+        logger,
+        volume: float = 0.05,
+        rsi_period: int = 14,
+        atr_period: int = 14,
+        overbought: float = 65,
+        oversold: float = 35,
+        magic: int = 0,
+    ) -> None:
+        super().__init__(symbol, timeframe, logger, volume, magic)
+        self.rsi_period = rsi_period
+        self.atr_period = atr_period
+        self.overbought = overbought
+        self.oversold = oversold
+        # position state：'long'、'short'、None
+        self.position_state = None
+        # previous RSI state：'overbought', 'oversold', 'normal'
+        self.prev_rsi_state = "normal"
+
+    def on_bar(self, rates: np.ndarray, trader) -> None:
+        with profiler.stage("indicators"):
+            atr_val = atr.ATR(rates, self.atr_period).get_atr()
+            curr_rsi = rsi.RSI(rates, self.rsi_period).get_rsi()[-1]
+
+        if curr_rsi > self.overbought:
+            curr_rsi_state = "overbought"
+        elif curr_rsi < self.oversold:
+            curr_rsi_state = "oversold"
+        else:
+            curr_rsi_state = "normal"
+
+        with profiler.stage("positions"):
+            if trader.count_positions(symbol=self.symbol, magic=self.magic) == 0:
+                self.position_state = None
+
+        with profiler.stage("log"):
+            self.logger.info(
+                f"{self.name} RSI={curr_rsi:.2f} RSI_STATE={curr_rsi_state}, POSITION_STATE={self.position_state}"
+            )
+            self.record_indicators(rsi=curr_rsi, atr=atr_val)
+        close = float(rates["close"][-1])
+
+        # 1) overbought → normal, SELL
+        if self.prev_rsi_state == "overbought" and curr_rsi_state == "normal":
+            with profiler.stage("order"):
+                if self.position_state == "long":
+                    trader.close_position(self.symbol, "buy", self.magic)
+                self.record_signal("sell", close)
+                trader.place_market_order(
+                    self.symbol, "sell", self.volume, atr_val, magic=self.magic
+                )
+            self.position_state = "short"
+
+        # 2) oversold → normal, BUY
+        elif self.prev_rsi_state == "oversold" and curr_rsi_state == "normal":
+            with profiler.stage("order"):
+                if self.position_state == "short":
+                    trader.close_position(self.symbol, "sell", self.magic)
+                self.record_signal("buy", close)
+                trader.place_market_order(
+                    self.symbol, "buy", self.volume, atr_val, magic=self.magic
+                )
+            self.position_state = "long"
+
+        # 3) normal → overbought/oversold, close all positions
+        elif self.prev_rsi_state == "normal" and curr_rsi_state in (
+            "overbought",
+            "oversold",
+        ):
+            with profiler.stage("order"):
+                if self.position_state == "long":
+                    trader.close_position(self.symbol, "buy", self.magic)
+                elif self.position_state == "short":
+                    trader.close_position(self.symbol, "sell", self.magic)
+            self.position_state = None
+
+        self.prev_rsi_state = curr_rsi_state
+
+
+class RSIMACDStrategy(Strategy):
+    """
+    The Main/rsi_macd.py strategy: RSI extremes confirmed by MACD, in range markets only.
+
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        timeframe: str,
+        logger,
+        volume: float = 0.05,
+        adx_period: int = 14,
+        adx_threshold: float = 40,
+        atr_period: int = 14,
+        rsi_period: int = 14,
+        overbought: float = 65,
+        oversold: float = 35,
+        macd_periods: tuple[int, int, int] = (6, 13, 5),
+        orders_per_signal: int = 2,
+        magic: int = 0,
+    ) -> None:
+        super().__init__(symbol, timeframe, logger, volume, magic)
+        self.adx_period = adx_period
+        self.adx_threshold = adx_threshold
+        self.atr_period = atr_period
+        self.rsi_period = rsi_period
+        self.overbought = overbought
+        self.oversold = oversold
+        self.macd_periods = macd_periods
+        self.orders_per_signal = orders_per_signal
+
+    def on_bar(self, rates: np.ndarray, trader) -> None:
+        with profiler.stage("indicators"):
+            # one vectorized pass for every indicator; the analyzers below hit the cache
+            indicators = batch.compute(
+                rates,
+                [
+                    batch.adx(self.adx_period, label="adx"),
+                    batch.atr(self.atr_period, label="atr"),
+                    batch.rsi(self.rsi_period, label="rsi"),
+                    batch.macd(*self.macd_periods, label="macd"),
+                ],
+            )
+            adx_val = round(float(indicators["adx"][-1]), 3)
+            atr_val = round(float(indicators["atr"][-1]), 3)
+            rsi_val = round(float(indicators["rsi"][-1]), 3)
+            macd_hist = round(float(indicators["macd_hist"][-1]), 3)
+
+        with profiler.stage("log"):
+            self.logger.info(
+                f"{self.name} {datetime.now():%Y-%m-%d_%H:%M:%S} ADX: {adx_val} | MACD_HIST: {macd_hist} | RSI: {rsi_val} | ATR: {atr_val}"
+            )
+            self.record_indicators(
+                adx=adx_val, macd_hist=macd_hist, rsi=rsi_val, atr=atr_val
+            )
+        if adx_val > self.adx_threshold:
+            return
+
+        with profiler.stage("signal"):
+            rsi_analyzer = rsi.RSI(rates, self.rsi_period)
+            macd_analyzer = macd.MACD(rates, *self.macd_periods)
+            if (
+                rsi_analyzer.is_overbought(self.overbought)
+                and macd_analyzer.is_macd_bearish()
+            ):
+                direction = "sell"
+            elif (
+                rsi_analyzer.is_oversold(self.oversold)
+                and macd_analyzer.is_macd_bullish()
+            ):
+                direction = "buy"
+            else:
+                direction = None
+        if direction is None:
+            return
+
+        self.logger.info(f"{self.name} ✅ {direction.upper()} SIGNAL")
+        self.record_signal(direction, float(rates["close"][-1]))
+        with profiler.stage("order"):
+            for _ in range(self.orders_per_signal):
+                trader.place_market_order(
+                    self.symbol, direction, self.volume, atr_val, magic=self.magic
+                )
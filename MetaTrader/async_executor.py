@@ -0,0 +1,128 @@
+import asyncio
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, NamedTuple
+
+
+class OrderResult(NamedTuple):
+    """
+    The outcome of one order request sent through the AsyncOrderExecutor.
+
+    """
+
+    request: dict
+    result: object  # the mt5.order_send result, or None
+    latency: float  # seconds spent in order_send
+    error: Exception | None = None
+
+    def ok(self, done_code: int) -> bool:
+        """
+        Check whether the request succeeded.
+
+        Args:
+            done_code (int): The success return code, i.e. mt5.TRADE_RETCODE_DONE.
+
+        Returns:
+            bool: True if a result came back with the success code.
+        """
+        return (
+            self.error is None
+            and self.result is not None
+            and self.result.retcode == done_code
+        )
+
+
+class AsyncOrderExecutor:
+    """
+    Sends order requests from asyncio code without blocking the event loop.
+
+    The MetaTrader5 package talks to one terminal over one IPC channel, so the
+    blocking order_send calls are not run concurrently: they are queued and sent one
+    at a time, in request order, on a single worker thread (the TerminalSession's,
+    once routed through one). Awaiting a batch frees the event loop for the batch's
+    wall time, which is the sum of the round-trips, not one of them.
+
+    """
+
+    def __init__(self, send: Callable) -> None:
+        """
+        Initialize the executor.
+
+        Args:
+            send (Callable): The blocking send function, usually mt5.order_send.
+        """
+        self.send_fn = send
+        self._submit = None
+        self._pool = None
+
+    def route_through(self, submit: Callable[..., Future]) -> None:
+        """
+        Queue the sends on another serial executor, e.g. TerminalSession.submit.
+
+        Args:
+            submit (Callable[..., Future]): Called as submit(fn, *args); must run the
+                calls one at a time, in submission order.
+        """
+        self._submit = submit
+
+    def _queue(self, fn: Callable, *args) -> Future:
+        if self._submit is not None:
+            return self._submit(fn, *args)
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="mt5-orders"
+            )
+        return self._pool.submit(fn, *args)
+
+    def _timed_send(self, request: dict) -> OrderResult:
+        start = time.perf_counter()
+        try:
+            result = self.send_fn(request)
+        except Exception as e:
+            return OrderResult(request, None, time.perf_counter() - start, e)
+        return OrderResult(request, result, time.perf_counter() - start)
+
+    async def send(self, request: dict) -> OrderResult:
+        """
+        Queue one request and wait for it without blocking the event loop.
+
+        Args:
+            request (dict): An mt5.order_send request.
+
+        Returns:
+            OrderResult: The result and the time order_send took.
+        """
+        return await asyncio.wrap_future(self._queue(self._timed_send, request))
+
+    async def send_batch(
+        self,
+        requests: list[dict],
+        on_result: Callable[[OrderResult], None] | None = None,
+    ) -> list[OrderResult]:
+        """
+        Queue a batch of requests; they are sent one at a time, in request order.
+
+        Args:
+            requests (list[dict]): The requests to send.
+            on_result (Callable[[OrderResult], None] | None, optional): Called with each
+                result as soon as it completes.
+
+        Returns:
+            list[OrderResult]: One result per request, in request order.
+        """
+        futures = [self._queue(self._timed_send, request) for request in requests]
+        results = []
+        for future in futures:
+            result = await asyncio.wrap_future(future)
+            if on_result is not None:
+                on_result(result)
+            results.append(result)
+        return results
+
+    def close(self) -> None:
+        """
+        Wait for queued requests and stop the worker thread.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
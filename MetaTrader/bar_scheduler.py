@@ -0,0 +1,139 @@
+import time
+from typing import Callable
+
+import numpy as np
+
+# bar length in seconds per timeframe string
+TIMEFRAME_SECONDS = {
+    "M1": 60,
+    "M5": 300,
+    "M15": 900,
+    "M30": 1800,
+    "H1": 3600,
+    "H4": 14400,
+}
+
+
+class BarScheduler:
+    """
+    Wakes a strategy when a new bar closes, instead of polling on a fixed sleep.
+
+    Bar open times are in server time, so the scheduler learns the offset between the
+    local clock and the server clock from the bar timestamps it sees: a bar stamped T
+    that is visible at local time L means the server clock is at least T - L ahead.
+    The estimate is tightened every time a new bar is observed, and the scheduler then
+    sleeps until the estimated close of the forming bar and fetches once.
+
+    Until the first new bar has been observed the offset is unknown, so the first wait
+    polls at a coarse interval (1/60 of the bar length, but at least `poll`); the same
+    interval is used when no bar has opened for a whole period (e.g. market closed).
+
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], np.ndarray],
+        timeframe: str,
+        poll: float = 1.0,
+        grace: float = 0.2,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            fetch (Callable[[], np.ndarray]): Returns the latest bars (structured array
+                with a 'time' column, oldest first), e.g.
+                lambda: trader.fetch_rates("XAUUSD", "M1").
+            timeframe (str): One of TIMEFRAME_SECONDS, e.g. 'M1'.
+            poll (float, optional): Seconds between fetches while a due bar has not
+                appeared yet (MT5 opens a bar on its first tick). Default is 1.0.
+            grace (float, optional): Seconds added after the estimated close. Default is 0.2.
+            clock (Callable[[], float], optional): Local clock. Defaults to time.time.
+            sleep (Callable[[float], None], optional): Sleep function. Defaults to time.sleep.
+
+        Raises:
+            ValueError: If the timeframe is unknown.
+        """
+        if timeframe not in TIMEFRAME_SECONDS:
+            raise ValueError(f"⚠️ Invalid timeframe provided: {timeframe}")
+        self.fetch = fetch
+        self.period = TIMEFRAME_SECONDS[timeframe]
+        self.poll = poll
+        self.grace = grace
+        self.clock = clock
+        self.sleep = sleep
+        self.offset = None  # server time - local time, a lower bound once calibrated
+        self.calibrated = False
+        self.fetches = 0
+        self._last_time = None
+
+    def _fetch(self) -> np.ndarray:
+        rates = self.fetch()
+        self.fetches += 1
+        if len(rates):
+            bound = int(rates["time"][-1]) - self.clock()
+            self.offset = bound if self.offset is None else max(self.offset, bound)
+        return rates
+
+    def check(self) -> np.ndarray | None:
+        """
+        Fetch once and report whether a new bar has opened since the last check.
+
+        The first successful fetch always counts as new.
+
+        Returns:
+            np.ndarray | None: The fetched bars without the forming one (a zero-copy
+            slice), or None if no new bar has opened.
+        """
+        rates = self._fetch()
+        if not len(rates):
+            return None
+        newest = int(rates["time"][-1])
+        if self._last_time is not None:
+            if newest <= self._last_time:
+                return None
+            self.calibrated = True
+        self._last_time = newest
+        return rates[:-1]
+
+    def next_delay(self) -> float:
+        """
+        Return how long to sleep before the next check() is worth making.
+
+        Returns:
+            float: Seconds until the estimated close of the forming bar (plus grace),
+            or a polling interval when the close is already due or unknown.
+        """
+        coarse = max(self.poll, self.period / 60)
+        if self._last_time is None:
+            return coarse
+        due = self._last_time + self.period - (self.clock() + self.offset)
+        if not self.calibrated or due <= -self.period:
+            # alignment unknown yet, or no ticks for a whole bar (quiet market)
+            return coarse
+        return due + self.grace if due > 0 else self.poll
+
+    def wait(self) -> np.ndarray:
+        """
+        Block until a new bar has closed and return the closed bars.
+
+        The first call returns immediately with the bars available at that time.
+
+        Returns:
+            np.ndarray: The fetched bars without the forming one (a zero-copy slice),
+            so the last row is the bar that just closed.
+        """
+        while True:
+            rates = self.check()
+            if rates is not None:
+                return rates
+            self.sleep(self.next_delay())
+
+    @property
+    def new_bar_time(self) -> int | None:
+        """
+        Open time (server epoch seconds) of the forming bar seen by the last wait().
+        """
+        return self._last_time
@@ -0,0 +1,472 @@
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .rate_buffer import RATE_DTYPE
+
+
+def to_epoch(value) -> int | None:
+    """
+    Convert a bar time bound to epoch seconds.
+
+    Args:
+        value: Epoch seconds, a datetime, a pd.Timestamp, a date string or None.
+            Naive times are taken as UTC, like the times MT5 returns.
+
+    Returns:
+        int | None: Epoch seconds, or None if value is None.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    stamp = pd.Timestamp(value)
+    if stamp.tzinfo is not None:
+        stamp = stamp.tz_convert("UTC").tz_localize(None)
+    return stamp.value // 10**9
+
+
+def to_records(bars, dtype: np.dtype = RATE_DTYPE) -> np.ndarray:
+    """
+    Convert bars to sorted records of the store's row layout.
+
+    Args:
+        bars: A structured array from mt5.copy_rates_*, or a DataFrame such as the one
+            from MT5Trader.fetch_ohlcv ('time' as datetimes or epoch seconds). Missing
+            volume/spread columns are filled with 0.
+        dtype (np.dtype, optional): Row layout. Defaults to the MT5 rates layout.
+
+    Returns:
+        np.ndarray: Structured array sorted by time.
+    """
+    if isinstance(bars, np.ndarray) and bars.dtype == dtype:
+        rows = bars
+    else:
+        rows = np.zeros(len(bars), dtype=dtype)
+        for name in dtype.names:
+            if name not in (bars.dtype.names if isinstance(bars, np.ndarray) else bars):
+                continue
+            values = np.asarray(bars[name])
+            if name == "time" and np.issubdtype(values.dtype, np.datetime64):
+                values = values.astype("datetime64[s]").astype(np.int64)
+            rows[name] = values
+    if len(rows) > 1 and np.any(np.diff(rows["time"]) < 0):
+        rows = rows[np.argsort(rows["time"], kind="stable")]
+    return rows
+
+
+class BarStore:
+    """
+    A local on-disk history of bars, one directory per symbol and timeframe and one
+    file per month: <root>/<symbol>/<timeframe>/<YYYY-MM>.bin.
+
+    Each file is a headerless array of records in the mt5.copy_rates_* layout, sorted
+    by time, so it is read at disk speed with np.fromfile, can be memory-mapped with
+    np.memmap, and new closed bars are stored with a plain file append.
+
+    """
+
+    def __init__(self, root: str | os.PathLike, dtype: np.dtype = RATE_DTYPE) -> None:
+        """
+        Initialize the store, creating the root directory if needed.
+
+        Args:
+            root (str | os.PathLike): Directory holding the bar files.
+            dtype (np.dtype, optional): Row layout. Defaults to the MT5 rates layout.
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.dtype = np.dtype(dtype)
+        self._last = {}  # (symbol, timeframe) -> newest stored bar time
+        self._lock = threading.Lock()
+
+    def path(self, symbol: str, timeframe: str, month: str | None = None) -> Path:
+        """
+        Return the directory of a series, or the file of one of its months.
+
+        Args:
+            symbol (str): Trading symbol (e.g., 'XAUUSD').
+            timeframe (str): Timeframe string (e.g., 'M1').
+            month (str | None, optional): Month as 'YYYY-MM'.
+
+        Returns:
+            Path: The directory or file path.
+        """
+        directory = self.root / symbol / timeframe
+        return directory if month is None else directory / f"{month}.bin"
+
+    def months(self, symbol: str, timeframe: str) -> list[str]:
+        """
+        List the stored months of a series, oldest first.
+
+        Args:
+            symbol (str): Trading symbol.
+            timeframe (str): Timeframe string.
+
+        Returns:
+            list[str]: Months as 'YYYY-MM'.
+        """
+        directory = self.path(symbol, timeframe)
+        if not directory.is_dir():
+            return []
+        return sorted(p.stem for p in directory.glob("*.bin") if p.stat().st_size)
+
+    def last_time(self, symbol: str, timeframe: str) -> int | None:
+        """
+        Return the open time of the newest stored bar, or None for an empty series.
+
+        Args:
+            symbol (str): Trading symbol.
+            timeframe (str): Timeframe string.
+
+        Returns:
+            int | None: Epoch seconds.
+        """
+        key = (symbol, timeframe)
+        if key not in self._last:
+            months = self.months(symbol, timeframe)
+            last = None
+            if months:
+                path = self.path(symbol, timeframe, months[-1])
+                offset = path.stat().st_size - self.dtype.itemsize
+                last = int(np.fromfile(path, self.dtype, offset=offset)["time"][0])
+            self._last[key] = last
+        return self._last[key]
+
+    def append(self, symbol: str, timeframe: str, bars) -> int:
+        """
+        Store the bars newer than the newest stored one; older bars are skipped.
+
+        This is the live path: pass closed bars only (the forming bar would be stored
+        with its partial values).
+
+        Args:
+            symbol (str): Trading symbol.
+            timeframe (str): Timeframe string.
+            bars: Closed bars, as accepted by to_records().
+
+        Returns:
+            int: Number of bars stored.
+        """
+        rows = to_records(bars, self.dtype)
+        with self._lock:
+            last = self.last_time(symbol, timeframe)
+            if last is not None:
+                rows = rows[rows["time"] > last]
+            if not len(rows):
+                return 0
+
+            for month, chunk in self._split(rows):
+                path = self.path(symbol, timeframe, month)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(path, "ab") as f:
+                    chunk.tofile(f)
+            self._last[(symbol, timeframe)] = int(rows["time"][-1])
+        return len(rows)
+
+    def write(self, symbol: str, timeframe: str, bars) -> int:
+        """
+        Merge bars into the store, replacing stored bars with the same open time.
+
+        Use this for imports and backfills; only the months touched are rewritten.
+
+        Args:
+            symbol (str): Trading symbol.
+            timeframe (str): Timeframe string.
+            bars: Bars in any order, as accepted by to_records().
+
+        Returns:
+            int: Number of bars written.
+        """
+        rows = to_records(bars, self.dtype)
+        if not len(rows):
+            return 0
+        with self._lock:
+            for month, chunk in self._split(rows):
+                path = self.path(symbol, timeframe, month)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                if path.exists():
+                    chunk = np.concatenate([np.fromfile(path, self.dtype), chunk])
+                    chunk = chunk[np.argsort(chunk["time"], kind="stable")]
+                    # keep the last occurrence of each time, i.e. the new bar
+                    times = chunk["time"]
+                    chunk = chunk[np.append(times[1:] != times[:-1], True)]
+
+                tmp = path.with_suffix(".tmp")
+                chunk.tofile(tmp)
+                os.replace(tmp, path)
+            self._last.pop((symbol, timeframe), None)
+        return len(rows)
+
+    def _split(self, rows: np.ndarray):
+        """Yield (month, rows of that month) for time-sorted rows."""
+        months = rows["time"].astype("datetime64[s]").astype("datetime64[M]")
+        starts = np.flatnonzero(np.append(True, months[1:] != months[:-1]))
+        for begin, end in zip(starts, np.append(starts[1:], len(rows))):
+            yield str(months[begin]), rows[begin:end]
+
+    def load(self, symbol: str, timeframe: str, start=None, end=None) -> np.ndarray:
+        """
+        Load the bars of a time range.
+
+        Only the months overlapping the range are touched, and only the rows inside
+        the range are read from them. The result is an independent copy; see
+        reader() for views.
+
+        Args:
+            symbol (str): Trading symbol.
+            timeframe (str): Timeframe string.
+            start (optional): First open time to include (see to_epoch). Default: all.
+            end (optional): Open time to stop before (see to_epoch). Default: all.
+
+        Returns:
+            np.ndarray: Structured array in the store's row layout, oldest first.
+        """
+        return self.reader(symbol, timeframe).read(start, end)
+
+    def reader(self, symbol: str, timeframe: str) -> "HistoryReader":
+        """
+        Return a memory-mapped reader over a series.
+
+        Args:
+            symbol (str): Trading symbol.
+            timeframe (str): Timeframe string.
+
+        Returns:
+            HistoryReader: Zero-copy access to the stored bars.
+        """
+        return HistoryReader(self, symbol, timeframe)
+
+    def load_frame(
+        self, symbol: str, timeframe: str, start=None, end=None
+    ) -> pd.DataFrame:
+        """
+        Load a time range as a DataFrame shaped like MT5Trader.fetch_ohlcv's.
+
+        Args:
+            symbol (str): Trading symbol.
+            timeframe (str): Timeframe string.
+            start (optional): First open time to include.
+            end (optional): Open time to stop before.
+
+        Returns:
+            pd.DataFrame: The bars with 'time' as datetimes.
+        """
+        df = pd.DataFrame(self.load(symbol, timeframe, start, end))
+        df["time"] = pd.to_datetime(df["time"], unit="s")
+        return df
+
+    def import_csv(
+        self,
+        path: str | os.PathLike,
+        symbol: str,
+        timeframe: str,
+        time_format: str | None = None,
+        columns: tuple[str, ...] = ("time", "open", "high", "low", "close"),
+    ) -> int:
+        """
+        Import a CSV of bars, e.g. a broker history export.
+
+        Args:
+            path (str | os.PathLike): The CSV file.
+            symbol (str): Trading symbol to store it under.
+            timeframe (str): Timeframe string to store it under.
+            time_format (str | None, optional): strptime format of the time column,
+                e.g. '%m/%d/%Y %H:%M'. Default: inferred.
+            columns (tuple[str, ...], optional): Names of the leading CSV columns, in
+                order; the rest are ignored. Default is time, open, high, low, close.
+
+        Returns:
+            int: Number of bars imported.
+
+        Raises:
+            ValueError: If the columns do not include time and close.
+        """
+        if "time" not in columns or "close" not in columns:
+            raise ValueError(f"⚠️ CSV columns must include time and close: {columns}")
+        df = pd.read_csv(path, usecols=range(len(columns)))
+        df.columns = list(columns)
+        df["time"] = pd.to_datetime(df["time"], format=time_format)
+        return self.write(symbol, timeframe, df)
+
+
+class HistoryReader:
+    """
+    Read-only, memory-mapped access to one series of a BarStore.
+
+    Month files are mapped rather than read, so a multi-GB history costs no memory
+    until rows are touched, and the OS can drop the pages again afterwards. chunks()
+    scans any range as a sequence of zero-copy views; window() and tail() return a
+    single view whenever the rows lie in one month file, which is the usual case for
+    indicator warm-up. Views stay valid while the reader is alive.
+
+    """
+
+    def __init__(self, store: BarStore, symbol: str, timeframe: str) -> None:
+        """
+        Initialize the reader.
+
+        Args:
+            store (BarStore): The store holding the series.
+            symbol (str): Trading symbol.
+            timeframe (str): Timeframe string.
+        """
+        self.store = store
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self._maps = {}
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Pick up bars stored since the reader was created.
+        """
+        self.months = self.store.months(self.symbol, self.timeframe)
+        # a month file that grew (append) or was replaced (write renames a new file
+        # over it) no longer matches its mapping, whichever month it is
+        for month, (stamp, _) in list(self._maps.items()):
+            if self._stamp(month) != stamp:
+                del self._maps[month]
+
+    def _stamp(self, month: str) -> tuple[int, int] | None:
+        try:
+            stat = self.store.path(self.symbol, self.timeframe, month).stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_size, stat.st_ino
+
+    def _map(self, month: str) -> np.ndarray:
+        if month not in self._maps:
+            path = self.store.path(self.symbol, self.timeframe, month)
+            stamp = self._stamp(month)
+            self._maps[month] = (stamp, np.memmap(path, self.store.dtype, "r"))
+        return self._maps[month][1]
+
+    def __len__(self) -> int:
+        itemsize = self.store.dtype.itemsize
+        return sum(
+            self.store.path(self.symbol, self.timeframe, month).stat().st_size
+            // itemsize
+            for month in self.months
+        )
+
+    def chunks(self, start=None, end=None):
+        """
+        Iterate over a time range as one read-only view per month file.
+
+        Feeding the chunks to streaming indicators (Indicators.streaming) or an
+        incremental consumer scans any length of history in constant memory.
+
+        Args:
+            start (optional): First open time to include (see to_epoch). Default: all.
+            end (optional): Open time to stop before (see to_epoch). Default: all.
+
+        Yields:
+            np.ndarray: Structured views of consecutive bars, oldest first.
+        """
+        start, end = to_epoch(start), to_epoch(end)
+        first = None if start is None else _month_of(start)
+        last = None if end is None else _month_of(end - 1)
+        for month in self.months:
+            if (first is not None and month < first) or (
+                last is not None and month > last
+            ):
+                continue
+            rows = self._map(month)
+            # binary search on the mapped time column touches only a few pages
+            lo = 0 if start is None else np.searchsorted(rows["time"], start)
+            hi = len(rows) if end is None else np.searchsorted(rows["time"], end)
+            if hi > lo:
+                yield rows[lo:hi]
+
+    def read(self, start=None, end=None) -> np.ndarray:
+        """
+        Copy a time range into one contiguous array.
+
+        Args:
+            start (optional): First open time to include. Default: all.
+            end (optional): Open time to stop before. Default: all.
+
+        Returns:
+            np.ndarray: A writable structured array, oldest first.
+        """
+        return _join(list(self.chunks(start, end)), self.store.dtype)
+
+    def window(self, start=None, end=None) -> np.ndarray:
+        """
+        Return a time range as a view when it lies in one month file, else a copy.
+
+        Args:
+            start (optional): First open time to include. Default: all.
+            end (optional): Open time to stop before. Default: all.
+
+        Returns:
+            np.ndarray: Structured array of the bars, oldest first.
+        """
+        parts = list(self.chunks(start, end))
+        return parts[0] if len(parts) == 1 else _join(parts, self.store.dtype)
+
+    def tail(self, n: int) -> np.ndarray:
+        """
+        Return the newest `n` bars, e.g. to warm up indicators on startup.
+
+        Args:
+            n (int): Number of bars.
+
+        Returns:
+            np.ndarray: A view when the bars lie in the newest month file, otherwise a
+            copy of just those bars.
+        """
+        parts = []
+        for month in reversed(self.months):
+            if n <= 0:
+                break
+            rows = self._map(month)
+            parts.append(rows[max(0, len(rows) - n) :])
+            n -= len(parts[-1])
+        parts.reverse()
+        if len(parts) == 1:
+            return parts[0]
+        return _join(parts, self.store.dtype)
+
+    def columns(self, names=("open", "high", "low", "close"), start=None, end=None):
+        """
+        Gather columns of a time range into contiguous float64 arrays.
+
+        The result is what the Indicators classes, batch.compute() and the backtester
+        consume, and costs 8 bytes per bar and column instead of a full record copy or
+        a DataFrame.
+
+        Args:
+            names (tuple[str, ...], optional): Columns to gather. Default is OHLC.
+            start (optional): First open time to include. Default: all.
+            end (optional): Open time to stop before. Default: all.
+
+        Returns:
+            dict[str, np.ndarray]: One array per column.
+        """
+        parts = list(self.chunks(start, end))
+        total = sum(len(part) for part in parts)
+        out = {name: np.empty(total, dtype=np.float64) for name in names}
+        offset = 0
+        for part in parts:
+            for name in names:
+                out[name][offset : offset + len(part)] = part[name]
+            offset += len(part)
+        return out
+
+
+def _join(parts: list[np.ndarray], dtype: np.dtype) -> np.ndarray:
+    out = np.empty(sum(len(part) for part in parts), dtype=dtype)
+    offset = 0
+    for part in parts:
+        out[offset : offset + len(part)] = part
+        offset += len(part)
+    return out
+
+
+def _month_of(epoch: int) -> str:
+    return str(np.datetime64(epoch, "s").astype("datetime64[M]"))
@@ -0,0 +1,351 @@
+import functools
+import math
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+# histogram bucket upper bounds in seconds (the last bucket is unbounded)
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.002,
+    0.005,
+    0.01,
+    0.02,
+    0.05,
+    0.1,
+    0.2,
+    0.5,
+    1.0,
+    2.0,
+    5.0,
+    math.inf,
+)
+
+
+class LatencyHistogram:
+    """
+    Latency distribution of one terminal call: fixed buckets for export plus a window
+    of recent samples for percentiles.
+
+    """
+
+    def __init__(self, recent: int = 1024) -> None:
+        """
+        Initialize an empty histogram.
+
+        Args:
+            recent (int, optional): Samples kept for percentiles. Default is 1024.
+        """
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent = deque(maxlen=recent)
+
+    def record(self, seconds: float) -> None:
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.recent.append(seconds)
+
+    def summary(self) -> dict:
+        """
+        Return count, mean, p50, p90, p99 and max, in milliseconds.
+
+        Returns:
+            dict: The summary; percentiles are over the recent window.
+        """
+        if not self.count:
+            return {"count": 0}
+        p50, p90, p99 = np.percentile(
+            np.fromiter(self.recent, float), [50, 90, 99]
+        ).tolist()
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count * 1000,
+            "p50_ms": p50 * 1000,
+            "p90_ms": p90 * 1000,
+            "p99_ms": p99 * 1000,
+            "max_ms": self.max * 1000,
+        }
+
+
+class SlippageStats:
+    """
+    Requested-vs-filled price deviation of market orders for one symbol.
+
+    Slippage is signed so that positive means worse for us: a buy filled above, or a
+    sell filled below, the requested price. Values are in points when the symbol's
+    point size is known, otherwise in price units.
+
+    """
+
+    def __init__(self, recent: int = 1024) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.worst = -math.inf
+        self.recent = deque(maxlen=recent)
+
+    def record(self, slippage: float) -> None:
+        self.count += 1
+        self.total += slippage
+        self.worst = max(self.worst, slippage)
+        self.recent.append(slippage)
+
+    def summary(self) -> dict:
+        """
+        Return count, mean, p50, p99 and worst slippage.
+
+        Returns:
+            dict: The summary; percentiles are over the recent window.
+        """
+        if not self.count:
+            return {"count": 0}
+        p50, p99 = np.percentile(np.fromiter(self.recent, float), [50, 99]).tolist()
+        return {
+            "count": self.count,
+            "mean": self.total / self.count,
+            "p50": p50,
+            "p99": p99,
+            "worst": self.worst,
+        }
+
+
+class TerminalMetrics:
+    """
+    Thread-safe registry of per-call latency histograms and per-symbol slippage.
+
+    """
+
+    def __init__(self) -> None:
+        self.calls = {}
+        self.errors = {}
+        self.slippage = {}
+        self._lock = threading.Lock()
+
+    def record_call(self, name: str, seconds: float, failed: bool = False) -> None:
+        """
+        Record one terminal call.
+
+        Args:
+            name (str): The MetaTrader5 function name, e.g. 'order_send'.
+            seconds (float): Wall time of the call.
+            failed (bool, optional): The call returned None or raised. Default is False.
+        """
+        with self._lock:
+            if name not in self.calls:
+                self.calls[name] = LatencyHistogram()
+                self.errors[name] = 0
+            self.calls[name].record(seconds)
+            self.errors[name] += failed
+
+    def record_fill(
+        self,
+        symbol: str,
+        is_buy: bool,
+        requested: float,
+        filled: float,
+        point: float | None = None,
+    ) -> float:
+        """
+        Record the slippage of a filled market order.
+
+        Args:
+            symbol (str): Trading symbol.
+            is_buy (bool): True for a buy.
+            requested (float): Price in the request.
+            filled (float): Price of the deal.
+            point (float | None, optional): Symbol point size, to report in points.
+
+        Returns:
+            float: The recorded slippage (positive is adverse).
+        """
+        slippage = filled - requested if is_buy else requested - filled
+        if point:
+            slippage /= point
+        with self._lock:
+            self.slippage.setdefault(symbol, SlippageStats()).record(slippage)
+        return slippage
+
+    def snapshot(self) -> dict:
+        """
+        Return all metrics as plain data, e.g. for logging or a JSON endpoint.
+
+        Returns:
+            dict: {'calls': {name: summary + errors}, 'slippage': {symbol: summary}}.
+        """
+        with self._lock:
+            return {
+                "calls": {
+                    name: {**hist.summary(), "errors": self.errors[name]}
+                    for name, hist in self.calls.items()
+                },
+                "slippage": {
+                    symbol: stats.summary() for symbol, stats in self.slippage.items()
+                },
+            }
+
+    def to_prometheus(self, prefix: str = "mt5") -> str:
+        """
+        Export the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix (str, optional): Metric name prefix. Default is 'mt5'.
+
+        Returns:
+            str: The exposition text.
+        """
+        lines = [f"# TYPE {prefix}_call_seconds histogram"]
+        with self._lock:
+            for name, hist in self.calls.items():
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, hist.buckets):
+                    cumulative += count
+                    le = "+Inf" if bound == math.inf else f"{bound:g}"
+                    lines.append(
+                        f'{prefix}_call_seconds_bucket{{call="{name}",le="{le}"}} {cumulative}'
+                    )
+                lines.append(f'{prefix}_call_seconds_sum{{call="{name}"}} {hist.total}')
+                lines.append(
+                    f'{prefix}_call_seconds_count{{call="{name}"}} {hist.count}'
+                )
+            # each family's samples must be contiguous, after its own TYPE line
+            lines.append(f"# TYPE {prefix}_call_errors_total counter")
+            for name in self.calls:
+                lines.append(
+                    f'{prefix}_call_errors_total{{call="{name}"}} {self.errors[name]}'
+                )
+            lines.append(f"# TYPE {prefix}_slippage summary")
+            for symbol, stats in self.slippage.items():
+                lines.append(
+                    f'{prefix}_slippage_sum{{symbol="{symbol}"}} {stats.total}'
+                )
+                lines.append(
+                    f'{prefix}_slippage_count{{symbol="{symbol}"}} {stats.count}'
+                )
+        return "\n".join(lines) + "\n"
+
+
+class InstrumentedTerminal:
+    """
+    Wraps the MetaTrader5 module (or a stand-in with the same API) and times every
+    function call into a TerminalMetrics. Constants are passed through unchanged.
+
+    Filled market orders (TRADE_ACTION_DEAL with a done result) also record their
+    slippage against the requested price. With a journal, every call is also written
+    as a 'latency' event and every order_send as an 'order' event.
+
+    """
+
+    def __init__(
+        self, terminal, metrics: TerminalMetrics, point_of=None, journal=None
+    ) -> None:
+        """
+        Initialize the wrapper.
+
+        Args:
+            terminal: The MetaTrader5 module or a compatible object.
+            metrics (TerminalMetrics): Where measurements are recorded.
+            point_of (Callable[[str], float | None] | None, optional): Returns a
+                symbol's point size, so slippage is recorded in points.
+            journal (Journal | None, optional): Where calls and orders are journaled
+                (see others.journal). Default is None.
+        """
+        self._terminal = terminal
+        self.metrics = metrics
+        self.point_of = point_of
+        self.journal = journal
+        self.journal_errors = 0  # calls whose journal records could not be written
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._terminal, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def timed(*args, **kwargs):
+            sent_ns = time.time_ns() if self.journal is not None else 0
+            start = time.perf_counter()
+            try:
+                result = attr(*args, **kwargs)
+            except Exception:
+                seconds = time.perf_counter() - start
+                self.metrics.record_call(name, seconds, True)
+                self._journal_call(name, args, kwargs, None, sent_ns, seconds)
+                raise
+            seconds = time.perf_counter() - start
+            # the journal write comes after the measurement, never inside it
+            self.metrics.record_call(name, seconds, result is None)
+            self._journal_call(name, args, kwargs, result, sent_ns, seconds)
+            if name == "order_send" and result is not None:
+                self._record_fill(args[0] if args else kwargs["request"], result)
+            return result
+
+        # cache the wrapper so later lookups skip __getattr__
+        setattr(self, name, timed)
+        return timed
+
+    def _journal_call(self, name, args, kwargs, result, sent_ns, seconds) -> None:
+        if self.journal is None:
+            return
+        try:
+            self._journal_records(name, args, kwargs, result, sent_ns, seconds)
+        except Exception:
+            # a journal failure must not replace the call's result or exception
+            self.journal_errors += 1
+
+    def _journal_records(self, name, args, kwargs, result, sent_ns, seconds) -> None:
+        self.journal.record(
+            "latency",
+            time_ns=sent_ns,
+            call=name,
+            seconds=seconds,
+            failed=result is None,
+        )
+        if name != "order_send":
+            return
+        request = args[0] if args else kwargs["request"]
+        self.journal.record(
+            "order",
+            time_ns=sent_ns,
+            symbol=request.get("symbol", ""),
+            action=request.get("action", 0),
+            type=request.get("type", 0),
+            volume=request.get("volume", 0.0),
+            price=request.get("price", 0.0),
+            sl=request.get("sl", 0.0),
+            tp=request.get("tp", 0.0),
+            position=request.get("position", request.get("order", 0)),
+            retcode=getattr(result, "retcode", 0),
+            order=getattr(result, "order", 0),
+            deal=getattr(result, "deal", 0),
+            fill_price=getattr(result, "price", 0.0),
+            latency=seconds,
+            comment=request.get("comment", ""),
+        )
+
+    def _record_fill(self, request: dict, result) -> None:
+        terminal = self._terminal
+        if (
+            request.get("action") != terminal.TRADE_ACTION_DEAL
+            or result.retcode != terminal.TRADE_RETCODE_DONE
+            or not request.get("price")
+            or not getattr(result, "price", 0)
+        ):
+            return
+        symbol = request["symbol"]
+        point = self.point_of(symbol) if self.point_of else None
+        self.metrics.record_fill(
+            symbol,
+            request["type"] == terminal.ORDER_TYPE_BUY,
+            request["price"],
+            result.price,
+            point,
+        )
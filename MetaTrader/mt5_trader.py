@@ -1,7 +1,23 @@
 # pyright: reportAttributeAccessIssue=false
-import MetaTrader5 as mt5
+import time
+
+import numpy as np
 import pandas as pd
 
+from .async_executor import AsyncOrderExecutor, OrderResult
+from .bar_store import BarStore
+from .instrumentation import InstrumentedTerminal, TerminalMetrics
+from .bar_scheduler import TIMEFRAME_SECONDS
+from .rate_buffer import RateStore
+from .resampler import Resampler
+from .symbol_cache import SymbolInfoCache, TickSnapshot
+from .trade_mirror import TradeMirror
+
+try:
+    import MetaTrader5 as mt5
+except ImportError:  # e.g. Linux, where only a SimulatedTerminal can be used
+    mt5 = None
+
 
 class MT5Trader:
     """
@@ -9,15 +25,79 @@ class MT5Trader:
 
     """
 
-    def __init__(self, logger) -> None:
+    def __init__(
+        self,
+        logger,
+        bars: int = 1000,
+        symbol_ttl: float = 60.0,
+        terminal=None,
+        instrument: bool = True,
+        store: BarStore | None = None,
+        journal=None,
+        mirror_interval: float = 5.0,
+        clock=time.monotonic,
+    ) -> None:
         """
         Initialize the MT5Trader class.
 
         Args:
             logger: A logger instance for logging messages.
+            bars (int, optional): Number of bars kept per symbol and timeframe. Default is 1000.
+            symbol_ttl (float, optional): Seconds symbol metadata is cached. Default is 60.
+            terminal (optional): The MetaTrader5 module or a compatible stand-in such
+                as a SimulatedTerminal. Defaults to the MetaTrader5 module.
+            instrument (bool, optional): Time every terminal call and record market
+                order slippage in `self.metrics`. Default is True.
+            store (BarStore | None, optional): Where closed bars seen by fetch_rates()
+                are persisted, so history survives restarts. Default is None.
+            journal (Journal | None, optional): Where every terminal call's latency
+                and every order request with its result are journaled (see
+                others.journal). Default is None.
+            mirror_interval (float, optional): Most seconds between reconciles of the
+                position/order mirror with the terminal (see TradeMirror); 0 queries
+                the terminal on every lookup. Default is 5.0.
+            clock (Callable[[], float], optional): Clock the mirror's interval is
+                measured on; pass SimulatedTerminal.clock when replaying. Defaults to
+                time.monotonic.
+
+        Raises:
+            ValueError: If no terminal is given and MetaTrader5 is not installed.
         """
+        if terminal is None:
+            if mt5 is None:
+                raise ValueError(
+                    "⚠️ MetaTrader5 is not installed. Pass a terminal, e.g. a SimulatedTerminal."
+                )
+            terminal = mt5
+        self.metrics = TerminalMetrics()
+        self.journal = journal
+        self.mt5 = (
+            InstrumentedTerminal(terminal, self.metrics, self._point_of, journal)
+            if instrument or journal is not None
+            else terminal
+        )
         self.logger = logger
         self.is_connected = False
+        self.rates = RateStore(bars)
+        self.store = store
+        self.resamplers = {}
+        self.symbols = SymbolInfoCache(self.mt5.symbol_info, symbol_ttl)
+        self.mirror = TradeMirror(self.mt5, mirror_interval, clock)
+        self.order_executor = AsyncOrderExecutor(self._order_send)
+
+    def _point_of(self, symbol: str) -> float | None:
+        meta = self.symbols.get(symbol)
+        return meta.point if meta is not None else None
+
+    def _order_send(self, request: dict):
+        """Send an order request and apply its result to the mirror."""
+        try:
+            result = self.mt5.order_send(request)
+        except Exception:
+            self.mirror.invalidate()
+            raise
+        self.mirror.apply(request, result)
+        return result
 
     def connect(self, account: int, password: str, server: str) -> bool:
         """
@@ -34,17 +114,24 @@ class MT5Trader:
         Raises:
             ValueError: If initialization or login fails.
         """
-        if not mt5.initialize():
+        if not self.mt5.initialize():
             self.logger.error(" ⚠️ Failed to initialize MetaTrader5.")
             raise ValueError(" ⚠️ Failed to initialize MetaTrader5.")
 
-        authorized = mt5.login(account, password, server)
+        authorized = self.mt5.login(account, password, server)
         if not authorized:
             self.logger.error(" ⚠️ Failed to log in MetaTrader5 account.")
-            mt5.shutdown()
+            self.mt5.shutdown()
             raise ValueError(" ⚠️ Failed to log in MetaTrader5 account.")
 
         self.is_connected = True
+        # the mirror can follow market orders itself only on hedging accounts
+        info = self.mt5.account_info()
+        if info is not None:
+            self.mirror.hedging = (
+                info.margin_mode == self.mt5.ACCOUNT_MARGIN_MODE_RETAIL_HEDGING
+            )
+        self.mirror.invalidate()
         self.logger.info(" ✅ Successfully connected to MetaTrader5.")
         return True
 
@@ -52,7 +139,7 @@ class MT5Trader:
         """
         Disconnect from MetaTrader5 and clean up resources.
         """
-        mt5.shutdown()
+        self.mt5.shutdown()
         self.is_connected = False
         self.logger.info(" ✅ Successfully disconnected from MetaTrader5.")
 
@@ -67,25 +154,32 @@ class MT5Trader:
             int | None: MT5 timeframe constant, or None if invalid.
         """
         switch = {
-            "M1": mt5.TIMEFRAME_M1,
-            "M5": mt5.TIMEFRAME_M5,
-            "M15": mt5.TIMEFRAME_M15,
-            "M30": mt5.TIMEFRAME_M30,
-            "H1": mt5.TIMEFRAME_H1,
-            "H4": mt5.TIMEFRAME_H4,
+            "M1": self.mt5.TIMEFRAME_M1,
+            "M5": self.mt5.TIMEFRAME_M5,
+            "M15": self.mt5.TIMEFRAME_M15,
+            "M30": self.mt5.TIMEFRAME_M30,
+            "H1": self.mt5.TIMEFRAME_H1,
+            "H4": self.mt5.TIMEFRAME_H4,
         }
         return switch.get(timeframe, None)
 
-    def fetch_ohlcv(self, symbol: str, timeframe: str) -> pd.DataFrame:
+    def fetch_rates(self, symbol: str, timeframe: str) -> np.ndarray:
         """
-        Fetch OHLCV data for a given symbol and timeframe.
+        Fetch OHLCV bars for a given symbol and timeframe, incrementally.
+
+        The first call loads `bars` bars; later calls only request the bars from the
+        newest buffered one onwards (usually 2: the just-closed bar and the forming
+        one) and merge them into the series' ring buffer in `self.rates`. With a
+        `store`, the buffer starts from the stored history instead of a full
+        download, and newly closed bars are appended to the store.
 
         Args:
             symbol (str): Trading symbol (e.g., 'XAUUSD').
             timeframe (str): Timeframe string (e.g., 'M1', 'H1').
 
         Returns:
-            pd.DataFrame: DataFrame containing OHLCV data with time column.
+            np.ndarray: Read-only structured array of the buffered bars, oldest first,
+            with the raw epoch-seconds 'time' column. Valid until the next fetch.
 
         Raises:
             ValueError: If not connected or invalid parameters.
@@ -99,18 +193,113 @@ class MT5Trader:
             self.logger.error(" ⚠️ Invalid timeframe provided.")
             raise ValueError(" ⚠️ Invalid timeframe provided.")
 
-        rates = mt5.copy_rates_from_pos(symbol, mt5_timeframe, 0, 1000)
-        if rates is None or len(rates) == 0:
+        buffer = self.rates.buffer(symbol, timeframe)
+        if not len(buffer) and self.store is not None:
+            # warm start from the persisted history, so refresh() only fetches the gap
+            buffer.merge(self.store.reader(symbol, timeframe).tail(buffer.capacity))
+        fetched = buffer.refresh(
+            lambda count: self.mt5.copy_rates_from_pos(symbol, mt5_timeframe, 0, count)
+        )
+        if fetched is None:
             self.logger.error(" ⚠️ Failed to get MetaTrader5 rates.")
             raise ValueError(" ⚠️ Failed to get MetaTrader5 rates.")
 
-        df = pd.DataFrame(rates)
+        rates = buffer.view()
+        if self.store is not None and fetched:
+            # the bars that closed with this fetch: the previously forming one and
+            # the new ones but the newest, which is still forming
+            self.store.append(symbol, timeframe, rates[-fetched - 1 : -1])
+        return rates
+
+    def resampled_rates(
+        self, symbol: str, timeframe: str, base_timeframe: str = "M1"
+    ) -> np.ndarray:
+        """
+        Derive a higher timeframe from the buffered base bars, without terminal I/O.
+
+        Call fetch_rates(symbol, base_timeframe) once per poll; every timeframe derived
+        from it is then current, including its forming bar. Without a `store` the
+        depth is bounded by the base buffer (1000 M1 bars give about 16 H1 bars); with
+        one, the first call seeds `bars` higher bars from the stored base history.
+
+        Args:
+            symbol (str): Trading symbol (e.g., 'XAUUSD').
+            timeframe (str): Target timeframe (e.g., 'M15', 'H1').
+            base_timeframe (str, optional): Timeframe of the feed. Default is 'M1'.
+
+        Returns:
+            np.ndarray: Read-only structured array of the higher bars, oldest first.
+            Valid until the next call for the same series.
+
+        Raises:
+            ValueError: If the base series has not been fetched or the timeframes
+                are invalid.
+        """
+        if (symbol, base_timeframe) not in self.rates:
+            self.logger.error(f" ⚠️ No {base_timeframe} bars fetched for {symbol}.")
+            raise ValueError(f" ⚠️ No {base_timeframe} bars fetched for {symbol}.")
+
+        key = (symbol, timeframe, base_timeframe)
+        resampler = self.resamplers.get(key)
+        if resampler is None:
+            resampler = Resampler(timeframe, self.rates.capacity, base_timeframe)
+            if self.store is not None:
+                ratio = (
+                    TIMEFRAME_SECONDS[timeframe] // TIMEFRAME_SECONDS[base_timeframe]
+                )
+                history = self.store.reader(symbol, base_timeframe)
+                resampler.update(history.tail(self.rates.capacity * ratio))
+            self.resamplers[key] = resampler
+
+        resampler.update(self.rates.buffer(symbol, base_timeframe).view())
+        return resampler.view()
+
+    def fetch_ohlcv(self, symbol: str, timeframe: str) -> pd.DataFrame:
+        """
+        Fetch OHLCV data for a given symbol and timeframe.
+
+        Args:
+            symbol (str): Trading symbol (e.g., 'XAUUSD').
+            timeframe (str): Timeframe string (e.g., 'M1', 'H1').
+
+        Returns:
+            pd.DataFrame: DataFrame containing OHLCV data with time column.
+
+        Raises:
+            ValueError: If not connected or invalid parameters.
+        """
+        df = pd.DataFrame(self.fetch_rates(symbol, timeframe))
         df["time"] = pd.to_datetime(df["time"], unit="s")
         return df
 
+    def sync_trades(self, force: bool = False) -> None:
+        """
+        Reconcile the position/order mirror with the terminal if it is due.
+
+        Args:
+            force (bool, optional): Reconcile even if it is not due. Default is False.
+
+        Raises:
+            ValueError: If positions or orders cannot be retrieved.
+        """
+        if not force and not self.mirror.due():
+            return
+        applied = self.mirror.applied
+        positions = self.mt5.positions_get()
+        if positions is None:
+            self.logger.error("⚠️ Failed to retrieve positions.")
+            raise ValueError("⚠️ Failed to retrieve positions.")
+        orders = self.mt5.orders_get()
+        if orders is None:
+            self.logger.error(" ⚠️ Failed to retrieve pending orders.")
+            raise ValueError(" ⚠️ Failed to retrieve pending orders.")
+        drift = self.mirror.reconcile(positions, orders, applied)
+        if drift:
+            self.logger.info(f" Trade mirror reconciled, {drift} changes picked up.")
+
     def get_positions(self) -> int:
         """
-        Retrieve and count all currently open positions.
+        Count all currently open positions, from the mirror.
 
         Returns:
             int: Number of open positions.
@@ -118,62 +307,122 @@ class MT5Trader:
         Raises:
             ValueError: If positions cannot be retrieved.
         """
-        positions = mt5.positions_get()
-        if positions is None:
-            self.logger.error("⚠️ Failed to retrieve positions.")
-            raise ValueError("⚠️ Failed to retrieve positions.")
-        return len(positions)
+        self.sync_trades()
+        return self.mirror.count_positions()
+
+    def count_positions(
+        self,
+        symbol: str | None = None,
+        direction: str | None = None,
+        magic: int | None = None,
+    ) -> int:
+        """
+        Count the open positions matching every given filter, from the mirror.
 
-    def close_position(self, symbol: str, direction: str) -> None:
+        Args:
+            symbol (str | None, optional): Trading symbol, e.g. "XAUUSD".
+            direction (str | None, optional): "buy" (long) or "sell" (short).
+            magic (int | None, optional): Magic number of the opening order.
+
+        Returns:
+            int: Number of positions.
+
+        Raises:
+            ValueError: If the direction is invalid or positions cannot be retrieved.
+        """
+        type_id = None
+        if direction is not None:
+            if direction.lower() not in ("buy", "sell"):
+                raise ValueError(f" ⚠️ Invalid direction: {direction}")
+            type_id = (
+                self.mt5.POSITION_TYPE_BUY
+                if direction.lower() == "buy"
+                else self.mt5.POSITION_TYPE_SELL
+            )
+        self.sync_trades()
+        return self.mirror.count_positions(symbol, type_id, magic)
+
+    def count_orders(
+        self,
+        symbol: str | None = None,
+        order_type: str | None = None,
+        magic: int | None = None,
+    ) -> int:
+        """
+        Count the pending orders matching every given filter, from the mirror.
+
+        Args:
+            symbol (str | None, optional): Trading symbol, e.g. "XAUUSD".
+            order_type (str | None, optional): "buy_limit", "sell_limit", "buy_stop"
+                or "sell_stop".
+            magic (int | None, optional): Magic number.
+
+        Returns:
+            int: Number of pending orders.
+
+        Raises:
+            ValueError: If the order type is unknown or orders cannot be retrieved.
+        """
+        type_id = self._order_type_id(order_type)
+        self.sync_trades()
+        return self.mirror.count_orders(symbol, type_id, magic)
+
+    def close_position(
+        self, symbol: str, direction: str, magic: int | None = None
+    ) -> None:
         """
         Close all open positions for a given symbol and side.
 
         Args:
             symbol (str): Trading symbol, e.g. "XAUUSD".
             direction (str): Side to close: "buy" for long positions, "sell" for short positions.
+            magic (int | None, optional): Only close positions opened with this magic
+                number. Default None closes them all.
 
         Raises:
             ValueError: If unable to fetch positions or if the close order fails.
         """
-        # Fetch all positions for this symbol
-        positions = mt5.positions_get(symbol=symbol)
-        if positions is None:
-            self.logger.error(" ⚠️ Failed to retrieve open positions.")
-            raise ValueError(" ⚠️ Failed to retrieve open positions.")
+        # all positions of this symbol (and magic), from the mirror
+        self.sync_trades()
+        positions = self.mirror.select_positions(symbol, magic=magic)
 
+        # one tick for the whole batch instead of one per position
+        ticks = TickSnapshot(self.mt5.symbol_info_tick)
         for pos in positions:
-            # mt5.POSITION_TYPE_BUY == 0 (long), POSITION_TYPE_SELL == 1 (short)
-            if direction.lower() == "buy" and pos.type == mt5.POSITION_TYPE_BUY:
-                close_type = mt5.ORDER_TYPE_SELL
+            # self.mt5.POSITION_TYPE_BUY == 0 (long), POSITION_TYPE_SELL == 1 (short)
+            if direction.lower() == "buy" and pos.type == self.mt5.POSITION_TYPE_BUY:
+                close_type = self.mt5.ORDER_TYPE_SELL
                 volume = pos.volume
-            elif direction.lower() == "sell" and pos.type == mt5.POSITION_TYPE_SELL:
-                close_type = mt5.ORDER_TYPE_BUY
+            elif (
+                direction.lower() == "sell" and pos.type == self.mt5.POSITION_TYPE_SELL
+            ):
+                close_type = self.mt5.ORDER_TYPE_BUY
                 volume = pos.volume
             else:
                 continue  # skip positions that don’t match the target side
 
             # Get current market price
-            tick = mt5.symbol_info_tick(symbol)
+            tick = ticks.get(symbol)
             if tick is None:
                 self.logger.error(f"⚠️ Failed to get tick data for {symbol}.")
                 raise ValueError(f"⚠️ Failed to get tick data for {symbol}.")
 
-            price = tick.bid if close_type == mt5.ORDER_TYPE_SELL else tick.ask
+            price = tick.bid if close_type == self.mt5.ORDER_TYPE_SELL else tick.ask
 
             # Build the close order request
             request = {
-                "action": mt5.TRADE_ACTION_DEAL,
+                "action": self.mt5.TRADE_ACTION_DEAL,
                 "symbol": symbol,
                 "volume": volume,
                 "type": close_type,
                 "position": pos.ticket,
                 "price": price,
-                "type_time": mt5.ORDER_TIME_GTC,
-                "type_filling": mt5.ORDER_FILLING_IOC,
+                "type_time": self.mt5.ORDER_TIME_GTC,
+                "type_filling": self.mt5.ORDER_FILLING_IOC,
             }
 
-            result = mt5.order_send(request)
-            if result is None or result.retcode != mt5.TRADE_RETCODE_DONE:
+            result = self._order_send(request)
+            if result is None or result.retcode != self.mt5.TRADE_RETCODE_DONE:
                 error_comment = result.comment if result else "No result returned"
                 self.logger.error(f" ⚠️ Close order failed: {error_comment}")
                 # raise ValueError(f" ⚠️ Close order failed: {error_comment}")
@@ -194,40 +443,11 @@ class MT5Trader:
         Raises:
             ValueError: If failed to retrieve or remove pending orders.
         """
-        type_map = {
-            "buy_limit": mt5.ORDER_TYPE_BUY_LIMIT,
-            "sell_limit": mt5.ORDER_TYPE_SELL_LIMIT,
-            "buy_stop": mt5.ORDER_TYPE_BUY_STOP,
-            "sell_stop": mt5.ORDER_TYPE_SELL_STOP,
-        }
-
-        type_id = None
-        if order_type is not None:
-            order_type_lower = order_type.lower()
-            if order_type_lower not in type_map:
-                self.logger.error(" ⚠️ Unknown order_type: {order_type}")
-                raise ValueError(f" ⚠️ Unknown order_type: {order_type}")
-            type_id = type_map[order_type_lower]
-
-        pending_orders = mt5.orders_get()
-
-        if pending_orders is None:
-            self.logger.error(" ⚠️ Failed to retrieve pending orders.")
-            raise ValueError(" ⚠️ Failed to retrieve pending orders.")
-
         removed_count = 0
-        for order in pending_orders:
-            if type_id is not None and order.type != type_id:
-                continue
+        for order, request in self._removal_requests(order_type):
+            result = self._order_send(request)
 
-            request = {
-                "action": mt5.TRADE_ACTION_REMOVE,
-                "order": order.ticket,
-            }
-
-            result = mt5.order_send(request)
-
-            if result.retcode == mt5.TRADE_RETCODE_DONE:
+            if result.retcode == self.mt5.TRADE_RETCODE_DONE:
                 msg = f" ✅ Successfully removed order {order.ticket} (type {order.type})."
                 print(msg)
                 self.logger.info(msg)
@@ -240,6 +460,30 @@ class MT5Trader:
         if removed_count == 0:
             print(" ⚠️ No matching pending orders were removed.")
 
+    def _order_type_id(self, order_type: str | None) -> int | None:
+        """Map a pending order type name to its MT5 constant (None stays None)."""
+        type_map = {
+            "buy_limit": self.mt5.ORDER_TYPE_BUY_LIMIT,
+            "sell_limit": self.mt5.ORDER_TYPE_SELL_LIMIT,
+            "buy_stop": self.mt5.ORDER_TYPE_BUY_STOP,
+            "sell_stop": self.mt5.ORDER_TYPE_SELL_STOP,
+        }
+        if order_type is None:
+            return None
+        if order_type.lower() not in type_map:
+            self.logger.error(f" ⚠️ Unknown order_type: {order_type}")
+            raise ValueError(f" ⚠️ Unknown order_type: {order_type}")
+        return type_map[order_type.lower()]
+
+    def _removal_requests(self, order_type: str | None) -> list[tuple]:
+        """Return (order, remove request) pairs for the matching pending orders."""
+        type_id = self._order_type_id(order_type)
+        self.sync_trades()
+        return [
+            (order, {"action": self.mt5.TRADE_ACTION_REMOVE, "order": order.ticket})
+            for order in self.mirror.select_orders(type_=type_id)
+        ]
+
     def place_market_order(
         self,
         symbol: str,
@@ -248,6 +492,7 @@ class MT5Trader:
         atr: float,
         tp_k: float = 2.0,
         sl_k: float = 1.0,
+        magic: int = 0,
     ) -> None:
         """
         Places a market order with stop loss and take profit based on ATR.
@@ -259,6 +504,8 @@ class MT5Trader:
             atr (float): Average True Range, used to calculate SL/TP distances.
             tp_k (float, optional): Take-profit multiplier of ATR. Defaults to 2.0.
             sl_k (float, optional): Stop-loss multiplier of ATR. Defaults to 1.0.
+            magic (int, optional): Magic number of the position, so its owner can
+                count and close only its own. Defaults to 0.
 
         Raises:
             ValueError: If order fails to send.
@@ -267,17 +514,19 @@ class MT5Trader:
             self.error(f" ⚠️ Invalid direction: {direction}")
             raise ValueError(f" ⚠️ Invalid direction: {direction}")
 
-        info_tick = mt5.symbol_info_tick(symbol)
+        info_tick = self.mt5.symbol_info_tick(symbol)
         if info_tick is None:
             self.error(f" ⚠️ Failed to get tick data for symbol {symbol}")
             raise ValueError(f" ⚠️ Failed to get tick data for symbol {symbol}")
 
         price = info_tick.ask if direction.lower() == "buy" else info_tick.bid
         order_type = (
-            mt5.ORDER_TYPE_BUY if direction.lower() == "buy" else mt5.ORDER_TYPE_SELL
+            self.mt5.ORDER_TYPE_BUY
+            if direction.lower() == "buy"
+            else self.mt5.ORDER_TYPE_SELL
         )
 
-        symbol_info = mt5.symbol_info(symbol)
+        symbol_info = self.symbols.get(symbol)
         if symbol_info is None:
             self.error(f" ⚠️ Failed to get symbol info for {symbol}")
             raise ValueError(f" ⚠️ Failed to get symbol info for {symbol}")
@@ -290,18 +539,19 @@ class MT5Trader:
         tp = price + tp_dist if direction.lower() == "buy" else price - tp_dist
 
         request = {
-            "action": mt5.TRADE_ACTION_DEAL,
+            "action": self.mt5.TRADE_ACTION_DEAL,
             "symbol": symbol,
             "volume": lot,
             "type": order_type,
             "price": round(price, digits),
             "sl": round(sl, digits),
             "tp": round(tp, digits),
-            "type_time": mt5.ORDER_TIME_GTC,
-            "type_filling": mt5.ORDER_FILLING_IOC,
+            "magic": magic,
+            "type_time": self.mt5.ORDER_TIME_GTC,
+            "type_filling": self.mt5.ORDER_FILLING_IOC,
         }
 
-        result = mt5.order_send(request)
+        result = self._order_send(request)
 
         if result is None:
             self.logger.error(" ⚠️ Failed to send order request. Request: %s", request)
@@ -309,7 +559,7 @@ class MT5Trader:
 
         self.logger.info(" ✅ Order request sent. Result: %s", result)
 
-        if result.retcode == mt5.TRADE_RETCODE_DONE:
+        if result.retcode == self.mt5.TRADE_RETCODE_DONE:
             print(f" ✅ Order placed successfully at price: {round(price, digits)}")
             self.logger.info(
                 " ✅ Order placed successfully at price: %s", round(price, digits)
@@ -346,20 +596,52 @@ class MT5Trader:
         Raises:
             ValueError: If any order placement fails.
         """
+        requests = self._grid_requests(
+            direction, symbol, lot, max_grid_orders, atr, grid_step, tp_k, sl_k
+        )
+        for i, request in enumerate(requests):
+            grid_price = request["price"]
+            result = self._order_send(request)
+
+            if result is None:
+                self.logger.error(
+                    f" ⚠️ Grid order {i+1} failed to send. Request: {request}"
+                )
+                raise ValueError(" ⚠️ Failed to send grid order.")
+            elif result.retcode != self.mt5.TRADE_RETCODE_DONE:
+                self.logger.error(f" ⚠️ Grid order {i+1} failed: {result.comment}")
+                raise ValueError(f" ⚠️ Grid order failed: {result.comment}")
+            else:
+                print(f" ✅ Grid order {i+1} placed at {grid_price}")
+                self.logger.info(f" ✅ Grid order {i+1} placed at {grid_price}")
+
+    def _grid_requests(
+        self,
+        direction: str,
+        symbol: str,
+        lot: float,
+        max_grid_orders: int,
+        atr: float,
+        grid_step: float,
+        tp_k: float,
+        sl_k: float,
+    ) -> list[dict]:
+        """Build the pending-order requests of a grid (see place_grid_orders)."""
         if direction.lower() not in ("buy", "sell"):
             raise ValueError(f" ⚠️ Invalid direction: {direction}")
 
-        tick = mt5.symbol_info_tick(symbol)
+        tick = self.mt5.symbol_info_tick(symbol)
         if tick is None:
             raise ValueError(f" ⚠️ Failed to get tick info for symbol {symbol}")
 
         price = tick.ask if direction.lower() == "buy" else tick.bid
 
-        symbol_info = mt5.symbol_info(symbol)
+        symbol_info = self.symbols.get(symbol)
         if symbol_info is None:
             raise ValueError(f" ⚠️ Failed to get symbol info for {symbol}")
         digits = symbol_info.digits
 
+        requests = []
         for i in range(max_grid_orders):
             grid_price = (
                 price - i * grid_step
@@ -380,35 +662,97 @@ class MT5Trader:
             )
 
             request = {
-                "action": mt5.TRADE_ACTION_PENDING,
+                "action": self.mt5.TRADE_ACTION_PENDING,
                 "symbol": symbol,
                 "volume": lot,
                 "type": (
-                    mt5.ORDER_TYPE_BUY_LIMIT
+                    self.mt5.ORDER_TYPE_BUY_LIMIT
                     if direction.lower() == "buy"
-                    else mt5.ORDER_TYPE_SELL_LIMIT
+                    else self.mt5.ORDER_TYPE_SELL_LIMIT
                 ),
                 "price": round(grid_price, digits),
                 "sl": round(sl, digits),
                 "tp": round(tp, digits),
                 "comment": f"Grid Order {direction.upper()} #{i+1}",
-                "type_time": mt5.ORDER_TIME_GTC,
-                "type_filling": mt5.ORDER_FILLING_IOC,
+                "type_time": self.mt5.ORDER_TIME_GTC,
+                "type_filling": self.mt5.ORDER_FILLING_IOC,
             }
+            requests.append(request)
 
-            result = mt5.order_send(request)
+        return requests
 
-            if result is None:
-                self.logger.error(
-                    f" ⚠️ Grid order {i+1} failed to send. Request: {request}"
-                )
-                raise ValueError(" ⚠️ Failed to send grid order.")
-            elif result.retcode != mt5.TRADE_RETCODE_DONE:
-                self.logger.error(f" ⚠️ Grid order {i+1} failed: {result.comment}")
-                raise ValueError(f" ⚠️ Grid order failed: {result.comment}")
-            else:
-                print(f" ✅ Grid order {i+1} placed at {grid_price}")
-                self.logger.info(f" ✅ Grid order {i+1} placed at {grid_price}")
+    async def place_grid_orders_async(
+        self,
+        direction: str,
+        symbol: str,
+        lot: float,
+        max_grid_orders: int,
+        atr: float,
+        grid_step: float,
+        tp_k: float = 2.5,
+        sl_k: float = 1.5,
+    ) -> list[OrderResult]:
+        """
+        Places a grid like place_grid_orders, without blocking the event loop.
+
+        The levels are queued on the order executor and sent one at a time, like every
+        other terminal call. Results are logged as they complete, with the time
+        order_send took.
+
+        Args:
+            direction (str): "buy" or "sell".
+            symbol (str): Trading symbol, e.g. "XAUUSD".
+            lot (float): Lot size for each order.
+            max_grid_orders (int): Total number of grid orders to place.
+            atr (float): Average True Range value for calculating SL/TP.
+            grid_step (float): Distance between each grid order.
+            tp_k (float, optional): TP multiplier of ATR. Default is 2.5.
+            sl_k (float, optional): SL multiplier of ATR. Default is 1.5.
+
+        Returns:
+            list[OrderResult]: One result per grid level, in level order. Failed levels
+            are logged, not raised, so the caller can decide what to do with the rest.
+
+        Raises:
+            ValueError: If the direction is invalid or tick/symbol data is unavailable.
+        """
+        requests = self._grid_requests(
+            direction, symbol, lot, max_grid_orders, atr, grid_step, tp_k, sl_k
+        )
+        return await self.order_executor.send_batch(requests, self._log_async_result)
+
+    async def remove_pending_orders_async(
+        self, order_type: str | None = None
+    ) -> list[OrderResult]:
+        """
+        Remove pending orders like remove_pending_orders, without blocking the event loop.
+
+        Args:
+            order_type (str | None): Type of order to remove, one of:
+                "buy_limit", "sell_limit", "buy_stop", "sell_stop", or None to remove all.
+
+        Returns:
+            list[OrderResult]: One result per removed order.
+
+        Raises:
+            ValueError: If the order type is unknown or pending orders cannot be retrieved.
+        """
+        requests = [request for _, request in self._removal_requests(order_type)]
+        return await self.order_executor.send_batch(requests, self._log_async_result)
+
+    def _log_async_result(self, result: OrderResult) -> None:
+        latency_ms = result.latency * 1000
+        if result.ok(self.mt5.TRADE_RETCODE_DONE):
+            self.logger.info(
+                f" ✅ Request done in {latency_ms:.1f} ms: {result.request}"
+            )
+        else:
+            reason = result.error or (
+                result.result.comment if result.result else "No result returned"
+            )
+            self.logger.error(
+                f" ⚠️ Request failed in {latency_ms:.1f} ms ({reason}): {result.request}"
+            )
 
 
 from others.log_manager import LogManager
@@ -0,0 +1,244 @@
+from collections.abc import Callable
+
+import numpy as np
+
+# layout of the structured arrays returned by mt5.copy_rates_*
+RATE_DTYPE = np.dtype(
+    [
+        ("time", "<i8"),
+        ("open", "<f8"),
+        ("high", "<f8"),
+        ("low", "<f8"),
+        ("close", "<f8"),
+        ("tick_volume", "<u8"),
+        ("spread", "<i4"),
+        ("real_volume", "<u8"),
+    ]
+)
+
+
+class RateBuffer:
+    """
+    A fixed-capacity ring buffer of MetaTrader5 bars for one symbol and timeframe.
+
+    Rows are kept in the structured dtype returned by mt5.copy_rates_*, oldest first.
+    Storage is allocated once, so memory per buffer is fixed at `nbytes`. Every row is
+    written twice (at i and i + capacity), so the newest `n` rows are always one
+    contiguous slice and window() never copies.
+
+    """
+
+    def __init__(self, capacity: int = 1000, dtype: np.dtype = RATE_DTYPE) -> None:
+        """
+        Initialize an empty buffer.
+
+        Args:
+            capacity (int, optional): Maximum number of bars kept. Default is 1000.
+            dtype (np.dtype, optional): Row layout. Defaults to the MT5 rates layout.
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError(f"⚠️ Invalid buffer capacity: {capacity}")
+        self.capacity = capacity
+        self._data = np.zeros(2 * capacity, dtype=dtype)
+        self._head = 0  # next write position, modulo capacity
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory held by the buffer, independent of how many bars it contains.
+        """
+        return self._data.nbytes
+
+    @property
+    def last_time(self) -> int | None:
+        """
+        Open time (epoch seconds) of the newest bar, or None if the buffer is empty.
+        """
+        if self._count == 0:
+            return None
+        return int(self._data["time"][(self._head - 1) % self.capacity])
+
+    def clear(self) -> None:
+        """
+        Drop all bars, keeping the allocated storage.
+        """
+        self._head = 0
+        self._count = 0
+
+    def append(self, bar) -> None:
+        """
+        Append one bar in O(1), dropping the oldest bar when the buffer is full.
+
+        Args:
+            bar: A record or tuple in the buffer's row layout.
+        """
+        self._data[self._head] = bar
+        self._data[self._head + self.capacity] = bar
+        self._head = (self._head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def merge(self, rates: np.ndarray) -> int:
+        """
+        Merge bars fetched from the terminal into the buffer.
+
+        Bars with the same open time as the newest buffered bar replace it (the bar
+        was still forming when it was last fetched); newer bars are appended and the
+        oldest ones drop out once the buffer is full. Older bars are ignored.
+
+        Args:
+            rates (np.ndarray): Structured array from mt5.copy_rates_*, sorted by time.
+
+        Returns:
+            int: Number of bars appended.
+        """
+        if len(rates) == 0:
+            return 0
+
+        last = self.last_time
+        if last is not None:
+            times = rates["time"]
+            current = np.flatnonzero(times == last)
+            if len(current):
+                newest = np.array([(self._head - 1) % self.capacity])
+                self._write(newest, rates[current[-1:]])
+            rates = rates[times > last]
+
+        rates = rates[-self.capacity :]
+        positions = (self._head + np.arange(len(rates))) % self.capacity
+        self._write(positions, rates)
+        self._head = (self._head + len(rates)) % self.capacity
+        self._count = min(self._count + len(rates), self.capacity)
+        return len(rates)
+
+    def _write(self, positions: np.ndarray, rows: np.ndarray) -> None:
+        self._data[positions] = rows
+        self._data[positions + self.capacity] = rows
+
+    def refresh(self, fetch: Callable[[int], np.ndarray | None]) -> int | None:
+        """
+        Bring the buffer up to date with as few bars as possible.
+
+        An empty buffer is filled with `capacity` bars. Otherwise only the last 2 bars
+        (the just-closed one and the forming one) are requested; if they no longer
+        overlap the buffer the request is widened, and if even `capacity` bars do not
+        overlap, the buffer restarts from the fetched bars.
+
+        Args:
+            fetch (Callable[[int], np.ndarray | None]): Returns the newest `count` bars,
+                e.g. lambda count: mt5.copy_rates_from_pos(symbol, timeframe, 0, count).
+
+        Returns:
+            int | None: Number of bars appended, or None if fetch returned no data.
+        """
+        count = 2 if self._count else self.capacity
+        while True:
+            rates = fetch(count)
+            if rates is None or len(rates) == 0:
+                return None
+
+            # the fetched bars must overlap the buffer, otherwise bars were missed
+            if self._count == 0 or rates["time"][0] <= self.last_time:
+                break
+            if count >= self.capacity:
+                self.clear()
+                break
+            count = min(count * 8, self.capacity)
+
+        return self.merge(rates)
+
+    def window(self, n: int | None = None) -> np.ndarray:
+        """
+        Return the newest `n` bars, oldest first, as a read-only view.
+
+        The view shares memory with the buffer and is only valid until the next
+        append or merge; take a copy if a snapshot must outlive the next fetch.
+
+        Args:
+            n (int | None, optional): Number of bars. Defaults to all buffered bars.
+
+        Returns:
+            np.ndarray: Structured array of up to `n` bars.
+        """
+        n = self._count if n is None else min(n, self._count)
+        start = (self._head - n) % self.capacity
+        rows = self._data[start : start + n]
+        rows.flags.writeable = False
+        return rows
+
+    def view(self) -> np.ndarray:
+        """
+        Return all buffered bars, oldest first, as a read-only view (see window()).
+
+        Returns:
+            np.ndarray: Structured array of up to `capacity` bars.
+        """
+        return self.window()
+
+
+class RateStore:
+    """
+    Long-lived market data for many symbols: one RateBuffer per (symbol, timeframe).
+
+    Every buffer has the same fixed capacity, so memory grows only with the number of
+    series monitored (120 KB per 1000 bars, mirrored storage included) and stays flat
+    while running.
+
+    """
+
+    def __init__(self, capacity: int = 1000) -> None:
+        """
+        Initialize an empty store.
+
+        Args:
+            capacity (int, optional): Bars kept per series. Default is 1000.
+        """
+        self.capacity = capacity
+        self._buffers = {}
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        return key in self._buffers
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory held by all buffers in the store.
+        """
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+    def buffer(self, symbol: str, timeframe: str) -> RateBuffer:
+        """
+        Return the buffer of a series, creating it on first use.
+
+        Args:
+            symbol (str): Trading symbol (e.g., 'XAUUSD').
+            timeframe (str): Timeframe string (e.g., 'M1').
+
+        Returns:
+            RateBuffer: The series' buffer.
+        """
+        key = (symbol, timeframe)
+        if key not in self._buffers:
+            self._buffers[key] = RateBuffer(self.capacity)
+        return self._buffers[key]
+
+    def drop(self, symbol: str, timeframe: str | None = None) -> None:
+        """
+        Release the buffers of a symbol, for one timeframe or all of them.
+
+        Args:
+            symbol (str): Trading symbol.
+            timeframe (str | None, optional): Timeframe to drop; None drops all.
+        """
+        for key in list(self._buffers):
+            if key[0] == symbol and timeframe in (None, key[1]):
+                del self._buffers[key]
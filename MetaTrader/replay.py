@@ -0,0 +1,158 @@
+import time
+from typing import NamedTuple
+
+from .bar_scheduler import TIMEFRAME_SECONDS
+
+
+class ReplayStats(NamedTuple):
+    """
+    Throughput of one replay run.
+
+    """
+
+    ticks: int
+    bars: int  # bar closes dispatched to strategies
+    evaluations: int  # strategy.on_bar calls
+    errors: int  # evaluations that raised
+    market_seconds: float  # span of the replayed ticks
+    wall_seconds: float
+
+    @property
+    def ticks_per_second(self) -> float:
+        return self.ticks / self.wall_seconds if self.wall_seconds else 0.0
+
+    @property
+    def speedup(self) -> float:
+        """
+        Market time replayed per second of wall time.
+        """
+        return self.market_seconds / self.wall_seconds if self.wall_seconds else 0.0
+
+
+class TickReplay:
+    """
+    Feeds recorded ticks through strategies and an MT5Trader backed by a
+    SimulatedTerminal, at the original pace, accelerated, or as fast as possible.
+
+    Each tick advances the terminal. When a tick opens a new bar of a series some
+    strategy trades, the trader fetches that series (through its usual incremental
+    fetch_rates) and the strategies get the closed bars, as the Runner does live. Fill
+    quality is in the trader's metrics (requested vs filled price per symbol) and in
+    the terminal's deals; ReplayStats gives the throughput.
+
+    """
+
+    def __init__(
+        self,
+        terminal,
+        trader,
+        strategies: list,
+        speed: float | None = None,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ) -> None:
+        """
+        Initialize the replay.
+
+        Args:
+            terminal (SimulatedTerminal): The terminal holding the ticks.
+            trader: A connected MT5Trader whose terminal is `terminal`. Its trade
+                mirror is switched to the terminal's market clock.
+            strategies (list[Strategy]): Strategy instances (see main.strategies).
+            speed (float | None, optional): Market seconds per wall second, e.g. 1 for
+                the original pace or 60 for a minute per second. Default None replays
+                without pauses.
+            clock (Callable[[], float], optional): Monotonic clock. Defaults to
+                time.monotonic.
+            sleep (Callable[[float], None], optional): Sleep function. Defaults to
+                time.sleep.
+
+        Raises:
+            ValueError: If a strategy trades a timeframe without a bar length.
+        """
+        self.terminal = terminal
+        self.trader = trader
+        # SL/TP hits and pending fills are only seen by reconciles, which must
+        # follow market time, not the much slower wall clock
+        trader.mirror.clock = terminal.clock
+        self.speed = speed
+        self.clock = clock
+        self.sleep = sleep
+
+        self.strategies = {}
+        for strategy in strategies:
+            if strategy.timeframe not in TIMEFRAME_SECONDS:
+                raise ValueError(f"⚠️ Invalid timeframe: {strategy.timeframe}")
+            key = (strategy.symbol, strategy.timeframe)
+            self.strategies.setdefault(key, []).append(strategy)
+        # symbol -> [[timeframe, bar length, open time of the current bar], ...]
+        self._series = {}
+        for symbol, timeframe in self.strategies:
+            self._series.setdefault(symbol, []).append(
+                [timeframe, TIMEFRAME_SECONDS[timeframe], None]
+            )
+
+    def _dispatch(self, symbol: str, timeframe: str) -> tuple[int, int]:
+        # the buffer view is refilled by the next fetch, so strategies get a copy
+        rates = self.trader.fetch_rates(symbol, timeframe)[:-1].copy()
+        errors = 0
+        for strategy in self.strategies[(symbol, timeframe)]:
+            try:
+                strategy.on_bar(rates, self.trader)
+            except Exception as e:
+                errors += 1
+                self.trader.logger.error(f"[{strategy.name} Error] {e}")
+        return len(self.strategies[(symbol, timeframe)]), errors
+
+    def run(self, until_msc: int | None = None) -> ReplayStats:
+        """
+        Replay ticks until the terminal runs out of them or `until_msc` is reached.
+
+        Args:
+            until_msc (int | None, optional): Market time (epoch milliseconds); the
+                first tick at or after it is the last one replayed. Default replays
+                every tick.
+
+        Returns:
+            ReplayStats: Ticks, bars and evaluations processed, and the time taken.
+        """
+        ticks = bars = evaluations = errors = 0
+        first_msc = last_msc = None
+        started = self.clock()
+        while True:
+            step = self.terminal.step()
+            if step is None:
+                break
+            symbol, time_msc = step
+            if first_msc is None:
+                first_msc = time_msc
+            last_msc = time_msc
+            ticks += 1
+
+            if self.speed:
+                due = started + (time_msc - first_msc) / 1000 / self.speed
+                delay = due - self.clock()
+                if delay > 0:
+                    self.sleep(delay)
+
+            now = time_msc // 1000
+            for series in self._series.get(symbol, ()):
+                timeframe, seconds, current = series
+                bar_time = now - now % seconds
+                if bar_time == current:
+                    continue
+                series[2] = bar_time
+                # the first bar seen has no closed predecessor in the replay
+                if current is not None:
+                    ran, failed = self._dispatch(symbol, timeframe)
+                    bars += 1
+                    evaluations += ran
+                    errors += failed
+
+            if until_msc is not None and time_msc >= until_msc:
+                break
+
+        market = (last_msc - first_msc) / 1000 if ticks else 0.0
+        return ReplayStats(
+            ticks, bars, evaluations, errors, market, self.clock() - started
+        )
@@ -0,0 +1,127 @@
+import numpy as np
+
+from .bar_scheduler import TIMEFRAME_SECONDS
+from .rate_buffer import RateBuffer
+
+
+def resample(rates: np.ndarray, seconds: int) -> np.ndarray:
+    """
+    Aggregate bars into bars of a longer period.
+
+    Bars are grouped by their open time floored to the period, which matches the
+    terminal's own alignment for M5 to H4 since MT5 times are server-time epochs.
+    Each group gives the first open, highest high, lowest low and last close, the
+    summed volumes and the lowest spread.
+
+    Args:
+        rates (np.ndarray): Structured array in the mt5.copy_rates_* layout, sorted
+            by time, e.g. M1 bars.
+        seconds (int): Length of the target period in seconds.
+
+    Returns:
+        np.ndarray: The aggregated bars, same layout, oldest first.
+    """
+    if len(rates) == 0:
+        return np.empty(0, dtype=rates.dtype)
+
+    times = rates["time"]
+    buckets = times - times % seconds
+    starts = np.flatnonzero(np.append(True, buckets[1:] != buckets[:-1]))
+    ends = np.append(starts[1:], len(rates)) - 1
+
+    out = np.zeros(len(starts), dtype=rates.dtype)
+    out["time"] = buckets[starts]
+    out["open"] = rates["open"][starts]
+    out["high"] = np.maximum.reduceat(rates["high"], starts)
+    out["low"] = np.minimum.reduceat(rates["low"], starts)
+    out["close"] = rates["close"][ends]
+    for name in ("tick_volume", "real_volume"):
+        if name in rates.dtype.names:
+            out[name] = np.add.reduceat(rates[name], starts)
+    if "spread" in rates.dtype.names:
+        out["spread"] = np.minimum.reduceat(rates["spread"], starts)
+    return out
+
+
+class Resampler:
+    """
+    Builds one higher timeframe incrementally from a lower-timeframe (usually M1) feed.
+
+    Each update re-aggregates only the lower bars of the newest, still forming,
+    higher bar and any bars after it, so it costs O(bars per period) per tick. The
+    forming bar is therefore always current, and closed bars are never recomputed.
+
+    """
+
+    def __init__(
+        self, timeframe: str, capacity: int = 1000, base_timeframe: str = "M1"
+    ) -> None:
+        """
+        Initialize an empty resampler.
+
+        Args:
+            timeframe (str): Target timeframe, one of TIMEFRAME_SECONDS (e.g., 'H1').
+            capacity (int, optional): Higher bars kept. Default is 1000.
+            base_timeframe (str, optional): Timeframe of the feed. Default is 'M1'.
+
+        Raises:
+            ValueError: If a timeframe is unknown or the target is not a multiple of
+                the base.
+        """
+        if (
+            timeframe not in TIMEFRAME_SECONDS
+            or base_timeframe not in TIMEFRAME_SECONDS
+        ):
+            raise ValueError(
+                f"⚠️ Invalid timeframe: {timeframe} from {base_timeframe}."
+            )
+        self.seconds = TIMEFRAME_SECONDS[timeframe]
+        if self.seconds % TIMEFRAME_SECONDS[base_timeframe]:
+            raise ValueError(
+                f"⚠️ {timeframe} cannot be built from {base_timeframe} bars."
+            )
+        self.timeframe = timeframe
+        self.buffer = RateBuffer(capacity)
+
+    def update(self, rates: np.ndarray) -> int:
+        """
+        Bring the higher bars up to date with the feed.
+
+        Pass the feed's buffered bars including the forming one, e.g. the array
+        returned by MT5Trader.fetch_rates(symbol, 'M1'). The feed must still reach
+        back to the start of the newest higher bar; if it does not (the resampler was
+        not updated for longer than the feed's depth) the higher bars are rebuilt.
+
+        Args:
+            rates (np.ndarray): Lower-timeframe bars, oldest first.
+
+        Returns:
+            int: Number of higher bars appended (0 when only the forming bar changed).
+        """
+        if len(rates) == 0:
+            return 0
+
+        times = rates["time"]
+        last = self.buffer.last_time
+        if last is not None and times[0] > last:
+            self.buffer.clear()
+            last = None
+
+        if last is None:
+            bars = resample(rates, self.seconds)
+            # the feed starts mid-period: the first higher bar is incomplete
+            if times[0] % self.seconds:
+                bars = bars[1:]
+            return self.buffer.merge(bars)
+
+        start = np.searchsorted(times, last)
+        return self.buffer.merge(resample(rates[start:], self.seconds))
+
+    def view(self) -> np.ndarray:
+        """
+        Return the higher bars, oldest first, as a read-only view.
+
+        Returns:
+            np.ndarray: Structured array; the last row is the forming bar.
+        """
+        return self.buffer.view()
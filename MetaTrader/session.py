@@ -0,0 +1,100 @@
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+
+class TerminalSession:
+    """
+    Serializes every terminal call of one MT5Trader through a single worker thread.
+
+    The MetaTrader5 package talks to one terminal over one IPC channel, so strategies
+    running in a thread pool must not call it concurrently. Calls are queued and run
+    one at a time, in submission order, on the session thread. The trader's async
+    order methods queue their sends here too.
+
+    """
+
+    def __init__(self, trader) -> None:
+        """
+        Initialize the session.
+
+        Args:
+            trader: A connected MT5Trader instance.
+        """
+        self.trader = trader
+        self._thread_id = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="mt5-session",
+            initializer=self._register_thread,
+        )
+        trader.order_executor.route_through(self.submit)
+
+    def _register_thread(self) -> None:
+        self._thread_id = threading.get_ident()
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Queue a call to run on the session thread.
+
+        Args:
+            fn (Callable): The function to call, usually a bound MT5Trader method.
+            *args, **kwargs: Its arguments.
+
+        Returns:
+            Future: Resolves to the call's result or exception.
+        """
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def call(self, fn: Callable, *args, **kwargs):
+        """
+        Run a call on the session thread and wait for its result.
+
+        Calls made from the session thread itself run inline, so nested calls
+        cannot deadlock.
+
+        Args:
+            fn (Callable): The function to call.
+            *args, **kwargs: Its arguments.
+
+        Returns:
+            The call's result; its exception is re-raised in the caller.
+        """
+        if threading.get_ident() == self._thread_id:
+            return fn(*args, **kwargs)
+        return self.submit(fn, *args, **kwargs).result()
+
+    def proxy(self) -> "TraderProxy":
+        """
+        Return an MT5Trader look-alike whose methods run through this session.
+
+        Returns:
+            TraderProxy: Safe to share between strategy threads.
+        """
+        return TraderProxy(self)
+
+    def close(self) -> None:
+        """
+        Finish the queued calls and stop the session thread.
+        """
+        self._executor.shutdown(wait=True)
+
+
+class TraderProxy:
+    """
+    Forwards MT5Trader method calls to a TerminalSession; attributes are read directly.
+
+    Every public method is available, including the per-symbol and per-magic lookups
+    (count_positions, count_orders) that strategies sharing one trader rely on.
+
+    """
+
+    def __init__(self, session: TerminalSession) -> None:
+        self._session = session
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._session.trader, name)
+        if not callable(attr):
+            return attr
+        return functools.partial(self._session.call, attr)
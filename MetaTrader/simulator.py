@@ -0,0 +1,1145 @@
+"""
+An in-process stand-in for the MetaTrader5 module, driven by recorded ticks or bars.
+
+SimulatedTerminal implements the MetaTrader5 functions and constants the trading code
+uses, so MT5Trader(logger, terminal=SimulatedTerminal(...)) runs unchanged on Linux, and
+install() lets scripts that do `import MetaTrader5 as mt5` run against it too. Time only
+moves when step() or advance() is called (see replay.TickReplay); bars returned by
+copy_rates_from_pos are built from the bid prices of the ticks seen so far, with the
+forming bar as the last row, exactly as the terminal does. Bar history is replayed as
+four ticks per bar (open, low/high, high/low, close), like the strategy tester's OHLC
+model.
+
+The matching engine runs on every tick:
+- market orders fill at the ask (buy) or bid (sell) of the first tick at or after
+  `fill_delay_ms` past the request, so slippage against the price sent is measurable;
+- limit orders fill at their price, or better if the market gapped through it; stop
+  orders fill at the market once touched;
+- position stop losses close at the market once touched and take profits at the
+  market once reached, the stop first.
+
+`latency` adds a wall-clock delay to every call, like the IPC round-trip to a real
+terminal, so concurrency in the trading code can be load-tested.
+"""
+
+import functools
+import itertools
+import sys
+import threading
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from .bar_scheduler import TIMEFRAME_SECONDS
+from .bar_store import to_epoch
+from .rate_buffer import RATE_DTYPE
+from .resampler import resample
+from .ticks import TICK_DTYPE, to_ticks
+
+# layout of the structured arrays returned by mt5.copy_ticks_*
+MT5_TICK_DTYPE = np.dtype(
+    [
+        ("time", "<i8"),
+        ("bid", "<f8"),
+        ("ask", "<f8"),
+        ("last", "<f8"),
+        ("volume", "<u8"),
+        ("time_msc", "<i8"),
+        ("flags", "<u4"),
+        ("volume_real", "<f8"),
+    ]
+)
+
+
+class Tick(NamedTuple):
+    """
+    The fields of mt5.symbol_info_tick.
+
+    """
+
+    time: int
+    bid: float
+    ask: float
+    last: float
+    volume: int
+    time_msc: int
+    flags: int
+    volume_real: float
+
+
+class SymbolInfo(NamedTuple):
+    """
+    The fields of mt5.symbol_info used by the trader.
+
+    """
+
+    name: str
+    digits: int
+    point: float
+    spread: int
+    bid: float
+    ask: float
+    volume_min: float
+    volume_max: float
+    volume_step: float
+    trade_stops_level: int
+    trade_contract_size: float
+
+
+class TradePosition(NamedTuple):
+    """
+    The fields of an mt5.positions_get entry.
+
+    """
+
+    ticket: int
+    time: int
+    time_msc: int
+    type: int
+    magic: int
+    identifier: int
+    volume: float
+    price_open: float
+    sl: float
+    tp: float
+    price_current: float
+    profit: float
+    symbol: str
+    comment: str
+
+
+class TradeDeal(NamedTuple):
+    """
+    One executed deal, with the price that was requested for it.
+
+    """
+
+    ticket: int
+    order: int
+    time_msc: int
+    type: int
+    entry: int
+    position_id: int
+    symbol: str
+    volume: float
+    price: float
+    requested: float
+    profit: float
+    comment: str
+
+
+class TradeOrder(NamedTuple):
+    """
+    The fields of an mt5.orders_get entry.
+
+    """
+
+    ticket: int
+    time_setup: int
+    time_setup_msc: int
+    type: int
+    magic: int
+    volume_initial: float
+    volume_current: float
+    price_open: float
+    sl: float
+    tp: float
+    price_current: float
+    symbol: str
+    comment: str
+
+
+class AccountInfo(NamedTuple):
+    """
+    The fields of mt5.account_info used by the trading code.
+
+    """
+
+    login: int
+    balance: float
+    equity: float
+    profit: float
+    margin: float
+    margin_free: float
+    leverage: int
+    currency: str
+    margin_mode: int
+
+
+class OrderSendResult(NamedTuple):
+    """
+    The fields of mt5.order_send's result.
+
+    """
+
+    retcode: int
+    deal: int
+    order: int
+    volume: float
+    price: float
+    bid: float
+    ask: float
+    comment: str
+    request_id: int
+    retcode_external: int
+    request: dict
+
+
+def bars_to_ticks(
+    rates: np.ndarray, seconds: int, spread: float = 0.0, point: float = 0.01
+) -> np.ndarray:
+    """
+    Expand bars into four ticks each: open, then low and high (high first on a bearish
+    bar), then close, spread evenly over the bar.
+
+    Args:
+        rates (np.ndarray): Bars in the mt5.copy_rates_* layout, oldest first.
+        seconds (int): Bar length in seconds.
+        spread (float, optional): Spread in points for bars whose own spread is 0.
+            Default is 0.
+        point (float, optional): Point size, to convert spreads to prices.
+
+    Returns:
+        np.ndarray: TICK_DTYPE array, four rows per bar.
+    """
+    n = len(rates)
+    bullish = rates["close"] >= rates["open"]
+    prices = np.empty((n, 4))
+    prices[:, 0] = rates["open"]
+    prices[:, 1] = np.where(bullish, rates["low"], rates["high"])
+    prices[:, 2] = np.where(bullish, rates["high"], rates["low"])
+    prices[:, 3] = rates["close"]
+
+    spreads = np.full(n, float(spread))
+    if "spread" in rates.dtype.names:
+        spreads = np.where(rates["spread"] > 0, rates["spread"], spreads)
+
+    ticks = np.zeros(4 * n, dtype=TICK_DTYPE)
+    offsets = np.arange(4) * (seconds * 1000 // 4)
+    ticks["time_msc"] = (rates["time"][:, None] * 1000 + offsets).ravel()
+    ticks["bid"] = prices.ravel()
+    ticks["ask"] = (prices + (spreads * point)[:, None]).ravel()
+    return ticks
+
+
+def install(terminal) -> None:
+    """
+    Register a terminal as the MetaTrader5 module, so code that runs
+    `import MetaTrader5 as mt5` afterwards uses it.
+
+    Args:
+        terminal: E.g. a SimulatedTerminal.
+    """
+    sys.modules["MetaTrader5"] = terminal
+
+
+def _remote(method):
+    """Make a terminal call wait for the configured latency before it runs."""
+    name = method.__name__
+
+    @functools.wraps(method)
+    def call(self, *args, **kwargs):
+        latency = self.latency
+        delay = latency.get(name, 0.0) if isinstance(latency, dict) else latency
+        if delay:
+            self.sleep(delay)
+        return method(self, *args, **kwargs)
+
+    return call
+
+
+class _Feed:
+    """
+    The ticks of one symbol, the replay cursor into them, and their M1 bars.
+
+    """
+
+    def __init__(
+        self, name: str, ticks: np.ndarray, info: dict, history, warmup: int
+    ) -> None:
+        self.name = name
+        self.ticks = ticks
+        self.info = info
+        self.cursor = -1  # index of the newest tick seen, -1 before the first
+        self.first = warmup  # ticks before this one are history, never replayed
+        self.orders = {}  # pending order ticket -> order record
+        self.positions = set()  # tickets of the open positions
+
+        # closed M1 bars of the whole tick series, and which bar each tick belongs to
+        minutes = ticks["time_msc"] // 60_000
+        starts = np.flatnonzero(np.append(True, minutes[1:] != minutes[:-1]))
+        bid = ticks["bid"]
+        bars = np.zeros(len(starts), dtype=RATE_DTYPE)
+        spread = None
+        if len(ticks):
+            bars["time"] = minutes[starts] * 60
+            bars["open"] = bid[starts]
+            bars["high"] = np.maximum.reduceat(bid, starts)
+            bars["low"] = np.minimum.reduceat(bid, starts)
+            bars["close"] = bid[np.append(starts[1:], len(ticks)) - 1]
+            bars["tick_volume"] = np.diff(np.append(starts, len(ticks)))
+            spread = np.rint((ticks["ask"] - bid) / info["point"]).astype(np.int32)
+            bars["spread"] = np.minimum.reduceat(spread, starts)
+        self.starts = starts
+        opens = np.zeros(len(ticks), dtype=np.int64)
+        opens[starts] = 1
+        self.bar_of = np.cumsum(opens) - 1
+        self.spread = spread if len(ticks) else np.empty(0, dtype=np.int32)
+
+        # bars recorded before the first tick, e.g. from a BarStore
+        self.history = np.empty(0, dtype=RATE_DTYPE)
+        if history is not None and len(history):
+            first = bars["time"][0] if len(bars) else np.iinfo(np.int64).max
+            self.history = history[history["time"] < first]
+        self.bars = bars
+
+    def m1(self, count: int) -> np.ndarray:
+        """Return the newest `count` M1 bars seen so far, the forming bar last."""
+        b = int(self.bar_of[self.cursor])
+        s = int(self.starts[b])
+        bid = self.ticks["bid"][s : self.cursor + 1]
+        forming = self.bars[b : b + 1].copy()
+        forming["high"] = bid.max()
+        forming["low"] = bid.min()
+        forming["close"] = bid[-1]
+        forming["tick_volume"] = len(bid)
+        forming["spread"] = self.spread[s : self.cursor + 1].min()
+
+        closed = self.bars[max(0, b + 1 - count) : b]
+        missing = count - 1 - len(closed)
+        parts = [closed, forming]
+        if missing > 0 and len(self.history):
+            parts.insert(0, self.history[-missing:])
+        return np.concatenate(parts)
+
+    def price(self, index: int, buy: bool) -> float:
+        tick = self.ticks[index]
+        return float(tick["ask"] if buy else tick["bid"])
+
+    def tick(self, index: int) -> Tick:
+        t = self.ticks[index]
+        return Tick(
+            int(t["time_msc"]) // 1000,
+            float(t["bid"]),
+            float(t["ask"]),
+            float(t["last"]),
+            int(t["volume"]),
+            int(t["time_msc"]),
+            int(t["flags"]),
+            float(t["volume"]),
+        )
+
+
+class SimulatedTerminal:
+    """
+    A MetaTrader5-compatible terminal replaying recorded ticks or bars.
+
+    Positions are kept per deal like on a hedging account: every market order or
+    triggered pending order opens its own position, and closing requests name the
+    position by ticket. Profit is (close - open) * volume * contract size, in the
+    account currency, without commission or swap.
+
+    """
+
+    TIMEFRAME_M1 = 1
+    TIMEFRAME_M5 = 5
+    TIMEFRAME_M15 = 15
+    TIMEFRAME_M30 = 30
+    TIMEFRAME_H1 = 16385
+    TIMEFRAME_H4 = 16388
+
+    ORDER_TYPE_BUY = 0
+    ORDER_TYPE_SELL = 1
+    ORDER_TYPE_BUY_LIMIT = 2
+    ORDER_TYPE_SELL_LIMIT = 3
+    ORDER_TYPE_BUY_STOP = 4
+    ORDER_TYPE_SELL_STOP = 5
+
+    TRADE_ACTION_DEAL = 1
+    TRADE_ACTION_PENDING = 5
+    TRADE_ACTION_SLTP = 6
+    TRADE_ACTION_MODIFY = 7
+    TRADE_ACTION_REMOVE = 8
+
+    ORDER_TIME_GTC = 0
+    ORDER_FILLING_FOK = 0
+    ORDER_FILLING_IOC = 1
+    ORDER_FILLING_RETURN = 2
+
+    POSITION_TYPE_BUY = 0
+    POSITION_TYPE_SELL = 1
+
+    ACCOUNT_MARGIN_MODE_RETAIL_NETTING = 0
+    ACCOUNT_MARGIN_MODE_EXCHANGE = 1
+    ACCOUNT_MARGIN_MODE_RETAIL_HEDGING = 2
+
+    DEAL_ENTRY_IN = 0
+    DEAL_ENTRY_OUT = 1
+
+    COPY_TICKS_ALL = -1
+    COPY_TICKS_INFO = 1
+    COPY_TICKS_TRADE = 2
+
+    TRADE_RETCODE_DONE = 10009
+    TRADE_RETCODE_INVALID = 10013
+    TRADE_RETCODE_INVALID_VOLUME = 10014
+    TRADE_RETCODE_INVALID_PRICE = 10015
+    TRADE_RETCODE_INVALID_STOPS = 10016
+    TRADE_RETCODE_MARKET_CLOSED = 10018
+    TRADE_RETCODE_POSITION_CLOSED = 10036
+
+    _TIMEFRAME_SECONDS = {1: 60, 5: 300, 15: 900, 30: 1800, 16385: 3600, 16388: 14400}
+    _PENDING_TYPES = (2, 3, 4, 5)
+
+    def __init__(
+        self,
+        fill_delay_ms: int = 0,
+        balance: float = 10_000.0,
+        latency: float | dict = 0.0,
+        sleep=time.sleep,
+    ) -> None:
+        """
+        Initialize an empty terminal; add price data with add_symbol() or add_bars().
+
+        Args:
+            fill_delay_ms (int, optional): Market time between a market request and
+                its fill. Default is 0 (filled at the current tick).
+            balance (float, optional): Starting account balance. Default is 10000.
+            latency (float | dict, optional): Wall-clock seconds every call takes, or
+                per function name, e.g. {'order_send': 0.02}. Default is 0.
+            sleep (Callable[[float], None], optional): Sleep function used for the
+                latency. Defaults to time.sleep.
+        """
+        self.fill_delay_ms = fill_delay_ms
+        self.balance = balance
+        self.latency = latency
+        self.sleep = sleep
+        self.deals = []
+        self._feeds = {}
+        # ticket -> [symbol, type, volume, price, sl, tp, time_msc, comment, magic],
+        # the layout of both positions and pending orders
+        self._positions = {}
+        self._orders = {}
+        self._tickets = itertools.count(1)
+        self._timeline = None
+        self._step = 0
+        self._now_msc = None
+        self._lock = threading.RLock()
+
+    def add_symbol(
+        self,
+        symbol: str,
+        ticks,
+        digits: int = 2,
+        point: float | None = None,
+        volume_min: float = 0.01,
+        volume_max: float = 100.0,
+        volume_step: float = 0.01,
+        stops_level: int = 0,
+        contract_size: float = 100.0,
+        history: np.ndarray | None = None,
+        warmup: int = 0,
+    ) -> None:
+        """
+        Add the ticks of a symbol to replay.
+
+        Args:
+            symbol (str): Trading symbol (e.g., 'XAUUSD').
+            ticks: Ticks sorted by time, e.g. from TickStore.load (see to_ticks).
+            digits (int, optional): Price digits. Default is 2.
+            point (float | None, optional): Point size. Defaults to 10**-digits.
+            volume_min (float, optional): Smallest order volume. Default is 0.01.
+            volume_max (float, optional): Largest order volume. Default is 100.
+            volume_step (float, optional): Volume increment. Default is 0.01.
+            stops_level (int, optional): Minimum distance of pending prices and SL/TP
+                from the market, in points. Default is 0.
+            contract_size (float, optional): Units per lot, for profit. Default is 100.
+            history (np.ndarray | None, optional): M1 bars before the first tick (e.g.
+                from BarStore.load), so strategies start with warmed-up indicators.
+            warmup (int, optional): Leading ticks that are only history: they are in
+                the bars from the start but never replayed. Default is 0.
+
+        Raises:
+            ValueError: If the replay has already started.
+        """
+        if self._timeline is not None:
+            raise ValueError("⚠️ Cannot add symbols once the replay has started.")
+        info = {
+            "digits": digits,
+            "point": point if point is not None else 10.0**-digits,
+            "volume_min": volume_min,
+            "volume_max": volume_max,
+            "volume_step": volume_step,
+            "trade_stops_level": stops_level,
+            "trade_contract_size": contract_size,
+        }
+        ticks = to_ticks(ticks)
+        feed = _Feed(symbol, ticks, info, history, min(warmup, len(ticks)))
+        feed.cursor = feed.first - 1
+        self._feeds[symbol] = feed
+
+    def add_bars(
+        self,
+        symbol: str,
+        rates: np.ndarray,
+        timeframe: str = "M1",
+        spread: float = 0.0,
+        warmup: int = 0,
+        **spec,
+    ) -> None:
+        """
+        Add a bar history of a symbol to replay, as four ticks per bar.
+
+        Bars of the same timeframe come back from copy_rates_from_pos unchanged; lower
+        timeframes are synthetic.
+
+        Args:
+            symbol (str): Trading symbol (e.g., 'XAUUSD').
+            rates (np.ndarray): Bars in the mt5.copy_rates_* layout, oldest first,
+                e.g. from BarStore.load.
+            timeframe (str, optional): Timeframe of the bars. Default is 'M1'.
+            spread (float, optional): Spread in points for bars without one.
+                Default is 0.
+            warmup (int, optional): Leading bars that are only history. Default is 0.
+            **spec: Symbol properties passed to add_symbol (digits, point, ...).
+
+        Raises:
+            ValueError: If the timeframe is unknown or the replay has started.
+        """
+        if timeframe not in TIMEFRAME_SECONDS:
+            raise ValueError(f"⚠️ Invalid timeframe: {timeframe}")
+        digits = spec.get("digits", 2)
+        point = spec.get("point") or 10.0**-digits
+        ticks = bars_to_ticks(rates, TIMEFRAME_SECONDS[timeframe], spread, point)
+        self.add_symbol(symbol, ticks, warmup=4 * warmup, **spec)
+
+    @property
+    def symbols(self) -> list[str]:
+        return list(self._feeds)
+
+    @property
+    def now_msc(self) -> int | None:
+        """
+        Market time (epoch milliseconds) of the newest replayed tick, or the time
+        advance() moved to; None before the first step.
+        """
+        return self._now_msc
+
+    def clock(self) -> float:
+        """
+        Market time in seconds, e.g. as MT5Trader's clock so the trade mirror ages
+        with the replay instead of the wall clock; 0 before the first step.
+        """
+        return self._now_msc / 1000 if self._now_msc is not None else 0.0
+
+    def __len__(self) -> int:
+        return sum(len(feed.ticks) - feed.first for feed in self._feeds.values())
+
+    def _build_timeline(self) -> None:
+        feeds = list(self._feeds.values())
+        times = np.concatenate([feed.ticks["time_msc"][feed.first :] for feed in feeds])
+        owner = np.concatenate(
+            [
+                np.full(len(feed.ticks) - feed.first, i, dtype=np.int32)
+                for i, feed in enumerate(feeds)
+            ]
+        )
+        index = np.concatenate(
+            [np.arange(feed.first, len(feed.ticks)) for feed in feeds]
+        )
+        order = np.argsort(times, kind="stable")
+        self._timeline = (feeds, owner[order].tolist(), index[order].tolist())
+
+    def step(self) -> tuple[str, int] | None:
+        """
+        Advance the market by one tick of any symbol and run the matching engine.
+
+        Returns:
+            tuple[str, int] | None: The symbol and time_msc of the tick, or None when
+            every tick has been replayed.
+        """
+        with self._lock:
+            if self._timeline is None:
+                self._build_timeline()
+            feeds, owner, index = self._timeline
+            if self._step >= len(owner):
+                return None
+            feed = feeds[owner[self._step]]
+            feed.cursor = index[self._step]
+            self._step += 1
+            self._now_msc = int(feed.ticks["time_msc"][feed.cursor])
+            if feed.orders or feed.positions:
+                self._match(feed)
+            return feed.name, self._now_msc
+
+    def advance(self, seconds: float) -> int:
+        """
+        Replay the ticks of the next `seconds` of market time, e.g. as the sleep
+        function of a polling script.
+
+        Args:
+            seconds (float): Market time to advance.
+
+        Returns:
+            int: Number of ticks replayed.
+        """
+        with self._lock:
+            if self._timeline is None:
+                self._build_timeline()
+            feeds, owner, index = self._timeline
+            if self._now_msc is None:
+                if not owner:
+                    return 0
+                first = feeds[owner[0]]
+                self._now_msc = int(first.ticks["time_msc"][index[0]])
+            target = self._now_msc + int(seconds * 1000)
+            count = 0
+            while self._step < len(owner):
+                feed = feeds[owner[self._step]]
+                if feed.ticks["time_msc"][index[self._step]] > target:
+                    break
+                self.step()
+                count += 1
+            self._now_msc = target
+            return count
+
+    # -- MetaTrader5 API --------------------------------------------------------
+
+    @_remote
+    def initialize(self, *args, **kwargs) -> bool:
+        return True
+
+    @_remote
+    def login(self, *args, **kwargs) -> bool:
+        return True
+
+    def shutdown(self) -> None:
+        pass
+
+    def last_error(self) -> tuple[int, str]:
+        return (1, "Success")
+
+    @_remote
+    def account_info(self) -> AccountInfo:
+        with self._lock:
+            profit = sum(self._position(t).profit for t in self._positions)
+        equity = self.balance + profit
+        return AccountInfo(
+            login=0,
+            balance=self.balance,
+            equity=equity,
+            profit=profit,
+            margin=0.0,
+            margin_free=equity,
+            leverage=100,
+            currency="USD",
+            margin_mode=self.ACCOUNT_MARGIN_MODE_RETAIL_HEDGING,
+        )
+
+    @_remote
+    def symbol_info(self, symbol: str) -> SymbolInfo | None:
+        feed = self._feeds.get(symbol)
+        if feed is None:
+            return None
+        tick = feed.tick(feed.cursor) if feed.cursor >= 0 else None
+        bid, ask = (tick.bid, tick.ask) if tick else (0.0, 0.0)
+        return SymbolInfo(
+            name=symbol,
+            spread=round((ask - bid) / feed.info["point"]),
+            bid=bid,
+            ask=ask,
+            **feed.info,
+        )
+
+    @_remote
+    def symbol_info_tick(self, symbol: str) -> Tick | None:
+        feed = self._feeds.get(symbol)
+        if feed is None or feed.cursor < 0:
+            return None
+        return feed.tick(feed.cursor)
+
+    @_remote
+    def copy_rates_from_pos(
+        self, symbol: str, timeframe: int, start_pos: int, count: int
+    ) -> np.ndarray | None:
+        """
+        Return `count` bars ending `start_pos` bars before the forming one.
+
+        Args:
+            symbol (str): Trading symbol.
+            timeframe (int): A TIMEFRAME_* constant.
+            start_pos (int): Bars to skip back from the forming bar (0 includes it).
+            count (int): Number of bars.
+
+        Returns:
+            np.ndarray | None: Bars in the mt5.copy_rates_* layout, oldest first, or
+            None for an unknown symbol or timeframe or before the first tick.
+        """
+        feed = self._feeds.get(symbol)
+        seconds = self._TIMEFRAME_SECONDS.get(timeframe)
+        if feed is None or seconds is None or feed.cursor < 0:
+            return None
+        wanted = start_pos + count
+        ratio = seconds // 60
+        with self._lock:
+            rates = feed.m1((wanted + 1) * ratio)
+        if ratio > 1:
+            partial = rates["time"][0] % seconds != 0
+            rates = resample(rates, seconds)
+            if partial and len(rates) > wanted:
+                rates = rates[1:]
+        end = len(rates) - start_pos
+        return rates[max(0, end - count) : max(0, end)]
+
+    @_remote
+    def copy_ticks_from(self, symbol: str, date_from, count: int, flags: int):
+        """
+        Return up to `count` replayed ticks from `date_from` on.
+
+        Args:
+            symbol (str): Trading symbol.
+            date_from: Epoch seconds or a datetime (see to_epoch).
+            count (int): Most ticks returned.
+            flags (int): Ignored, every tick has bid and ask.
+
+        Returns:
+            np.ndarray | None: Ticks in the mt5.copy_ticks_* layout, or None for an
+            unknown symbol.
+        """
+        feed = self._feeds.get(symbol)
+        if feed is None:
+            return None
+        date_from = to_epoch(date_from)
+        times = feed.ticks["time_msc"][: feed.cursor + 1]
+        lo = int(np.searchsorted(times, date_from * 1000))
+        rows = feed.ticks[lo : min(lo + count, feed.cursor + 1)]
+        out = np.zeros(len(rows), dtype=MT5_TICK_DTYPE)
+        for name in ("bid", "ask", "last", "time_msc", "flags"):
+            out[name] = rows[name]
+        out["time"] = rows["time_msc"] // 1000
+        out["volume"] = rows["volume"]
+        out["volume_real"] = rows["volume"]
+        return out
+
+    @_remote
+    def positions_get(self, symbol: str | None = None, ticket: int | None = None):
+        with self._lock:
+            return tuple(
+                self._position(t)
+                for t, p in self._positions.items()
+                if (symbol is None or p[0] == symbol)
+                and (ticket is None or t == ticket)
+            )
+
+    @_remote
+    def orders_get(self, symbol: str | None = None, ticket: int | None = None):
+        with self._lock:
+            return tuple(
+                self._order(t)
+                for t, o in self._orders.items()
+                if (symbol is None or o[0] == symbol)
+                and (ticket is None or t == ticket)
+            )
+
+    @_remote
+    def order_send(self, request: dict) -> OrderSendResult:
+        handlers = {
+            self.TRADE_ACTION_DEAL: self._deal,
+            self.TRADE_ACTION_PENDING: self._pending,
+            self.TRADE_ACTION_SLTP: self._sltp,
+            self.TRADE_ACTION_REMOVE: self._remove,
+        }
+        handler = handlers.get(request.get("action"))
+        if handler is None:
+            return self._result(
+                request, self.TRADE_RETCODE_INVALID, "Unsupported request"
+            )
+        with self._lock:
+            return handler(request)
+
+    # -- records ----------------------------------------------------------------
+
+    def _position(self, ticket: int) -> TradePosition:
+        symbol, type_, volume, price, sl, tp, time_msc, comment, magic = (
+            self._positions[ticket]
+        )
+        feed = self._feeds[symbol]
+        current = feed.price(feed.cursor, type_ == self.POSITION_TYPE_SELL)
+        return TradePosition(
+            ticket=ticket,
+            time=time_msc // 1000,
+            time_msc=time_msc,
+            type=type_,
+            magic=magic,
+            identifier=ticket,
+            volume=volume,
+            price_open=price,
+            sl=sl,
+            tp=tp,
+            price_current=current,
+            profit=self._profit(feed, type_, volume, price, current),
+            symbol=symbol,
+            comment=comment,
+        )
+
+    def _order(self, ticket: int) -> TradeOrder:
+        symbol, type_, volume, price, sl, tp, time_msc, comment, magic = self._orders[
+            ticket
+        ]
+        feed = self._feeds[symbol]
+        buy = type_ in (self.ORDER_TYPE_BUY_LIMIT, self.ORDER_TYPE_BUY_STOP)
+        return TradeOrder(
+            ticket=ticket,
+            time_setup=time_msc // 1000,
+            time_setup_msc=time_msc,
+            type=type_,
+            magic=magic,
+            volume_initial=volume,
+            volume_current=volume,
+            price_open=price,
+            sl=sl,
+            tp=tp,
+            price_current=feed.price(feed.cursor, buy),
+            symbol=symbol,
+            comment=comment,
+        )
+
+    def _profit(self, feed, type_, volume, open_price, close_price) -> float:
+        sign = 1.0 if type_ == self.POSITION_TYPE_BUY else -1.0
+        return (
+            sign
+            * (close_price - open_price)
+            * volume
+            * feed.info["trade_contract_size"]
+        )
+
+    def _result(
+        self,
+        request,
+        retcode,
+        comment,
+        order=0,
+        deal=0,
+        volume=0.0,
+        price=0.0,
+        feed=None,
+    ) -> OrderSendResult:
+        tick = feed.tick(feed.cursor) if feed is not None and feed.cursor >= 0 else None
+        return OrderSendResult(
+            retcode=retcode,
+            deal=deal,
+            order=order,
+            volume=volume,
+            price=price,
+            bid=tick.bid if tick else 0.0,
+            ask=tick.ask if tick else 0.0,
+            comment=comment,
+            request_id=0,
+            retcode_external=0,
+            request=request,
+        )
+
+    # -- request checks ---------------------------------------------------------
+
+    def _market(self, request: dict):
+        """Return (feed, None) for a tradable symbol, else (feed, failed result)."""
+        feed = self._feeds.get(request.get("symbol"))
+        if feed is None:
+            return None, self._result(
+                request, self.TRADE_RETCODE_INVALID, "Unknown symbol"
+            )
+        if feed.cursor < 0:
+            return feed, self._result(
+                request, self.TRADE_RETCODE_MARKET_CLOSED, "Market closed", feed=feed
+            )
+        return feed, None
+
+    def _valid_volume(self, feed: _Feed, volume) -> bool:
+        info = feed.info
+        if not volume or volume < info["volume_min"] or volume > info["volume_max"]:
+            return False
+        steps = volume / info["volume_step"]
+        return abs(steps - round(steps)) < 1e-6
+
+    def _valid_stops(self, feed: _Feed, buy: bool, price: float, sl, tp) -> bool:
+        # stops must lie on the losing/winning side, at least stops_level away
+        level = feed.info["trade_stops_level"] * feed.info["point"]
+        sign = 1.0 if buy else -1.0
+        if sl and sign * (price - sl) < level:
+            return False
+        if tp and sign * (tp - price) < level:
+            return False
+        return True
+
+    def _fill_index(self, feed: _Feed) -> int:
+        if not self.fill_delay_ms:
+            return feed.cursor
+        due = feed.ticks["time_msc"][feed.cursor] + self.fill_delay_ms
+        index = int(np.searchsorted(feed.ticks["time_msc"], due))
+        return min(max(index, feed.cursor), len(feed.ticks) - 1)
+
+    # -- trade actions ----------------------------------------------------------
+
+    def _deal(self, request: dict) -> OrderSendResult:
+        feed, failed = self._market(request)
+        if failed is not None:
+            return failed
+        type_ = request.get("type")
+        volume = request.get("volume")
+        if type_ not in (self.ORDER_TYPE_BUY, self.ORDER_TYPE_SELL):
+            return self._result(
+                request, self.TRADE_RETCODE_INVALID, "Invalid request", feed=feed
+            )
+        if not self._valid_volume(feed, volume):
+            return self._result(
+                request, self.TRADE_RETCODE_INVALID_VOLUME, "Invalid volume", feed=feed
+            )
+
+        fill = self._fill_index(feed)
+        buy = type_ == self.ORDER_TYPE_BUY
+        price = feed.price(fill, buy)
+        time_msc = int(feed.ticks["time_msc"][fill])
+        requested = request.get("price", 0.0)
+        comment = request.get("comment", "")
+
+        ticket = request.get("position")
+        if ticket:
+            position = self._positions.get(ticket)
+            if position is None or position[0] != feed.name or position[1] == type_:
+                return self._result(
+                    request,
+                    self.TRADE_RETCODE_POSITION_CLOSED,
+                    "Position doesn't exist",
+                    feed=feed,
+                )
+            order = next(self._tickets)
+            volume = min(volume, position[2])
+            deal = self._close(ticket, volume, price, time_msc, requested, comment)
+            return self._result(
+                request,
+                self.TRADE_RETCODE_DONE,
+                "Request executed",
+                order,
+                deal,
+                volume,
+                price,
+                feed,
+            )
+
+        sl, tp = request.get("sl", 0.0), request.get("tp", 0.0)
+        if not self._valid_stops(feed, buy, price, sl, tp):
+            return self._result(
+                request, self.TRADE_RETCODE_INVALID_STOPS, "Invalid stops", feed=feed
+            )
+        order = next(self._tickets)
+        record = [feed.name, type_, volume, price, sl, tp, time_msc, comment]
+        deal = self._open(order, record + [request.get("magic", 0)], requested)
+        return self._result(
+            request,
+            self.TRADE_RETCODE_DONE,
+            "Request executed",
+            order,
+            deal,
+            volume,
+            price,
+            feed,
+        )
+
+    def _pending(self, request: dict) -> OrderSendResult:
+        feed, failed = self._market(request)
+        if failed is not None:
+            return failed
+        type_ = request.get("type")
+        volume = request.get("volume")
+        price = request.get("price")
+        if type_ not in self._PENDING_TYPES:
+            return self._result(
+                request, self.TRADE_RETCODE_INVALID, "Invalid request", feed=feed
+            )
+        if not self._valid_volume(feed, volume):
+            return self._result(
+                request, self.TRADE_RETCODE_INVALID_VOLUME, "Invalid volume", feed=feed
+            )
+
+        tick = feed.ticks[feed.cursor]
+        buy = type_ in (self.ORDER_TYPE_BUY_LIMIT, self.ORDER_TYPE_BUY_STOP)
+        market = float(tick["ask"] if buy else tick["bid"])
+        level = feed.info["trade_stops_level"] * feed.info["point"]
+        # limits go below (buy) / above (sell) the market, stops the other way
+        below = type_ in (self.ORDER_TYPE_BUY_LIMIT, self.ORDER_TYPE_SELL_STOP)
+        distance = market - price if below else price - market
+        # half a point of slack for prices rounded to the symbol digits
+        if not price or distance < level - feed.info["point"] / 2:
+            return self._result(
+                request, self.TRADE_RETCODE_INVALID_PRICE, "Invalid price", feed=feed
+            )
+        sl, tp = request.get("sl", 0.0), request.get("tp", 0.0)
+        if not self._valid_stops(feed, buy, price, sl, tp):
+            return self._result(
+                request, self.TRADE_RETCODE_INVALID_STOPS, "Invalid stops", feed=feed
+            )
+
+        ticket = next(self._tickets)
+        self._orders[ticket] = [
+            feed.name,
+            type_,
+            volume,
+            price,
+            sl,
+            tp,
+            self._now_msc or int(tick["time_msc"]),
+            request.get("comment", ""),
+            request.get("magic", 0),
+        ]
+        feed.orders[ticket] = self._orders[ticket]
+        return self._result(
+            request,
+            self.TRADE_RETCODE_DONE,
+            "Request executed",
+            ticket,
+            volume=volume,
+            price=price,
+            feed=feed,
+        )
+
+    def _sltp(self, request: dict) -> OrderSendResult:
+        ticket = request.get("position")
+        position = self._positions.get(ticket)
+        if position is None:
+            return self._result(
+                request, self.TRADE_RETCODE_POSITION_CLOSED, "Position doesn't exist"
+            )
+        feed = self._feeds[position[0]]
+        buy = position[1] == self.POSITION_TYPE_BUY
+        # a stop is checked against the price the position would close at
+        market = feed.price(feed.cursor, not buy)
+        sl, tp = request.get("sl", 0.0), request.get("tp", 0.0)
+        if not self._valid_stops(feed, buy, market, sl, tp):
+            return self._result(
+                request, self.TRADE_RETCODE_INVALID_STOPS, "Invalid stops", feed=feed
+            )
+        position[4], position[5] = sl, tp
+        return self._result(
+            request, self.TRADE_RETCODE_DONE, "Request executed", feed=feed
+        )
+
+    def _remove(self, request: dict) -> OrderSendResult:
+        ticket = request.get("order")
+        order = self._orders.pop(ticket, None)
+        if order is None:
+            return self._result(request, self.TRADE_RETCODE_INVALID, "Invalid order")
+        feed = self._feeds[order[0]]
+        del feed.orders[ticket]
+        return self._result(
+            request, self.TRADE_RETCODE_DONE, "Request executed", ticket, feed=feed
+        )
+
+    # -- matching ---------------------------------------------------------------
+
+    def _open(self, ticket: int, record: list, requested: float) -> int:
+        """Open a position from an order record and return the deal ticket."""
+        symbol, type_, volume, price, _, _, time_msc, comment, _ = record
+        buy = type_ in (
+            self.ORDER_TYPE_BUY,
+            self.ORDER_TYPE_BUY_LIMIT,
+            self.ORDER_TYPE_BUY_STOP,
+        )
+        record[1] = self.POSITION_TYPE_BUY if buy else self.POSITION_TYPE_SELL
+        self._positions[ticket] = record
+        self._feeds[symbol].positions.add(ticket)
+        deal = next(self._tickets)
+        self.deals.append(
+            TradeDeal(
+                deal,
+                ticket,
+                time_msc,
+                self.ORDER_TYPE_BUY if buy else self.ORDER_TYPE_SELL,
+                self.DEAL_ENTRY_IN,
+                ticket,
+                symbol,
+                volume,
+                price,
+                requested,
+                0.0,
+                comment,
+            )
+        )
+        return deal
+
+    def _close(
+        self,
+        ticket: int,
+        volume: float,
+        price: float,
+        time_msc: int,
+        requested: float,
+        comment: str,
+    ) -> int:
+        """Close (part of) a position and return the deal ticket."""
+        position = self._positions[ticket]
+        symbol, type_ = position[0], position[1]
+        feed = self._feeds[symbol]
+        profit = self._profit(feed, type_, volume, position[3], price)
+        self.balance += profit
+        position[2] = round(position[2] - volume, 8)
+        if not position[2]:
+            del self._positions[ticket]
+            feed.positions.discard(ticket)
+        deal = next(self._tickets)
+        closing = (
+            self.ORDER_TYPE_SELL
+            if type_ == self.POSITION_TYPE_BUY
+            else self.ORDER_TYPE_BUY
+        )
+        self.deals.append(
+            TradeDeal(
+                deal,
+                deal,
+                time_msc,
+                closing,
+                self.DEAL_ENTRY_OUT,
+                ticket,
+                symbol,
+                volume,
+                price,
+                requested,
+                profit,
+                comment,
+            )
+        )
+        return deal
+
+    def _match(self, feed: _Feed) -> None:
+        """Trigger the pending orders and stops of a symbol touched by its new tick."""
+        tick = feed.ticks[feed.cursor]
+        bid, ask = float(tick["bid"]), float(tick["ask"])
+        time_msc = int(tick["time_msc"])
+
+        for ticket, order in list(feed.orders.items()):
+            type_, price = order[1], order[3]
+            if type_ == self.ORDER_TYPE_BUY_LIMIT:
+                hit, fill = ask <= price, min(ask, price)
+            elif type_ == self.ORDER_TYPE_SELL_LIMIT:
+                hit, fill = bid >= price, max(bid, price)
+            elif type_ == self.ORDER_TYPE_BUY_STOP:
+                hit, fill = ask >= price, ask
+            else:
+                hit, fill = bid <= price, bid
+            if hit:
+                del feed.orders[ticket]
+                del self._orders[ticket]
+                order[3], order[6] = fill, time_msc
+                self._open(ticket, order, price)
+
+        for ticket in list(feed.positions):
+            position = self._positions[ticket]
+            type_, volume, sl, tp = position[1], position[2], position[4], position[5]
+            if type_ == self.POSITION_TYPE_BUY:
+                market, stopped, taken = bid, sl and bid <= sl, tp and bid >= tp
+            else:
+                market, stopped, taken = ask, sl and ask >= sl, tp and ask <= tp
+            if stopped:
+                self._close(ticket, volume, market, time_msc, sl, f"[sl {sl}]")
+            elif taken:
+                self._close(ticket, volume, market, time_msc, tp, f"[tp {tp}]")
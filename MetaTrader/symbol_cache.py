@@ -0,0 +1,153 @@
+import threading
+import time
+from typing import Callable, NamedTuple
+
+
+class SymbolMeta(NamedTuple):
+    """
+    The symbol properties needed to build and validate order requests.
+
+    """
+
+    digits: int
+    point: float
+    volume_min: float
+    volume_max: float
+    volume_step: float
+    stops_level: int
+
+    @classmethod
+    def from_info(cls, info) -> "SymbolMeta":
+        """
+        Build from the object returned by mt5.symbol_info.
+
+        Args:
+            info: An mt5.symbol_info result.
+
+        Returns:
+            SymbolMeta: The extracted properties.
+        """
+        return cls(
+            digits=info.digits,
+            point=info.point,
+            volume_min=info.volume_min,
+            volume_max=info.volume_max,
+            volume_step=info.volume_step,
+            stops_level=info.trade_stops_level,
+        )
+
+
+class SymbolInfoCache:
+    """
+    A TTL cache of symbol metadata, so order placement does not query the terminal
+    for digits/point/volume limits on every request.
+
+    """
+
+    def __init__(self, fetch: Callable, ttl: float = 60.0) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            fetch (Callable): Function returning symbol info for a symbol name,
+                usually mt5.symbol_info; it may return None on failure.
+            ttl (float, optional): Seconds an entry stays valid. Default is 60.
+        """
+        self.fetch = fetch
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, symbol: str) -> SymbolMeta | None:
+        """
+        Return the metadata of a symbol, querying the terminal when missing or expired.
+
+        Args:
+            symbol (str): Trading symbol (e.g., 'XAUUSD').
+
+        Returns:
+            SymbolMeta | None: The metadata, or None if the terminal returned nothing
+            (failures are not cached).
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry is not None and now - entry[0] < self.ttl:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        info = self.fetch(symbol)
+        if info is None:
+            return None
+        meta = SymbolMeta.from_info(info)
+        with self._lock:
+            self._entries[symbol] = (now, meta)
+        return meta
+
+    def invalidate(self, symbol: str | None = None) -> None:
+        """
+        Drop the cached metadata of one symbol, or of all symbols.
+
+        Args:
+            symbol (str | None, optional): Symbol to drop; None clears the cache.
+        """
+        with self._lock:
+            if symbol is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(symbol, None)
+
+    def stats(self) -> dict:
+        """
+        Return the cache counters for monitoring.
+
+        Returns:
+            dict: hits, misses, hit_rate and size.
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": len(self._entries),
+            }
+
+
+class TickSnapshot:
+    """
+    Ticks fetched at most once per symbol, shared by all orders of one batch
+    (e.g. closing every position of a symbol or placing a grid).
+
+    """
+
+    def __init__(self, fetch: Callable) -> None:
+        """
+        Initialize an empty snapshot.
+
+        Args:
+            fetch (Callable): Function returning the last tick of a symbol, usually
+                mt5.symbol_info_tick; it may return None on failure.
+        """
+        self.fetch = fetch
+        self._ticks = {}
+
+    def get(self, symbol: str):
+        """
+        Return the tick of a symbol, querying the terminal on first use only.
+
+        Args:
+            symbol (str): Trading symbol (e.g., 'XAUUSD').
+
+        Returns:
+            The tick, or None if the terminal returned nothing (not cached).
+        """
+        tick = self._ticks.get(symbol)
+        if tick is None:
+            tick = self.fetch(symbol)
+            if tick is not None:
+                self._ticks[symbol] = tick
+        return tick
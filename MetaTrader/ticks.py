@@ -0,0 +1,296 @@
+import os
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+from .bar_store import _join, to_epoch
+
+# compact on-disk layout of one tick: 44 bytes, no padding
+TICK_DTYPE = np.dtype(
+    [
+        ("time_msc", "<i8"),
+        ("bid", "<f8"),
+        ("ask", "<f8"),
+        ("last", "<f8"),
+        ("volume", "<f8"),
+        ("flags", "<u4"),
+    ]
+)
+
+_MS_PER_DAY = 86_400_000
+
+
+def to_ticks(raw) -> np.ndarray:
+    """
+    Convert ticks to the store's row layout.
+
+    Args:
+        raw: A structured array from mt5.copy_ticks_* (its 'volume_real' is kept as
+            'volume' when present), or any structured array or DataFrame with
+            time_msc/bid/ask columns. Missing columns are filled with 0.
+
+    Returns:
+        np.ndarray: TICK_DTYPE array, in the input order.
+    """
+    if isinstance(raw, np.ndarray) and raw.dtype == TICK_DTYPE:
+        return raw
+    names = raw.dtype.names if isinstance(raw, np.ndarray) else tuple(raw)
+    ticks = np.zeros(len(raw), dtype=TICK_DTYPE)
+    for name in TICK_DTYPE.names:
+        source = "volume_real" if name == "volume" and "volume_real" in names else name
+        if source in names:
+            ticks[name] = np.asarray(raw[source])
+    return ticks
+
+
+class TickStore:
+    """
+    A local on-disk record of bid/ask ticks, one directory per symbol and one file
+    per UTC day: <root>/<symbol>/<YYYY-MM-DD>.ticks.
+
+    Like BarStore, each file is a headerless array of TICK_DTYPE records sorted by
+    time, written with plain appends and read back with np.memmap. Several ticks can
+    share one millisecond, so ticks are never de-duplicated by time here; the
+    TickRecorder only appends ticks it has not stored yet.
+
+    """
+
+    def __init__(self, root: str | os.PathLike) -> None:
+        """
+        Initialize the store, creating the root directory if needed.
+
+        Args:
+            root (str | os.PathLike): Directory holding the tick files.
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def path(self, symbol: str, day: str | None = None) -> Path:
+        """
+        Return the directory of a symbol, or the file of one of its days.
+
+        Args:
+            symbol (str): Trading symbol (e.g., 'XAUUSD').
+            day (str | None, optional): Day as 'YYYY-MM-DD'.
+
+        Returns:
+            Path: The directory or file path.
+        """
+        directory = self.root / symbol
+        return directory if day is None else directory / f"{day}.ticks"
+
+    def days(self, symbol: str) -> list[str]:
+        """
+        List the recorded days of a symbol, oldest first.
+
+        Args:
+            symbol (str): Trading symbol.
+
+        Returns:
+            list[str]: Days as 'YYYY-MM-DD'.
+        """
+        directory = self.path(symbol)
+        if not directory.is_dir():
+            return []
+        return sorted(p.stem for p in directory.glob("*.ticks") if p.stat().st_size)
+
+    def tail(self, symbol: str, n: int) -> np.ndarray:
+        """
+        Return up to the newest `n` ticks of the newest recorded day.
+
+        Args:
+            symbol (str): Trading symbol.
+            n (int): Number of ticks.
+
+        Returns:
+            np.ndarray: TICK_DTYPE array, oldest first (empty if nothing is recorded).
+        """
+        days = self.days(symbol)
+        if not days or n <= 0:
+            return np.empty(0, dtype=TICK_DTYPE)
+        path = self.path(symbol, days[-1])
+        count = path.stat().st_size // TICK_DTYPE.itemsize
+        skip = max(0, count - n)
+        return np.fromfile(path, TICK_DTYPE, offset=skip * TICK_DTYPE.itemsize)
+
+    def append(self, symbol: str, ticks) -> int:
+        """
+        Append ticks newer than the recorded ones, split into their day files.
+
+        Args:
+            symbol (str): Trading symbol.
+            ticks: Ticks in time order (see to_ticks), all after the recorded ones.
+
+        Returns:
+            int: Number of ticks written.
+        """
+        rows = to_ticks(ticks)
+        if not len(rows):
+            return 0
+        days = rows["time_msc"] // _MS_PER_DAY
+        starts = np.flatnonzero(np.append(True, days[1:] != days[:-1]))
+        ends = np.append(starts[1:], len(rows))
+        with self._lock:
+            self.path(symbol).mkdir(parents=True, exist_ok=True)
+            for lo, hi in zip(starts, ends):
+                day = str(np.datetime64(int(days[lo]), "D"))
+                with open(self.path(symbol, day), "ab") as f:
+                    rows[lo:hi].tofile(f)
+        return len(rows)
+
+    def load(self, symbol: str, start=None, end=None) -> np.ndarray:
+        """
+        Read the ticks of a time range into one array.
+
+        Args:
+            symbol (str): Trading symbol.
+            start (optional): First time to include (see to_epoch). Default: all.
+            end (optional): Time to stop before (see to_epoch). Default: all.
+
+        Returns:
+            np.ndarray: A writable TICK_DTYPE array, oldest first.
+        """
+        start, end = to_epoch(start), to_epoch(end)
+        start_msc = None if start is None else start * 1000
+        end_msc = None if end is None else end * 1000
+        first = (
+            None if start is None else str(np.datetime64(start, "s").astype("M8[D]"))
+        )
+        last = None if end is None else str(np.datetime64(end - 1, "s").astype("M8[D]"))
+
+        parts = []
+        for day in self.days(symbol):
+            if (first is not None and day < first) or (last is not None and day > last):
+                continue
+            rows = np.memmap(self.path(symbol, day), TICK_DTYPE, "r")
+            times = rows["time_msc"]
+            lo = 0 if start_msc is None else np.searchsorted(times, start_msc)
+            hi = len(rows) if end_msc is None else np.searchsorted(times, end_msc)
+            if hi > lo:
+                parts.append(rows[lo:hi])
+        return _join(parts, TICK_DTYPE)
+
+
+class TickRecorder:
+    """
+    Polls the terminal for new ticks of the configured symbols and appends them to a
+    TickStore.
+
+    Each poll asks for the ticks from the second of the newest recorded tick onwards,
+    so nothing is missed between polls; the overlap is dropped by comparing against
+    the newest recorded millisecond and the number of ticks already stored in it.
+
+    """
+
+    def __init__(
+        self,
+        store: TickStore,
+        terminal,
+        symbols: list[str],
+        batch: int = 100_000,
+    ) -> None:
+        """
+        Initialize the recorder.
+
+        Args:
+            store (TickStore): Where ticks are written.
+            terminal: The MetaTrader5 module or a compatible stand-in, initialized
+                and logged in.
+            symbols (list[str]): Symbols to record.
+            batch (int, optional): Most ticks requested per call. Default is 100000.
+        """
+        self.store = store
+        self.terminal = terminal
+        self.symbols = list(symbols)
+        self.batch = batch
+        self.recorded = dict.fromkeys(self.symbols, 0)
+        # symbol -> (newest recorded time_msc, ticks recorded at that millisecond)
+        self._last = {}
+
+    def _resume(self, symbol: str) -> tuple[int, int] | None:
+        tail = self.store.tail(symbol, 1024)
+        if not len(tail):
+            return None
+        last = int(tail["time_msc"][-1])
+        return last, int(np.count_nonzero(tail["time_msc"] == last))
+
+    def _new_ticks(self, symbol: str, ticks: np.ndarray) -> np.ndarray:
+        last, count = self._last[symbol]
+        times = ticks["time_msc"]
+        lo = np.searchsorted(times, last)
+        hi = np.searchsorted(times, last, side="right")
+        # ticks of the newest millisecond beyond those already recorded are new
+        return ticks[min(lo + count, hi) :]
+
+    def poll_symbol(self, symbol: str) -> int:
+        """
+        Record the ticks of one symbol that arrived since the previous poll.
+
+        On the first poll of a symbol without recorded history, recording starts at
+        the terminal's current tick.
+
+        Args:
+            symbol (str): Trading symbol.
+
+        Returns:
+            int: Number of ticks recorded.
+        """
+        if symbol not in self._last:
+            resumed = self._resume(symbol)
+            if resumed is None:
+                tick = self.terminal.symbol_info_tick(symbol)
+                if tick is None:
+                    return 0
+                resumed = (tick.time_msc - 1, 0)
+            self._last[symbol] = resumed
+
+        written = 0
+        while True:
+            raw = self.terminal.copy_ticks_from(
+                symbol,
+                self._last[symbol][0] // 1000,
+                self.batch,
+                self.terminal.COPY_TICKS_ALL,
+            )
+            if raw is None or not len(raw):
+                break
+            ticks = self._new_ticks(symbol, to_ticks(raw))
+            if len(ticks):
+                written += self.store.append(symbol, ticks)
+                times = ticks["time_msc"]
+                last = int(times[-1])
+                same = int(np.count_nonzero(times == last))
+                if last == self._last[symbol][0]:
+                    same += self._last[symbol][1]
+                self._last[symbol] = (last, same)
+            # a full batch may have cut off the newest ticks
+            if len(raw) < self.batch or not len(ticks):
+                break
+        self.recorded[symbol] = self.recorded.get(symbol, 0) + written
+        return written
+
+    def poll(self) -> dict[str, int]:
+        """
+        Record the new ticks of every symbol.
+
+        Returns:
+            dict[str, int]: Ticks recorded per symbol.
+        """
+        return {symbol: self.poll_symbol(symbol) for symbol in self.symbols}
+
+    def run(self, interval: float = 1.0, stop: threading.Event | None = None) -> None:
+        """
+        Poll until `stop` is set (or forever), every `interval` seconds.
+
+        Args:
+            interval (float, optional): Seconds between polls. Default is 1.0.
+            stop (threading.Event | None, optional): Ends the loop when set.
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            started = time.monotonic()
+            self.poll()
+            stop.wait(max(0.0, interval - (time.monotonic() - started)))
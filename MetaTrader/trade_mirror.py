@@ -0,0 +1,376 @@
+import threading
+import time
+from typing import NamedTuple
+
+
+class MirrorEntry(NamedTuple):
+    """
+    A position or pending order as held by the mirror.
+
+    """
+
+    ticket: int
+    symbol: str
+    type: int  # POSITION_TYPE_* for positions, ORDER_TYPE_* for orders
+    magic: int
+    volume: float
+    price: float  # open price of a position, trigger price of an order
+    sl: float
+    tp: float
+    comment: str
+
+    @classmethod
+    def from_position(cls, position) -> "MirrorEntry":
+        """
+        Build from an mt5.positions_get entry.
+
+        Args:
+            position: A TradePosition.
+
+        Returns:
+            MirrorEntry: The entry.
+        """
+        return cls(
+            position.ticket,
+            position.symbol,
+            position.type,
+            position.magic,
+            position.volume,
+            position.price_open,
+            position.sl,
+            position.tp,
+            position.comment,
+        )
+
+    @classmethod
+    def from_order(cls, order) -> "MirrorEntry":
+        """
+        Build from an mt5.orders_get entry.
+
+        Args:
+            order: A TradeOrder.
+
+        Returns:
+            MirrorEntry: The entry.
+        """
+        return cls(
+            order.ticket,
+            order.symbol,
+            order.type,
+            order.magic,
+            order.volume_current,
+            order.price_open,
+            order.sl,
+            order.tp,
+            order.comment,
+        )
+
+
+class TradeBook:
+    """
+    Entries by ticket, indexed by every combination of symbol, type and magic (with
+    None as a wildcard), so counts are O(1) and selections O(matches).
+
+    Not thread-safe on its own; TradeMirror guards it.
+
+    """
+
+    def __init__(self) -> None:
+        self.entries = {}
+        self._index = {}
+
+    @staticmethod
+    def _keys(entry: MirrorEntry) -> tuple:
+        s, t, m = entry.symbol, entry.type, entry.magic
+        return (
+            (s, t, m),
+            (s, t, None),
+            (s, None, m),
+            (s, None, None),
+            (None, t, m),
+            (None, t, None),
+            (None, None, m),
+            (None, None, None),
+        )
+
+    def add(self, entry: MirrorEntry) -> None:
+        """Add an entry, replacing the one with the same ticket."""
+        if entry.ticket in self.entries:
+            self.remove(entry.ticket)
+        self.entries[entry.ticket] = entry
+        index = self._index
+        for key in self._keys(entry):
+            tickets = index.get(key)
+            if tickets is None:
+                index[key] = {entry.ticket}
+            else:
+                tickets.add(entry.ticket)
+
+    def remove(self, ticket: int) -> MirrorEntry | None:
+        """Remove an entry and return it (None if there was none)."""
+        entry = self.entries.pop(ticket, None)
+        if entry is not None:
+            for key in self._keys(entry):
+                tickets = self._index[key]
+                tickets.discard(ticket)
+                if not tickets:
+                    del self._index[key]
+        return entry
+
+    def get(self, ticket: int) -> MirrorEntry | None:
+        return self.entries.get(ticket)
+
+    def count(self, symbol=None, type_=None, magic=None) -> int:
+        return len(self._index.get((symbol, type_, magic), ()))
+
+    def select(self, symbol=None, type_=None, magic=None) -> tuple[MirrorEntry, ...]:
+        tickets = self._index.get((symbol, type_, magic), ())
+        return tuple(self.entries[t] for t in sorted(tickets))
+
+    def replace(self, entries) -> int:
+        """
+        Replace the contents and return how many tickets were added, removed or
+        changed.
+        """
+        new = {entry.ticket: entry for entry in entries}
+        drift = sum(1 for t, e in new.items() if self.entries.get(t) != e)
+        drift += sum(1 for t in self.entries if t not in new)
+        self.entries = {}
+        self._index = {}
+        for entry in new.values():
+            self.add(entry)
+        return drift
+
+
+class TradeMirror:
+    """
+    An in-memory copy of the account's open positions and pending orders.
+
+    The mirror follows our own order results (apply()), so after placing, closing,
+    modifying or removing it already holds the new state without asking the
+    terminal. What it cannot see (pending orders filling, SL/TP hits, trades from
+    other programs or by hand) is picked up by reconcile(), which the owner runs
+    whenever due() says so: every `interval` seconds, and as soon as a result did not
+    say what changed (no result, a partial fill, a rejected request for a ticket the
+    mirror holds, or any market order on a netting account).
+
+    """
+
+    def __init__(self, terminal, interval: float = 5.0, clock=time.monotonic) -> None:
+        """
+        Initialize an empty mirror; it is due for a reconcile right away.
+
+        Args:
+            terminal: The MetaTrader5 module or a compatible object, for its constants.
+            interval (float, optional): Most seconds between reconciles; 0 makes every
+                lookup reconcile first. Default is 5.0.
+            clock (Callable[[], float], optional): Monotonic clock. Defaults to
+                time.monotonic.
+        """
+        self.terminal = terminal
+        self.interval = interval
+        self.clock = clock
+        self.hedging = True  # hedging accounts keep one position per opening deal
+        self.positions = TradeBook()
+        self.orders = TradeBook()
+        self.applied = 0
+        self.reconciles = 0
+        self.drift = 0  # changes found by reconciles, i.e. missed by apply()
+        self._dirty = True
+        self._last = None
+        self._lock = threading.RLock()
+        self._done = {terminal.TRADE_RETCODE_DONE}
+        if hasattr(terminal, "TRADE_RETCODE_PLACED"):
+            self._done.add(terminal.TRADE_RETCODE_PLACED)
+
+    def due(self) -> bool:
+        """
+        Tell whether the mirror should be reconciled before it is relied on.
+
+        Returns:
+            bool: True if invalidated or `interval` seconds passed since the last one.
+        """
+        with self._lock:
+            return self._dirty or self.clock() - self._last >= self.interval
+
+    def invalidate(self) -> None:
+        """
+        Mark the mirror as out of date, so the next lookup reconciles.
+        """
+        with self._lock:
+            self._dirty = True
+
+    def reconcile(self, positions, orders, applied: int | None = None) -> int:
+        """
+        Replace the mirror with the terminal's state.
+
+        Args:
+            positions: The result of mt5.positions_get().
+            orders: The result of mt5.orders_get().
+            applied (int | None, optional): `applied` before the terminal was asked.
+                If results were applied since, the snapshot may predate them, so the
+                mirror stays due.
+
+        Returns:
+            int: Positions and orders that differed from the mirror.
+        """
+        position_entries = [MirrorEntry.from_position(p) for p in positions]
+        order_entries = [MirrorEntry.from_order(o) for o in orders]
+        with self._lock:
+            drift = self.positions.replace(position_entries)
+            drift += self.orders.replace(order_entries)
+            self.reconciles += 1
+            self.drift += drift
+            self._dirty = applied is not None and applied != self.applied
+            self._last = self.clock()
+        return drift
+
+    def apply(self, request: dict, result) -> None:
+        """
+        Update the mirror from the result of one of our order requests.
+
+        Args:
+            request (dict): The order_send request.
+            result: Its OrderSendResult, or None if order_send failed.
+        """
+        t = self.terminal
+        action = request.get("action")
+        with self._lock:
+            self.applied += 1
+            if result is None:
+                self._dirty = True
+                return
+            if result.retcode not in self._done:
+                # a ticket we hold was rejected: it may be gone already
+                ticket = request.get("position") or request.get("order")
+                if ticket and (
+                    ticket in self.positions.entries or ticket in self.orders.entries
+                ):
+                    self._dirty = True
+                return
+
+            if action == t.TRADE_ACTION_DEAL:
+                self._apply_deal(request, result)
+            elif action == t.TRADE_ACTION_PENDING:
+                self.orders.add(self._entry(request, result, result.order))
+            elif action == t.TRADE_ACTION_REMOVE:
+                self.orders.remove(request.get("order"))
+            elif action == t.TRADE_ACTION_SLTP:
+                self._update(self.positions, request, ("sl", "tp"))
+            elif action == getattr(t, "TRADE_ACTION_MODIFY", None):
+                self._update(self.orders, request, ("price", "sl", "tp"))
+            else:
+                self._dirty = True
+
+    def _entry(self, request: dict, result, ticket: int) -> MirrorEntry:
+        return MirrorEntry(
+            ticket,
+            request.get("symbol", ""),
+            request.get("type", 0),
+            request.get("magic", 0),
+            result.volume or request.get("volume", 0.0),
+            result.price or request.get("price", 0.0),
+            request.get("sl", 0.0),
+            request.get("tp", 0.0),
+            request.get("comment", ""),
+        )
+
+    def _apply_deal(self, request: dict, result) -> None:
+        volume = request.get("volume", 0.0)
+        if not self.hedging or (result.volume and result.volume < volume):
+            self._dirty = True
+            return
+        ticket = request.get("position")
+        if not ticket:
+            # on hedging accounts the position takes the ticket of its opening order
+            entry = self._entry(request, result, result.order)
+            position_type = (
+                self.terminal.POSITION_TYPE_BUY
+                if entry.type == self.terminal.ORDER_TYPE_BUY
+                else self.terminal.POSITION_TYPE_SELL
+            )
+            self.positions.add(entry._replace(type=position_type))
+            return
+        entry = self.positions.get(ticket)
+        if entry is None:
+            self._dirty = True
+            return
+        remaining = round(entry.volume - volume, 8)
+        if remaining > 0:
+            self.positions.add(entry._replace(volume=remaining))
+        else:
+            self.positions.remove(ticket)
+
+    def _update(self, book: TradeBook, request: dict, fields: tuple) -> None:
+        ticket = request.get("position") or request.get("order")
+        entry = book.get(ticket)
+        if entry is None:
+            self._dirty = True
+            return
+        book.add(
+            entry._replace(**{f: request.get(f, getattr(entry, f)) for f in fields})
+        )
+
+    def count_positions(self, symbol=None, type_=None, magic=None) -> int:
+        """
+        Count the mirrored positions matching every given filter.
+
+        Args:
+            symbol (str | None, optional): Trading symbol.
+            type_ (int | None, optional): POSITION_TYPE_* constant.
+            magic (int | None, optional): Magic number.
+
+        Returns:
+            int: Number of positions.
+        """
+        with self._lock:
+            return self.positions.count(symbol, type_, magic)
+
+    def count_orders(self, symbol=None, type_=None, magic=None) -> int:
+        """
+        Count the mirrored pending orders matching every given filter.
+
+        Args:
+            symbol (str | None, optional): Trading symbol.
+            type_ (int | None, optional): ORDER_TYPE_* constant.
+            magic (int | None, optional): Magic number.
+
+        Returns:
+            int: Number of orders.
+        """
+        with self._lock:
+            return self.orders.count(symbol, type_, magic)
+
+    def select_positions(
+        self, symbol=None, type_=None, magic=None
+    ) -> tuple[MirrorEntry, ...]:
+        """
+        Return the mirrored positions matching every given filter, by ticket.
+        """
+        with self._lock:
+            return self.positions.select(symbol, type_, magic)
+
+    def select_orders(
+        self, symbol=None, type_=None, magic=None
+    ) -> tuple[MirrorEntry, ...]:
+        """
+        Return the mirrored pending orders matching every given filter, by ticket.
+        """
+        with self._lock:
+            return self.orders.select(symbol, type_, magic)
+
+    def stats(self) -> dict:
+        """
+        Return the mirror counters for monitoring.
+
+        Returns:
+            dict: positions, orders, applied results, reconciles and drift.
+        """
+        with self._lock:
+            return {
+                "positions": len(self.positions.entries),
+                "orders": len(self.orders.entries),
+                "applied": self.applied,
+                "reconciles": self.reconciles,
+                "drift": self.drift,
+            }
@@ -0,0 +1,326 @@
+"""
+A structured, append-only journal of trading events: signals, indicator snapshots,
+order requests with their results, and terminal call latencies.
+
+Every event type has a fixed record layout (a packed NumPy dtype). Records are kept
+in memory and appended to <root>/<YYYY-MM-DD>/<event>.bin by a background thread,
+with one fsync per file per interval rather than per record. Each file is a headerless
+array of records next to an <event>.json schema, so a day of events loads into NumPy
+or pandas columns with one read and no parsing.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+_NS_PER_DAY = 86_400 * 10**9
+
+EVENT_DTYPES = {
+    "signal": np.dtype(
+        [
+            ("time_ns", "<i8"),
+            ("symbol", "S16"),
+            ("strategy", "S48"),
+            ("timeframe", "S4"),
+            ("direction", "i1"),  # 1 buy, -1 sell
+            ("price", "<f8"),
+        ]
+    ),
+    "indicator": np.dtype(
+        [
+            ("time_ns", "<i8"),
+            ("symbol", "S16"),
+            ("strategy", "S48"),
+            ("name", "S16"),
+            ("value", "<f8"),
+        ]
+    ),
+    "order": np.dtype(
+        [
+            ("time_ns", "<i8"),  # when the request was sent
+            ("symbol", "S16"),
+            ("action", "<i2"),
+            ("type", "<i2"),
+            ("volume", "<f8"),
+            ("price", "<f8"),  # requested
+            ("sl", "<f8"),
+            ("tp", "<f8"),
+            ("position", "<i8"),
+            ("retcode", "<i4"),  # 0 if order_send returned None or raised
+            ("order", "<i8"),
+            ("deal", "<i8"),
+            ("fill_price", "<f8"),
+            ("latency", "<f8"),  # seconds order_send took
+            ("comment", "S32"),
+        ]
+    ),
+    "latency": np.dtype(
+        [
+            ("time_ns", "<i8"),
+            ("call", "S24"),
+            ("seconds", "<f8"),
+            ("failed", "?"),
+        ]
+    ),
+}
+
+
+class Journal:
+    """
+    Writes events to daily binary files from a background thread.
+
+    record() only copies one row into a preallocated in-memory buffer, so it is
+    cheap enough for the order path. The writer thread appends the buffered rows
+    every `fsync_interval` seconds and fsyncs each file it wrote; a full buffer is
+    appended immediately and synced with the next batch.
+
+    """
+
+    def __init__(
+        self,
+        root: str | os.PathLike,
+        fsync_interval: float = 1.0,
+        buffer_rows: int = 4096,
+        clock=time.time_ns,
+    ) -> None:
+        """
+        Initialize the journal and start its writer thread.
+
+        Args:
+            root (str | os.PathLike): Directory of the journal.
+            fsync_interval (float, optional): Seconds between flushes. Default is 1.0.
+            buffer_rows (int, optional): Rows buffered per event type. Default is 4096.
+            clock (Callable[[], int], optional): Epoch nanoseconds for records without
+                a time_ns field. Defaults to time.time_ns.
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.fsync_interval = fsync_interval
+        self.buffer_rows = buffer_rows
+        self.clock = clock
+        self.dtypes = {}
+        self._buffers = {}
+        self._counts = {}
+        self._defaults = {}
+        self._columns = {}
+        self._unsynced = set()  # files appended to since their last fsync
+        self._lock = threading.Lock()
+        for event, dtype in EVENT_DTYPES.items():
+            self.register(event, dtype)
+
+        self._stop = threading.Event()
+        self._writer = threading.Thread(
+            target=self._run, name="journal-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
+
+    def register(self, event: str, dtype: np.dtype) -> None:
+        """
+        Add an event type.
+
+        Args:
+            event (str): Event name, used as the file name.
+            dtype (np.dtype): Record layout; must start with an int64 'time_ns'.
+
+        Raises:
+            ValueError: If the layout has no leading time_ns field.
+        """
+        dtype = np.dtype(dtype)
+        if dtype.names is None or dtype.names[0] != "time_ns":
+            raise ValueError(f"⚠️ Journal event '{event}' must start with time_ns.")
+        with self._lock:
+            self.dtypes[event] = dtype
+            self._buffers[event] = np.zeros(self.buffer_rows, dtype=dtype)
+            self._defaults[event] = np.zeros(1, dtype=dtype)[0].tolist()
+            # field -> (position in a row, byte width of text fields)
+            self._columns[event] = {
+                name: (i, dtype[name].itemsize) for i, name in enumerate(dtype.names)
+            }
+            self._counts[event] = 0
+
+    def record(self, event: str, **fields) -> None:
+        """
+        Add one event. Missing fields are 0/empty; strings are stored as UTF-8,
+        truncated to the field width.
+
+        Args:
+            event (str): A registered event name, e.g. 'signal'.
+            **fields: Field values, e.g. symbol='XAUUSD', direction=1.
+
+        Raises:
+            ValueError: If the event or a field is unknown.
+        """
+        dtype = self.dtypes.get(event)
+        if dtype is None:
+            raise ValueError(f"⚠️ Unknown journal event: {event}")
+        columns = self._columns[event]
+        row = list(self._defaults[event])
+        time_ns = fields.pop("time_ns", None)
+        row[0] = self.clock() if time_ns is None else time_ns
+        for name, value in fields.items():
+            column = columns.get(name)
+            if column is None:
+                raise ValueError(
+                    f"⚠️ Unknown field '{name}' for journal event '{event}'."
+                )
+            index, width = column
+            if isinstance(value, str):
+                value = value.encode("utf-8")[:width]
+            row[index] = value
+        with self._lock:
+            if self._counts[event] == self.buffer_rows:
+                self._write(event)
+            self._buffers[event][self._counts[event]] = tuple(row)
+            self._counts[event] += 1
+
+    def _write(self, event: str) -> None:
+        """Append the buffered rows of one event to their day files (lock held)."""
+        count = self._counts[event]
+        if not count:
+            return
+        rows = self._buffers[event][:count]
+        days = rows["time_ns"] // _NS_PER_DAY
+        order = np.argsort(days, kind="stable")
+        rows, days = rows[order], days[order]
+        starts = np.flatnonzero(np.append(True, days[1:] != days[:-1]))
+        for lo, hi in zip(starts, np.append(starts[1:], len(rows))):
+            directory = self.root / str(np.datetime64(int(days[lo]), "D"))
+            path = directory / f"{event}.bin"
+            if not path.exists():
+                directory.mkdir(parents=True, exist_ok=True)
+                with open(directory / f"{event}.json", "w") as f:
+                    json.dump({"event": event, "dtype": self.dtypes[event].descr}, f)
+            with open(path, "ab") as f:
+                rows[lo:hi].tofile(f)
+            self._unsynced.add(path)
+        self._counts[event] = 0
+
+    def flush(self, sync: bool = True) -> None:
+        """
+        Append every buffered row now.
+
+        Args:
+            sync (bool, optional): Also fsync the written files. Default is True.
+        """
+        with self._lock:
+            for event in self._buffers:
+                self._write(event)
+            paths, self._unsynced = self._unsynced, set()
+        if sync:
+            for path in paths:
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.fsync_interval):
+            self.flush()
+
+    def close(self) -> None:
+        """
+        Stop the writer thread and write and sync the remaining rows.
+        """
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        self._writer.join()
+        self.flush()
+
+
+class JournalReader:
+    """
+    Loads journal files into NumPy records or pandas columns.
+
+    """
+
+    def __init__(self, root: str | os.PathLike) -> None:
+        """
+        Initialize the reader.
+
+        Args:
+            root (str | os.PathLike): Directory of the journal.
+        """
+        self.root = Path(root)
+
+    def days(self) -> list[str]:
+        """
+        List the journal days, oldest first.
+
+        Returns:
+            list[str]: Days as 'YYYY-MM-DD'.
+        """
+        if not self.root.is_dir():
+            return []
+        return sorted(p.name for p in self.root.iterdir() if p.is_dir())
+
+    def events(self, day: str) -> list[str]:
+        """
+        List the event types recorded on a day.
+
+        Args:
+            day (str): Day as 'YYYY-MM-DD'.
+
+        Returns:
+            list[str]: Event names.
+        """
+        return sorted(p.stem for p in (self.root / day).glob("*.json"))
+
+    def dtype(self, event: str, day: str) -> np.dtype:
+        with open(self.root / day / f"{event}.json") as f:
+            descr = json.load(f)["dtype"]
+        return np.dtype([tuple(field) for field in descr])
+
+    def read(self, event: str, day: str | None = None) -> np.ndarray:
+        """
+        Read the records of one event type.
+
+        Args:
+            event (str): Event name, e.g. 'order'.
+            day (str | None, optional): Day as 'YYYY-MM-DD'. Default reads all days.
+
+        Returns:
+            np.ndarray: Structured array in recording order per day (empty if the
+            event was never recorded).
+        """
+        days = [day] if day is not None else self.days()
+        parts = [
+            np.fromfile(self.root / d / f"{event}.bin", self.dtype(event, d))
+            for d in days
+            if (self.root / d / f"{event}.bin").exists()
+        ]
+        if not parts:
+            return np.empty(0, dtype=EVENT_DTYPES.get(event, [("time_ns", "<i8")]))
+        return np.concatenate(parts) if len(parts) > 1 else parts[0]
+
+    def frame(self, event: str, day: str | None = None) -> pd.DataFrame:
+        """
+        Read the records of one event type into a DataFrame.
+
+        Text fields are decoded to str and 'time_ns' gets a datetime 'time' column
+        (UTC) next to it.
+
+        Args:
+            event (str): Event name, e.g. 'order'.
+            day (str | None, optional): Day as 'YYYY-MM-DD'. Default reads all days.
+
+        Returns:
+            pd.DataFrame: One row per record.
+        """
+        records = self.read(event, day)
+        df = pd.DataFrame(
+            {name: records[name] for name in records.dtype.names}, copy=False
+        )
+        for name in records.dtype.names:
+            if records.dtype[name].kind == "S":
+                df[name] = np.char.decode(records[name], "utf-8", "ignore")
+        df.insert(0, "time", pd.to_datetime(records["time_ns"], unit="ns"))
+        return df
@@ -1,10 +1,123 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import threading
 from datetime import datetime
 
+_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+_STOP = object()  # sentinel telling the writer thread to exit
+
+
+class _DeferredFlush:
+    """
+    Handler mixin whose emit() leaves flushing to the writer thread, which flushes
+    once per batch instead of once per record.
+
+    """
+
+    def flush(self):
+        pass
+
+    def flush_batch(self):
+        super().flush()
+
+
+class _BatchFileHandler(_DeferredFlush, logging.FileHandler):
+    pass
+
+
+class _BatchRotatingFileHandler(_DeferredFlush, logging.handlers.RotatingFileHandler):
+    pass
+
+
+class _BatchTimedRotatingFileHandler(
+    _DeferredFlush, logging.handlers.TimedRotatingFileHandler
+):
+    pass
+
+
+class _BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    Puts records on a bounded queue. When the queue is full, records below
+    `block_level` are dropped (policy 'drop') and the others wait for room, so
+    warnings and errors are never lost; with policy 'block' every record waits.
+
+    """
+
+    def __init__(self, records: queue.Queue, policy: str, block_level: int) -> None:
+        super().__init__(records)
+        self.policy = policy
+        self.block_level = block_level
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # merge the arguments now, as they may change later; formatting (time stamp,
+        # layout) is left to the writer thread. The record is only ever written by the
+        # writer, so it is updated in place rather than copied.
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.policy == "block" or record.levelno >= self.block_level:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
 
 class LogManager:
-    def __init__(self, prefix="app_M1", log_dir="Logs"):
+    def __init__(
+        self,
+        prefix="app_M1",
+        log_dir="Logs",
+        async_logging: bool = False,
+        queue_size: int = 10_000,
+        policy: str = "drop",
+        max_bytes: int = 0,
+        backup_count: int = 5,
+        when: str | None = None,
+        batch_size: int = 512,
+        flush_interval: float = 0.5,
+    ):
+        """
+        Configure the root logger to write to a file in `log_dir`.
+
+        By default every record is written and flushed by the thread that logs it.
+        With `async_logging`, that thread only puts the record on a bounded queue and
+        a background writer formats, writes and flushes records in batches, so a slow
+        disk never delays order placement.
+
+        Args:
+            prefix (str, optional): Log file name prefix. Default is "app_M1".
+            log_dir (str, optional): Directory of the log files. Default is "Logs".
+            async_logging (bool, optional): Write from a background thread. Default
+                is False.
+            queue_size (int, optional): Records the queue holds. Default is 10000.
+            policy (str, optional): What logging does when the queue is full: "drop"
+                discards DEBUG/INFO records (counted in `dropped`) and waits for room
+                for WARNING and above, "block" always waits. Default is "drop".
+            max_bytes (int, optional): Rotate the file at this size; 0 disables size
+                rotation. Default is 0.
+            backup_count (int, optional): Rotated files kept. Default is 5.
+            when (str | None, optional): Rotate on time instead, e.g. "midnight" or
+                "H" (see TimedRotatingFileHandler). Default is None.
+            batch_size (int, optional): Most records written per batch. Default is 512.
+            flush_interval (float, optional): Seconds the writer waits for records
+                before checking for drops again. Default is 0.5.
+
+        Raises:
+            ValueError: If the policy is unknown.
+        """
+        if policy not in ("drop", "block"):
+            raise ValueError(f"⚠️ Unknown log queue policy: {policy}")
         self.log_dir = log_dir
         os.makedirs(self.log_dir, exist_ok=True)
 
@@ -12,17 +125,127 @@ class LogManager:
         self.log_filename = os.path.join(
             self.log_dir, f"{prefix}_{self.date_time_str}.log"
         )
-        self._configure_logging()
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.when = when
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue_handler = None
+        self._writer = None
+        if async_logging:
+            self._configure_async_logging(queue_size, policy)
+        else:
+            self._configure_logging()
+
+    def _file_handler(self, batched: bool = False) -> logging.Handler:
+        if self.when:
+            cls = (
+                _BatchTimedRotatingFileHandler
+                if batched
+                else logging.handlers.TimedRotatingFileHandler
+            )
+            handler = cls(
+                self.log_filename,
+                when=self.when,
+                backupCount=self.backup_count,
+                encoding="utf-8",
+            )
+        elif self.max_bytes:
+            cls = (
+                _BatchRotatingFileHandler
+                if batched
+                else logging.handlers.RotatingFileHandler
+            )
+            handler = cls(
+                self.log_filename,
+                maxBytes=self.max_bytes,
+                backupCount=self.backup_count,
+                encoding="utf-8",
+            )
+        else:
+            cls = _BatchFileHandler if batched else logging.FileHandler
+            handler = cls(self.log_filename, mode="a", encoding="utf-8")
+        handler.setFormatter(logging.Formatter(_FORMAT))
+        return handler
 
     def _configure_logging(self):
         logging.basicConfig(
             level=logging.DEBUG,
-            format="%(asctime)s - %(levelname)s - %(message)s",
-            filename=self.log_filename,
-            filemode="a",
-            encoding="utf-8",
+            format=_FORMAT,
+            handlers=[self._file_handler()],
         )
 
+    def _configure_async_logging(self, queue_size: int, policy: str):
+        records = queue.Queue(maxsize=queue_size)
+        self.queue_handler = _BoundedQueueHandler(records, policy, logging.WARNING)
+        self.file_handler = self._file_handler(batched=True)
+        self._writer = threading.Thread(
+            target=self._write, args=(records,), name="log-writer", daemon=True
+        )
+        self._writer.start()
+        logging.basicConfig(level=logging.DEBUG, handlers=[self.queue_handler])
+        atexit.register(self.close)
+        if self.queue_handler not in logging.getLogger().handlers:
+            # logging was configured before, like basicConfig this is then a no-op
+            self.close()
+
+    def _write(self, records: queue.Queue):
+        handler = self.file_handler
+        reported = 0
+        while True:
+            try:
+                batch = [records.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                batch = []
+            while batch and len(batch) < self.batch_size:
+                try:
+                    batch.append(records.get_nowait())
+                except queue.Empty:
+                    break
+
+            dropped = self.queue_handler.dropped
+            if dropped != reported:
+                handler.handle(
+                    logging.makeLogRecord(
+                        {
+                            "levelno": logging.WARNING,
+                            "levelname": "WARNING",
+                            "msg": f"⚠️ {dropped - reported} log records dropped, queue full.",
+                        }
+                    )
+                )
+                reported = dropped
+
+            stop = False
+            for record in batch:
+                if record is _STOP:
+                    stop = True
+                else:
+                    handler.handle(record)
+            handler.flush_batch()
+            if stop:
+                return
+
+    @property
+    def dropped(self) -> int:
+        """
+        Records discarded because the queue was full (asynchronous mode only).
+        """
+        return self.queue_handler.dropped if self.queue_handler else 0
+
+    def close(self):
+        """
+        Write the queued records and stop the writer thread (asynchronous mode).
+        Called at exit automatically; logging afterwards is no longer written.
+        """
+        if self._writer is None:
+            return
+        writer, self._writer = self._writer, None
+        self.queue_handler.queue.put(_STOP)
+        writer.join()
+        logging.getLogger().removeHandler(self.queue_handler)
+        self.file_handler.close()
+
     @staticmethod
     def get_logger():
         return logging.getLogger()
@@ -0,0 +1,361 @@
+"""
+Opt-in profiling for the strategy loops.
+
+`profiler` is a process-wide Profiler, disabled by default. Code marks its stages
+with `profiler.stage("indicators")` (a context manager) or `@profiler.timed("fetch")`
+(a decorator); while disabled, a stage is one attribute check and a shared no-op
+context manager. Once enabled, every pass through a stage records its wall time and
+the CPU time of the thread that ran it, and stats() gives p50/p99 per stage.
+
+SamplingProfiler answers the questions stage timings cannot: it samples the stacks
+of every thread and writes them in the folded format that flamegraph.pl, speedscope
+or inferno turn into a flamegraph. install_signal_handler() starts one on a signal,
+so a live runner can be profiled without restarting it.
+"""
+
+import functools
+import os
+import signal
+import sys
+import threading
+import time
+from contextlib import nullcontext
+from datetime import datetime
+from typing import NamedTuple
+
+import numpy as np
+
+_DISABLED = nullcontext()
+
+
+class StageStats(NamedTuple):
+    """
+    Timings of one stage over the recorded passes, in seconds.
+
+    """
+
+    stage: str
+    count: int  # passes recorded (the percentiles cover the newest `capacity`)
+    wall_p50: float
+    wall_p99: float
+    cpu_p50: float
+    cpu_p99: float
+    wall_total: float
+
+
+class _Stage:
+    __slots__ = ("profiler", "name", "wall", "cpu")
+
+    def __init__(self, profiler: "Profiler", name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.cpu = time.thread_time()
+        self.wall = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        wall = time.perf_counter() - self.wall
+        self.profiler.record(self.name, wall, time.thread_time() - self.cpu)
+
+
+class Profiler:
+    """
+    Records per-stage wall and CPU time.
+
+    Each stage keeps its newest `capacity` passes in a ring buffer, so memory stays
+    fixed however long the runner runs. CPU time is per thread (time.thread_time), so
+    a stage that waits on the terminal or a lock shows a wall time well above its CPU
+    time.
+
+    """
+
+    def __init__(self, enabled: bool = False, capacity: int = 10_000) -> None:
+        """
+        Initialize the profiler.
+
+        Args:
+            enabled (bool, optional): Record from the start. Default is False.
+            capacity (int, optional): Passes kept per stage. Default is 10000.
+        """
+        self.enabled = enabled
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._stages = {}  # name -> [wall samples, cpu samples, passes, total wall]
+
+    def enable(self) -> None:
+        """
+        Start recording.
+        """
+        self.enabled = True
+
+    def disable(self) -> None:
+        """
+        Stop recording; what was recorded is kept.
+        """
+        self.enabled = False
+
+    def stage(self, name: str):
+        """
+        Time a block of code as one pass through a stage.
+
+        Args:
+            name (str): Stage name, e.g. 'indicators'.
+
+        Returns:
+            A context manager; a shared no-op one while disabled.
+        """
+        if not self.enabled:
+            return _DISABLED
+        return _Stage(self, name)
+
+    def timed(self, name: str | None = None):
+        """
+        Decorator timing each call of a function as one pass through a stage.
+
+        Args:
+            name (str | None, optional): Stage name. Defaults to the function's
+                qualified name.
+
+        Returns:
+            Callable: The decorator.
+        """
+
+        def decorator(func):
+            stage = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Stage(self, stage):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def record(self, name: str, wall: float, cpu: float) -> None:
+        """
+        Add one pass through a stage.
+
+        Args:
+            name (str): Stage name.
+            wall (float): Wall-clock seconds.
+            cpu (float): CPU seconds of the thread that ran it.
+        """
+        with self._lock:
+            entry = self._stages.get(name)
+            if entry is None:
+                entry = self._stages[name] = [
+                    np.zeros(self.capacity),
+                    np.zeros(self.capacity),
+                    0,
+                    0.0,
+                ]
+            walls, cpus, count, _ = entry
+            walls[count % self.capacity] = wall
+            cpus[count % self.capacity] = cpu
+            entry[2] += 1
+            entry[3] += wall
+
+    def stats(self) -> list[StageStats]:
+        """
+        Summarize every stage recorded so far.
+
+        Returns:
+            list[StageStats]: One entry per stage, slowest total first.
+        """
+        entries = []
+        with self._lock:
+            for name, (walls, cpus, count, total) in self._stages.items():
+                kept = min(count, self.capacity)
+                entries.append(
+                    (name, walls[:kept].copy(), cpus[:kept].copy(), count, total)
+                )
+        stats = []
+        for name, walls, cpus, count, total in entries:
+            wall_p50, wall_p99 = np.percentile(walls, [50, 99])
+            cpu_p50, cpu_p99 = np.percentile(cpus, [50, 99])
+            stats.append(
+                StageStats(
+                    name,
+                    count,
+                    float(wall_p50),
+                    float(wall_p99),
+                    float(cpu_p50),
+                    float(cpu_p99),
+                    total,
+                )
+            )
+        return sorted(stats, key=lambda s: s.wall_total, reverse=True)
+
+    def report(self) -> str:
+        """
+        Format stats() as a table, times in milliseconds.
+
+        Returns:
+            str: The table.
+        """
+        lines = [
+            f"{'stage':<24}{'count':>9}{'wall p50':>11}{'wall p99':>11}"
+            f"{'cpu p50':>11}{'cpu p99':>11}{'wall total':>12}"
+        ]
+        for s in self.stats():
+            lines.append(
+                f"{s.stage:<24}{s.count:>9}{s.wall_p50 * 1e3:>11.3f}"
+                f"{s.wall_p99 * 1e3:>11.3f}{s.cpu_p50 * 1e3:>11.3f}"
+                f"{s.cpu_p99 * 1e3:>11.3f}{s.wall_total * 1e3:>12.1f}"
+            )
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """
+        Forget every recorded pass.
+        """
+        with self._lock:
+            self._stages.clear()
+
+
+profiler = Profiler()
+
+
+class SamplingProfiler:
+    """
+    Samples the Python stacks of all threads from a background thread.
+
+    The samples are kept as folded stacks ('thread;outer;...;inner count' per line),
+    the input format of flamegraph.pl, speedscope and inferno. Sampling costs the
+    profiled threads only the GIL hand-offs to the sampler, at `interval` seconds.
+
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        """
+        Initialize the profiler.
+
+        Args:
+            interval (float, optional): Seconds between samples. Default is 0.005.
+        """
+        self.interval = interval
+        self.samples = 0
+        self._stacks = {}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self) -> None:
+        names = {t.ident: t.name for t in threading.enumerate()}
+        own = threading.get_ident()
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(
+                    f"{code.co_name} ({os.path.basename(code.co_filename)}:"
+                    f"{code.co_firstlineno})"
+                )
+                frame = frame.f_back
+            stack.append(names.get(ident, str(ident)))
+            key = ";".join(reversed(stack))
+            self._stacks[key] = self._stacks.get(key, 0) + 1
+        self.samples += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self) -> None:
+        """
+        Start sampling in the background, until stop().
+        """
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop sampling and wait for the sampler thread.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def folded(self) -> str:
+        """
+        Return the samples as folded stacks, most frequent first.
+
+        Returns:
+            str: One 'frame;frame;... count' line per distinct stack.
+        """
+        stacks = sorted(self._stacks.items(), key=lambda item: item[1], reverse=True)
+        return "".join(f"{stack} {count}\n" for stack, count in stacks)
+
+    def dump(self, path: str | os.PathLike) -> None:
+        """
+        Write the folded stacks to a file.
+
+        Args:
+            path (str | os.PathLike): Output file, e.g. 'Profiles/runner.folded'.
+        """
+        os.makedirs(os.path.dirname(os.fspath(path)) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.folded())
+
+
+def install_signal_handler(
+    logger,
+    duration: float = 30.0,
+    profile_dir: str = "Profiles",
+    signum: int | None = None,
+) -> int:
+    """
+    Profile the running process when it receives a signal.
+
+    On the signal, `duration` seconds of stacks are sampled and written to
+    <profile_dir>/flame_<date_time>.folded, and the stage table of `profiler` (if it
+    is enabled) is logged. Sampling runs on its own thread, so the process keeps
+    working meanwhile; a signal during a running capture is ignored.
+
+    Args:
+        logger: A logger instance for logging messages.
+        duration (float, optional): Seconds to sample for. Default is 30.0.
+        profile_dir (str, optional): Directory of the dumps. Default is "Profiles".
+        signum (int | None, optional): The signal. Defaults to SIGUSR1, or SIGBREAK
+            (Ctrl+Break) on Windows.
+
+    Returns:
+        int: The signal the handler was installed for.
+    """
+    if signum is None:
+        signum = getattr(signal, "SIGUSR1", None) or signal.SIGBREAK
+    busy = threading.Lock()
+
+    def capture() -> None:
+        try:
+            sampler = SamplingProfiler()
+            sampler.start()
+            time.sleep(duration)
+            sampler.stop()
+            path = os.path.join(
+                profile_dir, f"flame_{datetime.now():%Y-%m-%d_%H-%M-%S}.folded"
+            )
+            sampler.dump(path)
+            logger.info(f"Profile of {sampler.samples} samples written to {path}")
+            if profiler.enabled:
+                logger.info(f"Stage timings (ms):\n{profiler.report()}")
+        finally:
+            busy.release()
+
+    def handler(signum, frame) -> None:
+        if not busy.acquire(blocking=False):
+            return
+        threading.Thread(target=capture, name="profile-capture", daemon=True).start()
+
+    signal.signal(signum, handler)
+    return signum
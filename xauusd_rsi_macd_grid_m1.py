@@ -6,6 +6,8 @@ import talib
 import logging
 
 from datetime import datetime
+from metatrader.rate_buffer import RateBuffer
+from metatrader.trade_mirror import TradeMirror
 
 # 获取当前日期和时间，格式为 YYYYMMDD_HHMMSS，例如 "20250206_153045"
 date_time_str = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -36,6 +38,12 @@ def connect_mt4():
         mt5.shutdown()
         quit()
 
+    # 只有对冲账户的市价单结果能直接同步到镜像
+    account_info = mt5.account_info()
+    if account_info is not None:
+        trade_mirror.hedging = account_info.margin_mode == mt5.ACCOUNT_MARGIN_MODE_RETAIL_HEDGING
+    trade_mirror.invalidate()
+
     print("✅ MT4 连接成功！Login Successfully!")
     logging.info("MT4 Connected successfully! Login Successfully!")
 
@@ -47,29 +55,51 @@ stop_loss = 5.0  # 止损（单位：美元）
 max_grid_orders = 5  # 最大网格订单数
 lot_size = 0.01  # 交易手数
 timeframe = mt5.TIMEFRAME_M1
+rate_buffer = RateBuffer(1000)  # 最近 1000 根 M1 K 线，常驻内存
+trade_mirror = TradeMirror(mt5)  # 持仓和挂单的内存镜像，最多每 5 秒与终端对账一次
 
 # === 获取市场数据 ===
 def fetch_ohlcv():
-    rates = mt5.copy_rates_from_pos(symbol, timeframe, 0, 1000)  # 获取最近 1000 根 M1 K 线
-    df = pd.DataFrame(rates)
-    df["time"] = pd.to_datetime(df["time"], unit="s")
-    return df
+    # 只拉取缓存之后的新 K 线，返回环形缓冲区的只读视图（不复制）
+    rate_buffer.refresh(lambda count: mt5.copy_rates_from_pos(symbol, timeframe, 0, count))
+    return rate_buffer.view()
 
 # === 计算 RSI & MACD ===
-def get_indicators(df):
-    df["RSI"] = talib.RSI(df["close"], timeperiod=14)
-    df["MACD"], df["MACD_signal"], df['MACD_hist'] = talib.MACD(df["close"], fastperiod=12, slowperiod=26, signalperiod=9)
-    return df
+def get_indicators(rates):
+    close = rates["close"]
+    indicators = {"RSI": talib.RSI(close, timeperiod=14)}
+    indicators["MACD"], indicators["MACD_signal"], indicators['MACD_hist'] = talib.MACD(close, fastperiod=12, slowperiod=26, signalperiod=9)
+    return indicators
+
+# === 发送订单，并把结果同步到镜像 ===
+def send_order(request):
+    try:
+        result = mt5.order_send(request)
+    except Exception:
+        trade_mirror.invalidate()
+        raise
+    trade_mirror.apply(request, result)
+    return result
+
+# === 镜像到期时才向终端查询持仓和挂单 ===
+def sync_trades():
+    if not trade_mirror.due():
+        return True
+    applied = trade_mirror.applied
+    positions = mt5.positions_get()
+    orders = mt5.orders_get()
+    if positions is None or orders is None:
+        logging.error("Failed to retrieve positions or pending orders")
+        return False
+    drift = trade_mirror.reconcile(positions, orders, applied)
+    if drift:
+        logging.info(f"Trade mirror reconciled, {drift} changes picked up")
+    return True
 
 # === 获取当前订单数量 ===
 def count_orders(order_type):
-    count = 0
-    orders = mt5.orders_get(symbol=symbol)
-    if orders:
-        for order in orders:
-            if order.type == order_type:
-                count += 1
-    return count
+    sync_trades()
+    return trade_mirror.count_orders(symbol, order_type)
 
 
 def get_atr(symbol, timeframe, period=14):
@@ -157,7 +187,7 @@ def place_grid_orders(direction):
             "type_filling": mt5.ORDER_FILLING_IOC
         }
         
-        result = mt5.order_send(request)
+        result = send_order(request)
         if result is None:
             print("订单发送失败，返回结果为 None")
             logging.error("The order failed to be sent, and the return result is None. Request details: %s", request)
@@ -179,26 +209,24 @@ def place_grid_orders(direction):
 
 def remove_orders(order_type):
     """ 删除指定类型的挂单(Buy Limit / Sell Limit)"""
-    pending_orders = mt5.orders_get()
-    if pending_orders is None:
+    if not sync_trades():
         print("⚠️ 无法获取挂单信息")
         logging.error("Failed to retrieve pending orders")
         return
 
-    for order in pending_orders:
-        if order.type == order_type:
-            request = {
-                "action": mt5.TRADE_ACTION_REMOVE,
-                "order": order.ticket,
-            }
-            result = mt5.order_send(request)
+    for order in trade_mirror.select_orders(type_=order_type):
+        request = {
+            "action": mt5.TRADE_ACTION_REMOVE,
+            "order": order.ticket,
+        }
+        result = send_order(request)
 
-            if result.retcode == mt5.TRADE_RETCODE_DONE:
-                print(f"✅ 成功删除 {order_type} 订单 {order.ticket}")
-                logging.info(f"Successfully removed {order_type} order {order.ticket}")
-            else:
-                print(f"⚠️ 删除 {order_type} 订单 {order.ticket} 失败，错误代码：{result.retcode}")
-                logging.error(f"Failed to remove {order_type} order {order.ticket}, error code: {result.retcode}")
+        if result.retcode == mt5.TRADE_RETCODE_DONE:
+            print(f"✅ 成功删除 {order_type} 订单 {order.ticket}")
+            logging.info(f"Successfully removed {order_type} order {order.ticket}")
+        else:
+            print(f"⚠️ 删除 {order_type} 订单 {order.ticket} 失败，错误代码：{result.retcode}")
+            logging.error(f"Failed to remove {order_type} order {order.ticket}, error code: {result.retcode}")
 
 
 
@@ -221,7 +249,7 @@ def place_one_order(direction):
         "type_filling": mt5.ORDER_FILLING_IOC
     }
         
-    result = mt5.order_send(request)
+    result = send_order(request)
     if result is None:
         print("订单发送失败，返回结果为 None")
         logging.error("The order failed to be sent, and the return result is None. Request details: %s", request)
@@ -235,11 +263,10 @@ def place_one_order(direction):
 
 def has_active_orders():
     """ 检查是否有进行中的订单（持仓） """
-    positions = mt5.positions_get()
-    if positions is None:
+    if not sync_trades():
         print("获取持仓失败")
         return False
-    return len(positions) > 0
+    return trade_mirror.count_positions() > 0
 
 
 
@@ -252,13 +279,13 @@ def main():
         print(f"Account Balance: {account_info.balance}")
         logging.info(f"Account Balance: {account_info.balance}")
 
-        df = fetch_ohlcv()      # 获取最新市场数据（假设该函数已定义）
-        df = get_indicators(df)   # 计算 RSI & MACD（假设该函数已定义）
+        rates = fetch_ohlcv()      # 获取最新市场数据（假设该函数已定义）
+        indicators = get_indicators(rates)   # 计算 RSI & MACD（假设该函数已定义）
 
-        rsi_value    = df["RSI"].iloc[-1]
-        macd_main    = df["MACD"].iloc[-1]
-        macd_signal  = df["MACD_signal"].iloc[-1]
-        macd_hist    = df['MACD_hist'].iloc[-1]
+        rsi_value    = indicators["RSI"][-1]
+        macd_main    = indicators["MACD"][-1]
+        macd_signal  = indicators["MACD_signal"][-1]
+        macd_hist    = indicators['MACD_hist'][-1]
 
 
         indicator_msg = (f"RSI: {rsi_value:.2f}, MACD: {macd_main:.2f}, "